@@ -0,0 +1 @@
+"""Benchmarks for the Rooted Toon integration."""
@@ -0,0 +1,41 @@
+"""Compare two benchmark result files.
+
+Usage: python -m benchmarks.compare baseline.json candidate.json
+"""
+from __future__ import annotations
+
+import json
+from pathlib import Path
+import sys
+
+
+def main() -> int:
+    """Print the relative change of the setup and import times and every summary statistic."""
+    if len(sys.argv) != 3:
+        sys.stderr.write(__doc__)
+        return 2
+
+    baseline_results, candidate_results = (
+        json.loads(Path(path).read_text()) for path in sys.argv[1:]
+    )
+    for section in ("setup", "import"):
+        for stage, value in candidate_results.get(section, {}).items():
+            before = baseline_results.get(section, {}).get(stage)
+            if before:
+                change = (value - before) / before * 100
+                print(f"{section:>14} {stage:>5}: {before:12.6f} -> {value:12.6f} ({change:+.1f}%)")
+
+    baseline, candidate = baseline_results["summary"], candidate_results["summary"]
+    for metric, stats in candidate.items():
+        for stat, value in stats.items():
+            before = baseline.get(metric, {}).get(stat)
+            if before is None:
+                continue
+            change = (value - before) / before * 100 if before else 0.0
+            print(f"{metric:>14} {stat:>5}: {before:12.6f} -> {value:12.6f} ({change:+.1f}%)")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,178 @@
+"""Local stand-in for the MQTT broker a rooted Toon bridge publishes to.
+
+Implements just enough of MQTT 3.1.1 for the Home Assistant MQTT client:
+connect, subscribe, unsubscribe, ping and QoS 0/1 publishes.
+"""
+from __future__ import annotations
+
+import asyncio
+from collections import Counter
+import struct
+import threading
+
+CONNECT = 1
+PUBLISH = 3
+PUBREL = 6
+SUBSCRIBE = 8
+UNSUBSCRIBE = 10
+PINGREQ = 12
+DISCONNECT = 14
+
+
+def _topic_matches(topic_filter: str, topic: str) -> bool:
+    """Return if a topic matches a subscription filter with + and # wildcards."""
+    filter_levels = topic_filter.split("/")
+    topic_levels = topic.split("/")
+    for index, level in enumerate(filter_levels):
+        if level == "#":
+            return True
+        if index >= len(topic_levels) or level not in ("+", topic_levels[index]):
+            return False
+    return len(filter_levels) == len(topic_levels)
+
+
+def _packet(packet_type: int, flags: int, body: bytes) -> bytes:
+    """Return a packet with its fixed header."""
+    header = bytearray([packet_type << 4 | flags])
+    length = len(body)
+    while True:
+        byte, length = length % 128, length // 128
+        header.append(byte | (0x80 if length else 0))
+        if not length:
+            break
+    return bytes(header) + body
+
+
+def _string(data: bytes, offset: int) -> tuple[str, int]:
+    """Return a length prefixed string and the offset after it."""
+    (length,) = struct.unpack_from("!H", data, offset)
+    offset += 2
+    return data[offset : offset + length].decode(), offset + length
+
+
+class FakeBroker:
+    """Relay MQTT publishes between local clients from a server in its own thread."""
+
+    def __init__(self) -> None:
+        """Initialize the fake broker."""
+        self.packets: Counter[str] = Counter()
+        self.delivered = 0
+        self.port: int | None = None
+
+        self._subscriptions: dict[asyncio.StreamWriter, set[str]] = {}
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._server: asyncio.AbstractServer | None = None
+        self._thread: threading.Thread | None = None
+        self._ready = threading.Event()
+
+    def start(self) -> int:
+        """Start the broker and return the port it listens on."""
+        self._thread = threading.Thread(
+            target=self._run, name="fake-broker", daemon=True
+        )
+        self._thread.start()
+        self._ready.wait()
+        assert self.port is not None
+        return self.port
+
+    def stop(self) -> None:
+        """Stop the broker."""
+        if self._loop is None or self._server is None:
+            return
+        self._loop.call_soon_threadsafe(self._server.close)
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        if self._thread is not None:
+            self._thread.join()
+
+    def publish(self, topic: str, payload: str) -> None:
+        """Publish a message to the subscribed clients, like the Toon bridge would."""
+        assert self._loop is not None
+        self._loop.call_soon_threadsafe(self._deliver, topic, payload.encode())
+
+    def _run(self) -> None:
+        """Run the event loop of the broker thread."""
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+        self._server = self._loop.run_until_complete(
+            asyncio.start_server(self._handle_client, "127.0.0.1", 0)
+        )
+        self.port = self._server.sockets[0].getsockname()[1]
+        self._ready.set()
+        self._loop.run_forever()
+        self._loop.close()
+
+    def _deliver(self, topic: str, payload: bytes) -> None:
+        """Send a QoS 0 publish to every client with a matching subscription."""
+        topic_bytes = topic.encode()
+        packet = _packet(
+            PUBLISH, 0, struct.pack("!H", len(topic_bytes)) + topic_bytes + payload
+        )
+        for writer, filters in self._subscriptions.items():
+            if any(_topic_matches(topic_filter, topic) for topic_filter in filters):
+                writer.write(packet)
+                self.delivered += 1
+
+    async def _handle_client(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Answer the packets of a single client until it disconnects."""
+        self._subscriptions[writer] = set()
+        try:
+            while True:
+                first = await reader.readexactly(1)
+                length, multiplier = 0, 1
+                while True:
+                    (byte,) = await reader.readexactly(1)
+                    length += (byte & 0x7F) * multiplier
+                    multiplier *= 128
+                    if not byte & 0x80:
+                        break
+                body = await reader.readexactly(length)
+                if not self._handle_packet(writer, first[0] >> 4, first[0] & 0x0F, body):
+                    break
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            del self._subscriptions[writer]
+            writer.close()
+
+    def _handle_packet(
+        self, writer: asyncio.StreamWriter, packet_type: int, flags: int, body: bytes
+    ) -> bool:
+        """Answer a packet and return if the connection stays open."""
+        if packet_type == CONNECT:
+            self.packets["connect"] += 1
+            writer.write(_packet(2, 0, b"\x00\x00"))
+        elif packet_type == PUBLISH:
+            self.packets["publish"] += 1
+            topic, offset = _string(body, 0)
+            qos = flags >> 1 & 0x03
+            if qos:
+                packet_id = body[offset : offset + 2]
+                offset += 2
+                # QoS 2 is acknowledged like QoS 1 is, followed by a PUBCOMP.
+                writer.write(_packet(4 if qos == 1 else 5, 0, packet_id))
+            self._deliver(topic, body[offset:])
+        elif packet_type == PUBREL:
+            writer.write(_packet(7, 0, body[:2]))
+        elif packet_type == SUBSCRIBE:
+            self.packets["subscribe"] += 1
+            offset, granted = 2, bytearray()
+            while offset < len(body):
+                topic_filter, offset = _string(body, offset)
+                offset += 1
+                self._subscriptions[writer].add(topic_filter)
+                granted.append(0)
+            writer.write(_packet(9, 0, body[:2] + bytes(granted)))
+        elif packet_type == UNSUBSCRIBE:
+            offset = 2
+            while offset < len(body):
+                topic_filter, offset = _string(body, offset)
+                self._subscriptions[writer].discard(topic_filter)
+            writer.write(_packet(11, 0, body[:2]))
+        elif packet_type == PINGREQ:
+            writer.write(_packet(13, 0, b""))
+        elif packet_type == DISCONNECT:
+            return False
+        return True
@@ -0,0 +1,243 @@
+"""Local stand-in for the HTTP endpoints of a rooted Toon."""
+from __future__ import annotations
+
+import asyncio
+from collections import Counter
+from dataclasses import dataclass
+import json
+import math
+import random
+import threading
+import time
+from typing import Any
+
+from aiohttp import web
+
+ENDPOINT_BOILER = "boiler"
+ENDPOINT_P1_METER = "p1_meter"
+ENDPOINT_PROGRAM = "program"
+ENDPOINT_THERMOSTAT = "thermostat"
+ENDPOINT_WRITE = "write"
+
+WRITE_ACTIONS = {"setSetpoint", "changeSchemeState"}
+PROGRAM_ACTIONS = {"getWeeklyList"}
+
+
+@dataclass
+class FakeToonSettings:
+    """Describes the behaviour of the fake Toon."""
+
+    latency: float = 0.05
+    latency_jitter: float = 0.02
+    payload_size: int = 0
+    error_rate: float = 0.0
+    seed: int = 0
+
+
+class FakeToon:
+    """Serve rooted Toon responses from a local aiohttp server in its own thread."""
+
+    def __init__(self, settings: FakeToonSettings) -> None:
+        """Initialize the fake Toon."""
+        self.settings = settings
+        self.requests: Counter[str] = Counter()
+        self.errors: Counter[str] = Counter()
+        self.bytes_sent = 0
+        self.port: int | None = None
+
+        self._random = random.Random(settings.seed)
+        self._started = time.time()
+        self._setpoint = 2000
+        self._active_state = 1
+        self._program_state = 1
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._runner: web.AppRunner | None = None
+        self._thread: threading.Thread | None = None
+        self._ready = threading.Event()
+
+    def start(self) -> int:
+        """Start the server and return the port it listens on."""
+        self._thread = threading.Thread(target=self._run, name="fake-toon", daemon=True)
+        self._thread.start()
+        self._ready.wait()
+        assert self.port is not None
+        return self.port
+
+    def stop(self) -> None:
+        """Stop the server."""
+        if self._loop is None or self._runner is None:
+            return
+        asyncio.run_coroutine_threadsafe(self._runner.cleanup(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        if self._thread is not None:
+            self._thread.join()
+
+    def _run(self) -> None:
+        """Run the event loop of the server thread."""
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_until_complete(self._async_start())
+        self._ready.set()
+        self._loop.run_forever()
+        self._loop.close()
+
+    async def _async_start(self) -> None:
+        """Start the aiohttp application on a free port."""
+        app = web.Application()
+        app.router.add_get("/{path:.*}", self._handle)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        await site.start()
+        self.port = self._runner.addresses[0][1]
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        """Answer a request like a rooted Toon would."""
+        endpoint, payload = self._route(request)
+        self.requests[endpoint] += 1
+
+        settings = self.settings
+        await asyncio.sleep(
+            max(
+                settings.latency
+                + self._random.uniform(-1, 1) * settings.latency_jitter,
+                0,
+            )
+        )
+        if self._random.random() < settings.error_rate:
+            self.errors[endpoint] += 1
+            return web.Response(status=500, text="Internal Server Error")
+
+        if settings.payload_size and isinstance(payload, dict):
+            padding = settings.payload_size - len(json.dumps(payload))
+            if padding > 0:
+                payload["padding"] = "x" * padding
+
+        body = json.dumps(payload)
+        self.bytes_sent += len(body)
+        return web.Response(text=body, content_type="application/json")
+
+    def _route(self, request: web.Request) -> tuple[str, Any]:
+        """Return the endpoint a request is for and its response payload."""
+        path = request.path
+        action = request.query.get("action", "")
+
+        if path.startswith("/boilerstatus"):
+            return ENDPOINT_BOILER, self._boiler()
+        if path.startswith("/hdrv_zwave"):
+            return ENDPOINT_P1_METER, self._p1_meter()
+        if path.startswith("/hcb_config") or action in PROGRAM_ACTIONS:
+            return ENDPOINT_PROGRAM, self._program()
+        if action in WRITE_ACTIONS:
+            return ENDPOINT_WRITE, self._write(request)
+        return ENDPOINT_THERMOSTAT, self._thermostat()
+
+    def _elapsed(self) -> float:
+        """Return the number of seconds since the server started."""
+        return time.time() - self._started
+
+    def _burning(self) -> bool:
+        """Return if the simulated boiler is burning."""
+        return math.sin(self._elapsed() / 60) > 0
+
+    def _thermostat(self) -> dict[str, Any]:
+        """Return the getThermostatInfo response."""
+        burning = self._burning()
+        return {
+            "result": "ok",
+            "currentTemp": str(1950 + self._random.randint(0, 100)),
+            "currentSetpoint": str(self._setpoint),
+            "currentDisplayTemp": str(1950 + self._random.randint(0, 100)),
+            "programState": str(self._program_state),
+            "activeState": str(self._active_state),
+            "nextProgram": "1",
+            "nextState": "2",
+            "nextTime": str(int(time.time()) + 3600),
+            "nextSetpoint": "1800",
+            "errorFound": "255",
+            "boilerModuleConnected": "1",
+            "realSetpoint": str(self._setpoint),
+            "burnerInfo": "1" if burning else "0",
+            "otCommError": "0",
+            "currentModulationLevel": str(
+                self._random.randint(10, 100) if burning else 0
+            ),
+            "haveOTBoiler": "1",
+        }
+
+    def _p1_meter(self) -> dict[str, Any]:
+        """Return the getDevices.json response."""
+        elapsed = self._elapsed()
+
+        def meter(kind: str, flow: float, quantity: float) -> dict[str, str]:
+            return {
+                "type": kind,
+                "CurrentElectricityFlow": f"{flow:.2f}",
+                "CurrentElectricityQuantity": f"{quantity:.2f}",
+            }
+
+        delivery = 300 + self._random.uniform(0, 1500)
+        return {
+            "dev_2": {"type": "HAE_METER_v3", "location": "(null)"},
+            "dev_2.1": {
+                "type": "gas",
+                "CurrentGasFlow": "0",
+                "CurrentGasQuantity": f"{1234567 + elapsed * 0.1:.2f}",
+            },
+            "dev_2.2": meter("elec", delivery, 2345678 + elapsed * 0.3),
+            "dev_2.3": meter("elec_solar", 0, 0),
+            "dev_2.4": meter("elec_delivered_nt", delivery, 1234567 + elapsed * 0.3),
+            "dev_2.5": meter("elec_received_nt", 0, 123456),
+            "dev_2.6": meter("elec_delivered_lt", 0, 1111111),
+            "dev_2.7": meter("elec_received_lt", 0, 654321),
+            "dev_4": {
+                "type": "FGWP011",
+                "name": "Plug",
+                "IsConnected": "1",
+                "TargetStatus": "1",
+                "CurrentElectricityFlow": f"{self._random.uniform(0, 100):.2f}",
+                "CurrentElectricityQuantity": f"{1000 + elapsed * 0.01:.2f}",
+            },
+        }
+
+    def _boiler(self) -> dict[str, Any]:
+        """Return the boilervalues.txt response."""
+        return {
+            "sampleTime": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "boilerSetpoint": self._setpoint / 100,
+            "roomTemp": 20.3,
+            "roomTempSetpoint": self._setpoint / 100,
+            "boilerPressure": round(1.5 + self._random.uniform(0, 0.1), 2),
+            "boilerOutTemp": 45.0 if self._burning() else 30.0,
+            "boilerInTemp": 35.0,
+            "boilerModulationLevel": 30 if self._burning() else 0,
+        }
+
+    def _program(self) -> dict[str, Any]:
+        """Return the weekly program response."""
+        blocks = []
+        for day in range(7):
+            for start, end, state in ((0, 7, 2), (7, 9, 1), (9, 17, 3), (17, 23, 0)):
+                blocks.append(
+                    {
+                        "startDayOfWeek": day,
+                        "startHour": start,
+                        "startMin": 0,
+                        "endDayOfWeek": day if end < 24 else (day + 1) % 7,
+                        "endHour": end,
+                        "endMin": 0,
+                        "targetState": state,
+                    }
+                )
+        return {"result": "ok", "programs": blocks}
+
+    def _write(self, request: web.Request) -> dict[str, Any]:
+        """Apply a thermostat command."""
+        query = request.query
+        if "Setpoint" in query:
+            self._setpoint = int(query["Setpoint"])
+        if "state" in query:
+            self._program_state = int(query["state"])
+        if "temperatureState" in query:
+            self._active_state = int(query["temperatureState"])
+        return {"result": "ok"}
@@ -0,0 +1,344 @@
+"""Drive the Rooted Toon integration against a fake Toon and record timings.
+
+Usage: python -m benchmarks.run [--cycles 200] [--entries 1] [--latency 0.05] [--push] [--output out.json]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+from pathlib import Path
+import statistics
+import subprocess
+import sys
+import tempfile
+from time import monotonic, perf_counter, thread_time
+from typing import Any
+
+from homeassistant import bootstrap
+from homeassistant.const import (
+    CONF_HOST,
+    CONF_NAME,
+    CONF_PORT,
+    EVENT_STATE_CHANGED,
+)
+from homeassistant.core import Event, HomeAssistant
+from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.entity_platform import async_get_platforms
+
+from .fake_broker import FakeBroker
+from .fake_toon import FakeToon, FakeToonSettings
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+DOMAIN = "rootedtoon"
+
+# Modules of the integration in the order Home Assistant imports them.
+IMPORT_MODULES = (
+    "config_flow",
+    "",
+    "binary_sensor",
+    "calendar",
+    "climate",
+    "sensor",
+    "diagnostics",
+)
+
+# Values the bridge pushes every cycle in push mode, relative to the Toon topic.
+PUSH_TOPICS = (
+    "thermostat/current_display_temperature",
+    "thermostat/current_modulation_level",
+    "p1_meter/electricity_meter/electricity_delivery",
+    "boiler/pressure",
+)
+
+# Imports every module in a fresh interpreter, after the parts of Home
+# Assistant that are always loaded, and prints the cumulative import times.
+IMPORT_SCRIPT = """
+import importlib, json, sys
+from time import perf_counter
+import homeassistant.core, homeassistant.helpers.entity_platform
+import homeassistant.helpers.update_coordinator
+times = {}
+for module in sys.argv[1:]:
+    start = perf_counter()
+    importlib.import_module(".".join(filter(None, ("custom_components.%s", module))))
+    times[module or "integration"] = perf_counter() - start
+print(json.dumps(times))
+"""
+
+
+def _summary(values: list[float]) -> dict[str, float]:
+    """Return summary statistics of a series of samples."""
+    if not values:
+        return {}
+    ordered = sorted(values)
+    return {
+        "mean": statistics.fmean(ordered),
+        "p50": ordered[len(ordered) // 2],
+        "p95": ordered[min(int(len(ordered) * 0.95), len(ordered) - 1)],
+        "max": ordered[-1],
+        "total": sum(ordered),
+    }
+
+
+def _read_attributes(entities: list[Entity]) -> None:
+    """Read the attributes Home Assistant reads when writing entity states."""
+    for entity in entities:
+        entity.state  # noqa: B018
+        entity.name  # noqa: B018
+        entity.unique_id  # noqa: B018
+        entity.device_info  # noqa: B018
+
+
+def _measure_imports() -> dict[str, float]:
+    """Return the time it takes to import each module of the integration."""
+    result = subprocess.run(
+        [sys.executable, "-c", IMPORT_SCRIPT % DOMAIN, *IMPORT_MODULES],
+        capture_output=True,
+        check=True,
+        cwd=REPO_ROOT,
+        text=True,
+    )
+    return json.loads(result.stdout)
+
+
+async def _async_setup_mqtt(hass: HomeAssistant, port: int) -> None:
+    """Set up the MQTT integration against the fake broker."""
+    result = await hass.config_entries.flow.async_init(
+        "mqtt", context={"source": "user"}
+    )
+    if result["type"] == "form":
+        await hass.config_entries.flow.async_configure(
+            result["flow_id"], {"broker": "127.0.0.1", "port": port}
+        )
+    await hass.async_block_till_done()
+
+
+async def _async_wait_for_push(coordinators: list[Any], messages: list[int]) -> None:
+    """Wait until every coordinator handled and flushed the pushed messages."""
+    while any(
+        coordinator.push.messages + coordinator.push.ignored < expected
+        or coordinator._unsub_push_flush
+        for coordinator, expected in zip(coordinators, messages)
+    ):
+        await asyncio.sleep(0.001)
+
+
+async def _async_setup_hass(config_dir: str) -> HomeAssistant:
+    """Start a bare Home Assistant instance that can load the integration."""
+    custom_components = Path(config_dir, "custom_components")
+    custom_components.mkdir()
+    (custom_components / DOMAIN).symlink_to(REPO_ROOT / "custom_components" / DOMAIN)
+
+    try:
+        hass = HomeAssistant(config_dir)  # type: ignore[call-arg]
+    except TypeError:
+        hass = HomeAssistant()
+        hass.config.config_dir = config_dir
+    hass.config.skip_pip = True
+
+    await bootstrap.async_from_config_dict({"homeassistant": {}}, hass)
+    return hass
+
+
+async def async_run(args: argparse.Namespace) -> dict[str, Any]:
+    """Run the benchmark and return the results."""
+    toon = FakeToon(
+        FakeToonSettings(
+            latency=args.latency,
+            latency_jitter=args.latency_jitter,
+            payload_size=args.payload_size,
+            error_rate=args.error_rate,
+            seed=args.seed,
+        )
+    )
+    port = toon.start()
+    broker = FakeBroker() if args.push else None
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        setup_start = perf_counter()
+        hass = await _async_setup_hass(config_dir)
+
+        state_writes = 0
+
+        def _count_state_write(_event: Event) -> None:
+            nonlocal state_writes
+            state_writes += 1
+
+        hass.bus.async_listen(EVENT_STATE_CHANGED, _count_state_write)
+        if broker is not None:
+            await _async_setup_mqtt(hass, broker.start())
+
+        entry_setup_start = perf_counter()
+        coordinators = []
+        for index in range(args.entries):
+            result = await hass.config_entries.flow.async_init(
+                DOMAIN,
+                context={"source": "user"},
+                data={
+                    CONF_NAME: f"Toon {index}" if index else "Toon",
+                    CONF_HOST: "127.0.0.1",
+                    CONF_PORT: port,
+                    "conf_enable_boiler": True,
+                    "scan_interval_boiler": args.scan_interval,
+                    "boiler_prefix": "",
+                    "boiler_suffix": "",
+                    "conf_enable_p1_meter": True,
+                    "scan_interval_p1_meter": args.scan_interval,
+                    "p1_meter_prefix": "",
+                    "p1_meter_suffix": "",
+                    "conf_enable_program": not args.disable_program,
+                    "scan_interval_program": args.scan_interval,
+                    "scan_interval_thermostat": args.scan_interval,
+                    "thermostat_prefix": "",
+                    "thermostat_suffix": "",
+                    "conf_concurrent_updates": args.concurrent,
+                    "max_concurrent_updates": args.max_concurrent,
+                    "rate_limit": args.rate_limit,
+                    "conf_push_mode": args.push,
+                    "mqtt_topic": f"toon/{index}",
+                },
+            )
+            await hass.async_block_till_done()
+            coordinators.append(hass.data[DOMAIN][result["result"].entry_id])
+        entry_setup_time = perf_counter() - entry_setup_start
+
+        entities = [
+            entity
+            for platform in async_get_platforms(hass, DOMAIN)
+            for entity in platform.entities.values()
+        ]
+
+        ticks: list[dict[str, float]] = []
+        for cycle in range(args.cycles):
+            requests_before = sum(toon.requests.values())
+            writes_before = state_writes
+            cpu_before = thread_time()
+            start = perf_counter()
+
+            if broker is not None:
+                # Push new values through the broker instead of polling.
+                messages = []
+                for coordinator in coordinators:
+                    for topic in PUSH_TOPICS:
+                        broker.publish(
+                            f"{coordinator.push.topic}/{topic}", str(cycle % 50 + 1)
+                        )
+                    messages.append(
+                        coordinator.push.messages
+                        + coordinator.push.ignored
+                        + len(PUSH_TOPICS)
+                    )
+                await _async_wait_for_push(coordinators, messages)
+            else:
+                # Make every endpoint due, so each cycle polls the whole Toon.
+                for coordinator in coordinators:
+                    for endpoint in coordinator.endpoints.values():
+                        coordinator.scheduler.schedule(endpoint, monotonic())
+                await asyncio.gather(
+                    *(coordinator.async_refresh() for coordinator in coordinators)
+                )
+            await hass.async_block_till_done()
+
+            latency = perf_counter() - start
+            loop_time = thread_time() - cpu_before
+            attributes_start = perf_counter()
+            _read_attributes(entities)
+
+            ticks.append(
+                {
+                    "latency": latency,
+                    "loop_time": loop_time,
+                    "attribute_time": perf_counter() - attributes_start,
+                    "requests": sum(toon.requests.values()) - requests_before,
+                    "state_writes": state_writes - writes_before,
+                }
+            )
+
+        await hass.async_stop()
+        toon.stop()
+        if broker is not None:
+            broker.stop()
+
+    results: dict[str, Any] = {
+        "version": json.loads(
+            (REPO_ROOT / "custom_components" / DOMAIN / "manifest.json").read_text()
+        )["version"],
+        "settings": vars(args),
+        "setup": {
+            "hass": entry_setup_start - setup_start,
+            "entry": entry_setup_time,
+        },
+        "import": _measure_imports(),
+        "entities": len(entities),
+        "summary": {
+            key: _summary([tick[key] for tick in ticks])
+            for key in (
+                "latency",
+                "loop_time",
+                "attribute_time",
+                "requests",
+                "state_writes",
+            )
+        },
+        "deadband": {
+            "written": sum(
+                coordinator.deadband.written for coordinator in coordinators
+            ),
+            "suppressed": sum(
+                coordinator.deadband.suppressed for coordinator in coordinators
+            ),
+        },
+        "server": {
+            "requests": dict(toon.requests),
+            "errors": dict(toon.errors),
+            "bytes_sent": toon.bytes_sent,
+        },
+        "broker": (
+            {"packets": dict(broker.packets), "delivered": broker.delivered}
+            if broker is not None
+            else None
+        ),
+    }
+    if args.per_tick:
+        results["ticks"] = ticks
+
+    return results
+
+
+def main() -> int:
+    """Parse the arguments, run the benchmark and write the results."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cycles", type=int, default=200)
+    parser.add_argument("--entries", type=int, default=1)
+    parser.add_argument("--scan-interval", type=int, default=10)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--latency-jitter", type=float, default=0.02)
+    parser.add_argument("--payload-size", type=int, default=0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--disable-program", action="store_true")
+    parser.add_argument("--push", action="store_true")
+    parser.add_argument("--concurrent", action="store_true")
+    parser.add_argument("--max-concurrent", type=int, default=2)
+    parser.add_argument("--rate-limit", type=float, default=1000.0)
+    parser.add_argument("--per-tick", action="store_true")
+    parser.add_argument("--output", help="write the JSON results to this file")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    results = asyncio.run(async_run(args))
+
+    output = json.dumps(results, indent=2, default=str)
+    if args.output:
+        Path(args.output).write_text(output + os.linesep)
+    else:
+        sys.stdout.write(output + os.linesep)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
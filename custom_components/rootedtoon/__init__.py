@@ -2,12 +2,19 @@
 import voluptuous as vol
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_NAME, Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.const import CONF_NAME, EVENT_HOMEASSISTANT_STOP, Platform
+from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.helpers import config_validation as cv, device_registry as dr
 
-from .const import CONF_ENABLE_P1_METER, DEVICE_P1_METER, DOMAIN, ENECO
-from .coordinator import RootedToonDataUpdateCoordinator
+from .const import (
+    CONF_ENABLE_P1_METER,
+    CONF_ENABLE_PROGRAM,
+    DATA_ORCHESTRATOR,
+    DEVICE_P1_METER,
+    DOMAIN,
+    ENECO,
+    MAX_CONCURRENT_REQUESTS,
+)
 
 PLATFORMS = [
     Platform.BINARY_SENSOR,
@@ -17,11 +24,39 @@ PLATFORMS = [
 ]
 
 
+def _platforms(entry: ConfigEntry) -> list[Platform]:
+    """Return the platforms with entities for the enabled endpoints."""
+    # The calendar platform (and its component) is only set up for the program.
+    return [
+        platform
+        for platform in PLATFORMS
+        if platform != Platform.CALENDAR or entry.data.get(CONF_ENABLE_PROGRAM)
+    ]
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Toon from a config entry."""
-    coordinator = RootedToonDataUpdateCoordinator(hass, entry=entry)
+    # Import the Toon API only once a Toon is set up, not to load the config flow.
+    from .coordinator import (  # pylint: disable=import-outside-toplevel
+        RootedToonDataUpdateCoordinator,
+    )
+    from .orchestrator import (  # pylint: disable=import-outside-toplevel
+        PollingOrchestrator,
+    )
 
-    await coordinator.async_config_entry_first_refresh()
+    # All Toons share one orchestrator, which spreads their polls over time.
+    if (orchestrator := hass.data.get(DATA_ORCHESTRATOR)) is None:
+        orchestrator = hass.data[DATA_ORCHESTRATOR] = PollingOrchestrator(
+            MAX_CONCURRENT_REQUESTS
+        )
+    coordinator = RootedToonDataUpdateCoordinator(
+        hass, entry=entry, orchestrator=orchestrator
+    )
+
+    # Set up from the last stored data if there is any, and refresh it later.
+    restored = await coordinator.async_restore()
+    if not restored:
+        await coordinator.async_config_entry_first_refresh()
 
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = coordinator
@@ -58,7 +93,33 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         )
 
     # Spin up the platforms
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    await hass.config_entries.async_forward_entry_setups(entry, _platforms(entry))
+
+    if restored:
+        entry.async_create_task(hass, coordinator.async_refresh())
+
+    # Subscribe before the polls are spread, pushed endpoints are polled slowly.
+    await coordinator.async_start_push()
+    orchestrator.async_register(coordinator)
+
+    if coordinator.backfill is not None:
+        # A multi-year import takes a while, it runs without blocking startup.
+        backfill = hass.async_create_background_task(
+            coordinator.backfill.async_run(), f"{DOMAIN} statistics backfill"
+        )
+        entry.async_on_unload(backfill.cancel)
+    entry.async_on_unload(lambda: orchestrator.async_unregister(coordinator))
+
+    @callback
+    def _async_save_snapshot(_event: Event) -> None:
+        """Save the last data before Home Assistant stops."""
+        coordinator.snapshot_store.async_flush(coordinator.toon._devices)
+
+    # The snapshot is saved on an interval, save the latest data on the way out.
+    entry.async_on_unload(
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_save_snapshot)
+    )
+    entry.async_on_unload(coordinator.async_shutdown)
 
     return True
 
@@ -67,10 +128,19 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload Toon config entry."""
 
     # Unload entities for this entry/device.
-    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    unload_ok = await hass.config_entries.async_unload_platforms(
+        entry, _platforms(entry)
+    )
 
     # Cleanup
     if unload_ok:
         del hass.data[DOMAIN][entry.entry_id]
 
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the stored data of a removed Toon config entry."""
+    from .persist import ToonSnapshotStore  # pylint: disable=import-outside-toplevel
+
+    await ToonSnapshotStore(hass, entry.entry_id).async_remove()
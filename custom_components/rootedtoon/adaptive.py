@@ -0,0 +1,54 @@
+"""Adaptive polling intervals for the Toon endpoints."""
+from __future__ import annotations
+
+from typing import Any
+
+from .const import ENDPOINT_THERMOSTAT
+from .scheduler import ToonEndpoint
+
+LATENCY_SMOOTHING = 0.2
+BASELINE_SMOOTHING = 0.02
+SLOW_RESPONSE_FACTOR = 1.5
+
+BACKOFF_FACTOR = 1.5
+SPEEDUP_FACTOR = 0.75
+RELAX_FACTOR = 0.25
+
+
+class AdaptivePolling:
+    """Adapt endpoint intervals to the Toon latency and boiler activity."""
+
+    def __init__(self) -> None:
+        """Initialize the adaptive polling state."""
+        self._modulation: Any = None
+
+    def adapt(
+        self, endpoint: ToonEndpoint, duration: float, failed: bool, devices: Any
+    ) -> float:
+        """Return the next interval of an endpoint after a request."""
+        if not failed:
+            if endpoint.latency is None:
+                endpoint.latency = endpoint.baseline_latency = duration
+            endpoint.latency += (duration - endpoint.latency) * LATENCY_SMOOTHING
+            endpoint.baseline_latency += (
+                duration - endpoint.baseline_latency
+            ) * BASELINE_SMOOTHING
+
+        interval = endpoint.interval
+        if failed or endpoint.latency > endpoint.baseline_latency * SLOW_RESPONSE_FACTOR:
+            interval *= BACKOFF_FACTOR
+        elif endpoint.name == ENDPOINT_THERMOSTAT and self._boiler_active(devices):
+            interval *= SPEEDUP_FACTOR
+        else:
+            interval += (endpoint.base_interval - interval) * RELAX_FACTOR
+
+        return min(max(interval, endpoint.min_interval), endpoint.max_interval)
+
+    def _boiler_active(self, devices: Any) -> bool:
+        """Return if the boiler is burning and its modulation is changing."""
+        thermostat = devices.thermostat
+        modulation = thermostat.current_modulation_level
+        changed = modulation != self._modulation
+        self._modulation = modulation
+
+        return bool(thermostat.heating or thermostat.burner) and changed
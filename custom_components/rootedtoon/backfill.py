@@ -0,0 +1,330 @@
+"""Backfill of long-term statistics from the history kept on the Toon."""
+from __future__ import annotations
+
+from collections.abc import AsyncIterator, Iterable
+from dataclasses import dataclass
+from datetime import datetime
+import logging
+import math
+import re
+from typing import TYPE_CHECKING
+
+from aiohttp import ClientError
+
+from homeassistant.components.recorder import DOMAIN as RECORDER_DOMAIN, get_instance
+from homeassistant.components.recorder.models import StatisticData, StatisticMetaData
+from homeassistant.components.recorder.statistics import (
+    async_import_statistics,
+    get_last_statistics,
+)
+from homeassistant.const import (
+    CONF_HOST,
+    CONF_PORT,
+    Platform,
+    UnitOfEnergy,
+    UnitOfTemperature,
+    UnitOfVolume,
+)
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.entity import EntityDescription
+from homeassistant.util import dt as dt_util
+
+from .breaker import CircuitOpenError
+from .const import CONF_ENABLE_P1_METER, DEVICE_P1_METER, DEVICE_THERMOSTAT, DOMAIN
+
+if TYPE_CHECKING:
+    from .coordinator import RootedToonDataUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+HOUR = 3600
+# The recorder compiles the statistics of an hour a few seconds after it ends.
+COMPILE_MARGIN = 300
+IMPORT_BATCH = 720
+PAGE_SIZE = 65536
+
+# A "timestamp": value pair of the JSON object returned by hcb_rrd.
+_SAMPLE = re.compile(rb'"(\d+)"\s*:\s*"?(-?[0-9.]+(?:[eE][-+]?\d+)?)"?')
+
+
+@dataclass(frozen=True)
+class HistorySource:
+    """Describes a history logger of the Toon and the sensor it fills."""
+
+    logger: str
+    sensor: EntityDescription
+    unit: str
+    affixes: str = DEVICE_P1_METER
+    scale: float = 1.0
+    counter: bool = True
+    p1_meter: bool = True
+
+
+HISTORY_SOURCES: tuple[HistorySource, ...] = (
+    HistorySource(
+        logger="elec_quantity_nt",
+        sensor=EntityDescription(
+            key="electricity_delivered_high", name="Electricity delivered high"
+        ),
+        unit=UnitOfEnergy.KILO_WATT_HOUR,
+        scale=0.001,
+    ),
+    HistorySource(
+        logger="elec_quantity_lt",
+        sensor=EntityDescription(
+            key="electricity_delivered_low", name="Electricity delivered low"
+        ),
+        unit=UnitOfEnergy.KILO_WATT_HOUR,
+        scale=0.001,
+    ),
+    HistorySource(
+        logger="elec_quantity_nt_produ",
+        sensor=EntityDescription(
+            key="electricity_returned_high", name="Electricity returned high"
+        ),
+        unit=UnitOfEnergy.KILO_WATT_HOUR,
+        scale=0.001,
+    ),
+    HistorySource(
+        logger="elec_quantity_lt_produ",
+        sensor=EntityDescription(
+            key="electricity_returned_low", name="Electricity returned low"
+        ),
+        unit=UnitOfEnergy.KILO_WATT_HOUR,
+        scale=0.001,
+    ),
+    HistorySource(
+        logger="gas_quantity",
+        sensor=EntityDescription(key="total", name="Gas total"),
+        unit=UnitOfVolume.CUBIC_METERS,
+        scale=0.001,
+    ),
+    HistorySource(
+        logger="thermstat_currentTemp",
+        sensor=EntityDescription(
+            key="current_display_temperature", name="Temperature"
+        ),
+        unit=UnitOfTemperature.CELSIUS,
+        affixes=DEVICE_THERMOSTAT,
+        counter=False,
+        p1_meter=False,
+    ),
+)
+
+
+@dataclass
+class BackfillProgress:
+    """Progress of the statistics backfill of a Toon."""
+
+    progress: float | None = None
+    statistic: str | None = None
+    imported: int = 0
+    skipped: int = 0
+
+
+async def iter_samples(chunks: AsyncIterator[bytes]) -> AsyncIterator[tuple[int, float]]:
+    """Yield the samples of a hcb_rrd response page by page, as it streams in."""
+    buffer = b""
+    async for chunk in chunks:
+        buffer += chunk
+        # Only parse up to the last complete pair, the rest is still streaming.
+        end = buffer.rfind(b",")
+        if end < 0:
+            continue
+        for match in _SAMPLE.finditer(buffer, 0, end):
+            yield int(match[1]), float(match[2])
+        buffer = buffer[end + 1 :]
+    for match in _SAMPLE.finditer(buffer):
+        yield int(match[1]), float(match[2])
+
+
+class HourlyStatistics:
+    """Hourly statistics of the samples of a single history logger."""
+
+    def __init__(self, counter: bool, scale: float) -> None:
+        """Initialize the hourly statistics."""
+        self.counter = counter
+        self.scale = scale
+        # Counters keep the last reading per hour, others the sum, min, max, count.
+        self._hours: dict[int, list[float]] = {}
+
+    def add(self, timestamp: int, value: float) -> None:
+        """Add a sample to the hour it belongs to."""
+        if math.isnan(value):
+            return
+        value *= self.scale
+        if self.counter:
+            # A reading closes the hour that ends at (or after) its timestamp.
+            start = math.ceil(timestamp / HOUR) * HOUR - HOUR
+            self._hours[start] = [value]
+            return
+
+        start = timestamp // HOUR * HOUR
+        if (hour := self._hours.get(start)) is None:
+            self._hours[start] = [value, value, value, 1]
+        else:
+            hour[0] += value
+            hour[1] = min(hour[1], value)
+            hour[2] = max(hour[2], value)
+            hour[3] += 1
+
+    def __len__(self) -> int:
+        """Return the number of hours with samples."""
+        return len(self._hours)
+
+    def rows(
+        self,
+        until: float,
+        last_start: float | None = None,
+        last_state: float | None = None,
+        last_sum: float = 0.0,
+    ) -> Iterable[StatisticData]:
+        """Yield the completed hours after the last stored statistic."""
+        state, total = last_state, last_sum
+        for start in sorted(self._hours):
+            if start + HOUR > until or (last_start is not None and start <= last_start):
+                continue
+            values = self._hours[start]
+            start_time = dt_util.utc_from_timestamp(start)
+            if not self.counter:
+                yield StatisticData(
+                    start=start_time,
+                    mean=values[0] / values[3],
+                    min=values[1],
+                    max=values[2],
+                )
+                continue
+
+            # A meter reset or replacement starts the counter over.
+            if state is not None and values[0] >= state:
+                total += values[0] - state
+            state = values[0]
+            yield StatisticData(start=start_time, state=state, sum=total)
+
+    def skipped(self, until: float, last_start: float | None) -> int:
+        """Return the number of hours that are already stored."""
+        if last_start is None:
+            return 0
+        return sum(1 for start in self._hours if start <= last_start and start + HOUR <= until)
+
+
+class ToonStatisticsBackfill:
+    """Import the history of a Toon into the long-term statistics of its sensors."""
+
+    def __init__(self, coordinator: RootedToonDataUpdateCoordinator) -> None:
+        """Initialize the backfill."""
+        self.progress = BackfillProgress()
+
+        self._coordinator = coordinator
+        config = coordinator.config
+        self._url = f"http://{config.get(CONF_HOST)}:{config.get(CONF_PORT)}/hcb_rrd"
+        self._sources = [
+            source
+            for source in HISTORY_SOURCES
+            if not source.p1_meter or config.get(CONF_ENABLE_P1_METER)
+        ]
+
+    def _statistic_id(self, source: HistorySource) -> str | None:
+        """Return the entity ID of the sensor a history logger belongs to."""
+        spec = self._coordinator.entity_factory.spec(
+            Platform.SENSOR, source.affixes, source.sensor
+        )
+        return er.async_get(self._coordinator.hass).async_get_entity_id(
+            Platform.SENSOR, DOMAIN, spec.unique_id
+        )
+
+    async def async_run(self) -> None:
+        """Import every history logger, skipping the hours that are already stored."""
+        if "recorder" not in self._coordinator.hass.config.components:
+            _LOGGER.warning("The recorder is not running, the Toon history is not imported")
+            return
+
+        for index, source in enumerate(self._sources):
+            if (statistic_id := self._statistic_id(source)) is None:
+                _LOGGER.debug("No sensor for the %s history of the Toon", source.logger)
+                continue
+            self.progress.statistic = statistic_id
+            self._async_set_progress(index, 0.0)
+            try:
+                await self._async_backfill(index, source, statistic_id)
+            except CircuitOpenError:
+                _LOGGER.warning(
+                    "The Toon is not responding, its history is imported next start"
+                )
+                break
+            except (ClientError, TimeoutError) as error:
+                _LOGGER.warning(
+                    "Could not read the %s history of the Toon: %s", source.logger, error
+                )
+        self.progress.statistic = None
+        self._async_set_progress(len(self._sources), 0.0)
+
+    async def _async_backfill(
+        self, index: int, source: HistorySource, statistic_id: str
+    ) -> None:
+        """Import the history of a single logger after the last stored hour."""
+        hass = self._coordinator.hass
+        last = await get_instance(hass).async_add_executor_job(
+            get_last_statistics, hass, 1, statistic_id, True, {"state", "sum"}
+        )
+        last_start = last_state = None
+        last_sum = 0.0
+        if rows := last.get(statistic_id):
+            last_start = rows[0]["start"]
+            if isinstance(last_start, datetime):
+                last_start = last_start.timestamp()
+            last_state = rows[0].get("state")
+            last_sum = rows[0].get("sum") or 0.0
+
+        hours = HourlyStatistics(source.counter, source.scale)
+        await self._coordinator.async_history_request(
+            lambda: self._async_fetch(source, hours)
+        )
+
+        # Leave the hours the recorder compiles from the states itself, so the
+        # hours after the import continue from the last imported state and sum.
+        now = dt_util.utcnow().timestamp()
+        until = (now - COMPILE_MARGIN) // HOUR * HOUR
+        self.progress.skipped += hours.skipped(until, last_start)
+        rows = list(hours.rows(until, last_start, last_state, last_sum))
+        metadata = StatisticMetaData(
+            has_mean=not source.counter,
+            has_sum=source.counter,
+            name=None,
+            source=RECORDER_DOMAIN,
+            statistic_id=statistic_id,
+            unit_of_measurement=source.unit,
+        )
+        for batch in range(0, len(rows), IMPORT_BATCH):
+            async_import_statistics(hass, metadata, rows[batch : batch + IMPORT_BATCH])
+            self.progress.imported += len(rows[batch : batch + IMPORT_BATCH])
+            self._async_set_progress(index, (batch + IMPORT_BATCH) / len(rows))
+            # Let the recorder and the rest of Home Assistant keep up.
+            await get_instance(hass).async_block_till_done()
+
+    async def _async_fetch(
+        self, source: HistorySource, hours: HourlyStatistics
+    ) -> None:
+        """Stream the hourly history of a logger from the Toon."""
+        async with self._coordinator.session.get(
+            self._url,
+            params={
+                "action": "getRrdData",
+                "loggerName": source.logger,
+                "rra": "5yrhours",
+                "readableTime": "0",
+                "nocache": "1",
+            },
+        ) as response:
+            response.raise_for_status()
+            async for timestamp, value in iter_samples(
+                response.content.iter_chunked(PAGE_SIZE)
+            ):
+                hours.add(timestamp, value)
+
+    def _async_set_progress(self, index: int, fraction: float) -> None:
+        """Publish the progress over all history loggers."""
+        self.progress.progress = round(
+            (index + min(fraction, 1.0)) / max(len(self._sources), 1) * 100, 1
+        )
+        self._coordinator.async_notify_changed()
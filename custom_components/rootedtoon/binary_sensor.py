@@ -10,24 +10,20 @@ from homeassistant.components.binary_sensor import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.const import CONF_NAME
+from homeassistant.const import Platform
+from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import (
-    CONF_BOILER_PREFIX,
-    CONF_BOILER_SUFFIX,
-    DOMAIN,
-    CONF_THERMOSTAT_PREFIX,
-    CONF_THERMOSTAT_SUFFIX,
-)
+from .const import DOMAIN
 from .coordinator import RootedToonDataUpdateCoordinator
 from .models import (
     ToonBoilerDeviceEntity,
     ToonBoilerModuleDeviceEntity,
+    ToonDeviceEntity,
     ToonEntity,
     ToonThermostatDeviceEntity,
 )
-from .util import upper_first
+from .util import device_context
 from typing import Any
 
 
@@ -51,6 +47,15 @@ async def async_setup_entry(
             ]
         )
 
+    entities.extend(
+        [
+            description.cls(
+                coordinator, entry, description, coordinator.snapshot_store.state
+            )
+            for description in DIAGNOSTIC_BINARY_SENSOR_ENTITIES
+        ]
+    )
+
     async_add_entities(entities, True)
 
 
@@ -67,18 +72,21 @@ class ToonBinarySensor(ToonEntity, BinarySensorEntity):
         device: Any,
     ) -> None:
         """Initialize the Toon sensor."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, device_context(device, description.key))
         self.entity_description = description
         self.device = device
 
-        self._attr_unique_id = (
-            f"{DOMAIN}_{entry.data.get(CONF_NAME)}_binary_sensor_{description.key}"
+        spec = coordinator.entity_factory.spec(
+            Platform.BINARY_SENSOR, self._affixes, description
         )
+        self._attr_name = spec.name
+        self._attr_unique_id = spec.unique_id
+        self._value = spec.value
 
     @property
     def is_on(self) -> bool | None:
         """Return the status of the binary sensor."""
-        value = getattr(self.device, self.entity_description.key)
+        value = self._value(self.device)
 
         if self.entity_description.inverted:
             return not value
@@ -86,53 +94,23 @@ class ToonBinarySensor(ToonEntity, BinarySensorEntity):
         return value
 
 
+class ToonDiagnosticBinarySensor(ToonBinarySensor, ToonDeviceEntity):
+    """Defines a Toon diagnostic binary sensor."""
+
+    _endpoint = None
+
+
 class ToonBoilerBinarySensor(ToonBinarySensor, ToonBoilerDeviceEntity):
     """Defines a Boiler binary sensor."""
 
-    def __init__(
-        self,
-        coordinator: RootedToonDataUpdateCoordinator,
-        entry: ConfigEntry,
-        description: ToonBinarySensorEntityDescription,
-        device: Any,
-    ) -> None:
-        """Initialize the Toon sensor."""
-        super().__init__(coordinator, entry, description, device)
-        name = f"{entry.data.get(CONF_BOILER_PREFIX) } {description.name.lower()} { entry.data.get(CONF_BOILER_SUFFIX)}".strip()
-        self._attr_name = upper_first(name)
-
 
 class ToonThermostatBinarySensor(ToonBinarySensor, ToonThermostatDeviceEntity):
     """Defines a Toon Display binary sensor."""
 
-    def __init__(
-        self,
-        coordinator: RootedToonDataUpdateCoordinator,
-        entry: ConfigEntry,
-        description: ToonBinarySensorEntityDescription,
-        device: Any,
-    ) -> None:
-        """Initialize the Toon sensor."""
-        super().__init__(coordinator, entry, description, device)
-        name = f"{entry.data.get(CONF_THERMOSTAT_PREFIX) } {description.name.lower()} { entry.data.get(CONF_THERMOSTAT_SUFFIX)}".strip()
-        self._attr_name = upper_first(name)
-
 
 class ToonBoilerModuleBinarySensor(ToonBinarySensor, ToonBoilerModuleDeviceEntity):
     """Defines a Boiler module binary sensor."""
 
-    def __init__(
-        self,
-        coordinator: RootedToonDataUpdateCoordinator,
-        entry: ConfigEntry,
-        description: ToonBinarySensorEntityDescription,
-        device: Any,
-    ) -> None:
-        """Initialize the Toon sensor."""
-        super().__init__(coordinator, entry, description, device)
-        name = f"{entry.data.get(CONF_BOILER_PREFIX) } {description.name.lower()} { entry.data.get(CONF_BOILER_SUFFIX)}".strip()
-        self._attr_name = upper_first(name)
-
 
 @dataclass
 class ToonBinarySensorRequiredKeysMixin:
@@ -206,3 +184,13 @@ BINARY_SENSOR_ENTITIES_BOILER: tuple[ToonBinarySensorEntityDescription, ...] = (
         cls=ToonBoilerBinarySensor,
     ),
 )
+
+DIAGNOSTIC_BINARY_SENSOR_ENTITIES: tuple[ToonBinarySensorEntityDescription, ...] = (
+    ToonBinarySensorEntityDescription(
+        key="restored",
+        name="Data restored",
+        icon="mdi:database-clock",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        cls=ToonDiagnosticBinarySensor,
+    ),
+)
@@ -0,0 +1,104 @@
+"""Circuit breaker around the connection with a Toon."""
+from __future__ import annotations
+
+from datetime import datetime
+import logging
+
+from rootedtoonapi import ToonError
+
+from homeassistant.util import dt as dt_util
+
+_LOGGER = logging.getLogger(__name__)
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+BREAKER_THRESHOLD = 3
+BREAKER_RESET_TIMEOUT = 30.0
+BREAKER_MAX_RESET_TIMEOUT = 300.0
+# A single failing endpoint (e.g. an unparsable P1 meter) is not a failing Toon.
+BREAKER_SOURCES = 2
+
+
+class CircuitOpenError(ToonError):
+    """Raised instead of sending a request while the Toon is unreachable."""
+
+
+class CircuitBreaker:
+    """Fail fast while a Toon does not respond, probing until it is back."""
+
+    def __init__(
+        self,
+        threshold: int = BREAKER_THRESHOLD,
+        reset_timeout: float = BREAKER_RESET_TIMEOUT,
+        sources: int = BREAKER_SOURCES,
+    ) -> None:
+        """Initialize the circuit breaker."""
+        self.threshold = threshold
+        self.reset_timeout = reset_timeout
+        self.sources = sources
+        self.state = STATE_CLOSED
+        self.failures = 0
+        self.trips = 0
+        self.rejected = 0
+        self.probe_at = 0.0
+        self.last_change: datetime | None = None
+        self._open_timeout = reset_timeout
+        self._failing: set[str] = set()
+
+    @property
+    def closed(self) -> bool:
+        """Return if requests are sent as usual."""
+        return self.state == STATE_CLOSED
+
+    def allow(self, now: float, probe: bool = False) -> bool:
+        """Return if a request may be sent, a probe may half-open the breaker."""
+        if self.state == STATE_CLOSED:
+            return True
+        if probe and now >= self.probe_at:
+            # A probe that never reported back is replaced by a new one.
+            self.probe_at = now + self._open_timeout
+            self._set_state(STATE_HALF_OPEN)
+            return True
+        self.rejected += 1
+        return False
+
+    def record_success(self) -> bool:
+        """Record a successful request and return if that closed the breaker."""
+        self.failures = 0
+        self._failing.clear()
+        if self.state == STATE_CLOSED:
+            return False
+        _LOGGER.info("The Toon responds again, resuming requests")
+        self._open_timeout = self.reset_timeout
+        self._set_state(STATE_CLOSED)
+        return True
+
+    def record_failure(self, now: float, source: str) -> None:
+        """Record a failed request and open the breaker when the Toon seems down."""
+        self.failures += 1
+        self._failing.add(source)
+        if self.state == STATE_HALF_OPEN:
+            # The probe failed, wait longer before the next one.
+            self._open_timeout = min(self._open_timeout * 2, BREAKER_MAX_RESET_TIMEOUT)
+        elif (
+            self.state != STATE_CLOSED
+            or self.failures < self.threshold
+            or len(self._failing) < self.sources
+        ):
+            return
+        else:
+            self.trips += 1
+            _LOGGER.warning(
+                "The Toon did not respond %d times in a row, pausing requests",
+                self.failures,
+            )
+
+        self.probe_at = now + self._open_timeout
+        self._set_state(STATE_OPEN)
+
+    def _set_state(self, state: str) -> None:
+        """Change the state of the breaker."""
+        self.state = state
+        self.last_change = dt_util.utcnow()
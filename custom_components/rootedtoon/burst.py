@@ -0,0 +1,102 @@
+"""Burst sampling of the boiler modulation while the burner is active."""
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass
+from typing import Any
+
+BURST_WINDOW = 3600.0
+
+
+@dataclass
+class BurnerStatistics:
+    """Time-weighted statistics of the boiler over the last window."""
+
+    modulation: float | None = None
+    duty_cycle: float | None = None
+    burner_starts: int = 0
+    samples: int = 0
+    bursting: bool = False
+
+
+class BurstSampler:
+    """Sample the thermostat fast while the boiler burns, and slow when idle."""
+
+    def __init__(
+        self, burst_interval: float, idle_time: float, window: float = BURST_WINDOW
+    ) -> None:
+        """Initialize the burst sampler."""
+        self.burst_interval = burst_interval
+        self.idle_time = idle_time
+        self.window = window
+        self.statistics = BurnerStatistics()
+        self.bursts = 0
+        self.samples = 0
+
+        # The timestamp, modulation and burner state of every sample in the window.
+        self._samples: deque[tuple[float, float, bool]] = deque()
+        self._active = False
+        self._idle_since: float | None = None
+
+    def add(self, now: float, thermostat: Any) -> bool:
+        """Add a thermostat sample and return if bursting started or stopped."""
+        active = bool(thermostat.burner or thermostat.heating)
+        modulation = thermostat.current_modulation_level
+        self._samples.append(
+            (now, float(modulation) if modulation is not None else 0.0, active)
+        )
+        self.samples += 1
+        self._prune(now)
+
+        bursting = self.statistics.bursting
+        if active and not self._active:
+            self._idle_since = None
+            self.statistics.bursting = True
+        elif not active and self._active:
+            self._idle_since = now
+        if (
+            not active
+            and self._idle_since is not None
+            and now - self._idle_since >= self.idle_time
+        ):
+            self._idle_since = None
+            self.statistics.bursting = False
+        self._active = active
+
+        self._aggregate(now)
+        if self.statistics.bursting and not bursting:
+            self.bursts += 1
+        return self.statistics.bursting != bursting
+
+    def _prune(self, now: float) -> None:
+        """Drop the samples before the window, keeping the one that holds at its start."""
+        start = now - self.window
+        while len(self._samples) > 1 and self._samples[1][0] <= start:
+            self._samples.popleft()
+
+    def _aggregate(self, now: float) -> None:
+        """Update the time-weighted statistics of the samples in the window."""
+        # Every sample holds until the next one, the last one holds until now.
+        start = now - self.window
+        points = list(self._samples)
+        modulation_area = burning = 0.0
+        burner_starts = 0
+        for index, (time, modulation, active) in enumerate(points):
+            end = points[index + 1][0] if index + 1 < len(points) else now
+            duration = end - max(time, start)
+            if duration > 0:
+                modulation_area += modulation * duration
+                burning += duration if active else 0.0
+            if active and index and not points[index - 1][2] and time > start:
+                burner_starts += 1
+
+        duration = now - max(points[0][0], start)
+        statistics = self.statistics
+        if duration > 0:
+            statistics.modulation = round(modulation_area / duration, 1)
+            statistics.duty_cycle = round(burning / duration * 100, 1)
+        else:
+            statistics.modulation = points[-1][1]
+            statistics.duty_cycle = 100.0 if points[-1][2] else 0.0
+        statistics.burner_starts = burner_starts
+        statistics.samples = sum(1 for time, _, _ in points if time > start)
@@ -5,20 +5,23 @@ from datetime import datetime
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_NAME
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_track_point_in_time
 
-from . import RootedToonDataUpdateCoordinator
+from .coordinator import RootedToonDataUpdateCoordinator
 from .const import (
-    CONF_ENABLE_PROGRAM,
     CONF_THERMOSTAT_PREFIX,
     CONF_THERMOSTAT_SUFFIX,
     DOMAIN,
+    ENDPOINT_PROGRAM,
 )
 
 from homeassistant.components.calendar import CalendarEntity, CalendarEvent
+from homeassistant.util import dt as dt_util
 from .models import ToonThermostatDeviceEntity
-from .util import upper_first
+from .program import ProgramIndex
+from .util import device_context, upper_first
 
 
 async def async_setup_entry(
@@ -26,50 +29,93 @@ async def async_setup_entry(
 ) -> None:
     """Set up a Toon calendar based on a config entry."""
     coordinator = hass.data[DOMAIN][entry.entry_id]
-    if entry.data.get(CONF_ENABLE_PROGRAM):
-        async_add_entities([ToonThermostatCalendar(coordinator, entry)])
+    async_add_entities([ToonThermostatCalendar(coordinator, entry)])
 
 
 class ToonThermostatCalendar(CalendarEntity, ToonThermostatDeviceEntity):
     """Representation of a Toon calendar."""
 
     _attr_icon = "mdi:thermostat"
+    _endpoint = ENDPOINT_PROGRAM
 
     def __init__(
         self, coordinator: RootedToonDataUpdateCoordinator, entry: ConfigEntry
     ) -> None:
         """Initialize Toon climate entity."""
-        super().__init__(coordinator)
+        # Only a new program revision is relevant, the current event is kept up
+        # to date by a timer at the next program transition.
+        super().__init__(
+            coordinator,
+            device_context(coordinator.endpoints[ENDPOINT_PROGRAM], "revision"),
+        )
 
         name = f"{entry.data.get(CONF_THERMOSTAT_PREFIX) } program { entry.data.get(CONF_THERMOSTAT_SUFFIX)}".strip()
         self._attr_name = upper_first(name)
         self._attr_unique_id = f"{DOMAIN}_{entry.data.get(CONF_NAME)}_calendar"
 
-    def _map_to_calendar_event(self, data):
-        return CalendarEvent(
-            start=data.start_datetime,
-            end=data.end_datetime,
-            summary=data.state,
+        self._program_revision: int | None = None
+        self._program = ProgramIndex(())
+        self._unsub_transition: CALLBACK_TYPE | None = None
+        self._async_update_program()
+
+    async def async_added_to_hass(self) -> None:
+        """Schedule the first program transition."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self._async_cancel_transition)
+        self._async_schedule_transition()
+
+    @callback
+    def _async_update_program(self) -> None:
+        """Re-index the program when the Toon returned a new revision of it."""
+        revision = self.coordinator.endpoints[ENDPOINT_PROGRAM].revision
+        if revision != self._program_revision:
+            self._program_revision = revision
+            self._program = ProgramIndex(
+                self.coordinator.data.thermostat.internal_program.events
+            )
+
+    @callback
+    def _async_cancel_transition(self) -> None:
+        """Cancel the pending program transition."""
+        if self._unsub_transition is not None:
+            self._unsub_transition()
+            self._unsub_transition = None
+
+    @callback
+    def _async_schedule_transition(self) -> None:
+        """Update the state at the start or end of the current program block."""
+        self._async_cancel_transition()
+        now = dt_util.now()
+        if (event := self._program.event_at(now)) is None:
+            return
+        self._unsub_transition = async_track_point_in_time(
+            self.hass,
+            self._async_handle_transition,
+            event.end if event.start <= now else event.start,
         )
 
+    @callback
+    def _async_handle_transition(self, _now: datetime) -> None:
+        """Write the state of the program block that just started."""
+        self._unsub_transition = None
+        self.async_write_ha_state()
+        self._async_schedule_transition()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._async_update_program()
+        super()._handle_coordinator_update()
+        self._async_schedule_transition()
+
     @property
-    def event(self):
-        events = self.coordinator.data.thermostat.internal_program.events
-        if len(events) > 0:
-            return self._map_to_calendar_event(events[0])
-        return None
+    def event(self) -> CalendarEvent | None:
+        return self._program.event_at(dt_util.now())
 
     async def async_get_events(
         self,
         hass: HomeAssistant,
-        start_date: datetime.datetime,
-        end_date: datetime.datetime,
+        start_date: datetime,
+        end_date: datetime,
     ) -> list[CalendarEvent]:
-        events = self.coordinator.data.thermostat.internal_program.events
-        return [
-            self._map_to_calendar_event(e)
-            for e in filter(
-                lambda e: e.end_datetime >= start_date and e.start_datetime <= end_date,
-                events,
-            )
-        ]
+        return list(self._program.events(start_date, end_date))
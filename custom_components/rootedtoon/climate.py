@@ -23,22 +23,25 @@ from homeassistant.components.climate import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import ATTR_TEMPERATURE, CONF_NAME, UnitOfTemperature
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_call_later
 
-from . import RootedToonDataUpdateCoordinator
+from .coordinator import RootedToonDataUpdateCoordinator
 from .const import (
     CONF_THERMOSTAT_PREFIX,
     CONF_THERMOSTAT_SUFFIX,
     DEFAULT_MAX_TEMP,
     DEFAULT_MIN_TEMP,
     DOMAIN,
-    PRESET_MODE_TO_STATE_MAPPING,
-    STATE_TO_PRESET_MODE_MAPPING,
 )
-from .helpers import toon_exception_handler
+from .commands import COMMAND_ACTIVE_STATE, COMMAND_HVAC_MODE, COMMAND_SETPOINT
 from .models import ToonThermostatDeviceEntity
-from .util import upper_first
+from .presets import PRESET_MODE_TO_STATE_MAPPING, STATE_TO_PRESET_MODE_MAPPING
+from .util import device_context, upper_first
+
+# Quiet window after the last setpoint change before it is sent to the Toon.
+SETPOINT_WRITE_DELAY = 1.5
 
 
 async def async_setup_entry(
@@ -64,7 +67,7 @@ class ToonThermostatDevice(ToonThermostatDeviceEntity, ClimateEntity):
         self, coordinator: RootedToonDataUpdateCoordinator, config: Any
     ) -> None:
         """Initialize Toon climate entity."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, device_context(coordinator.data.thermostat))
         self._attr_hvac_modes = [HVACMode.HEAT, HVACMode.AUTO]
         self._attr_preset_modes = [
             PRESET_HOME,
@@ -76,6 +79,8 @@ class ToonThermostatDevice(ToonThermostatDeviceEntity, ClimateEntity):
         self._attr_name = upper_first(name)
         self._attr_unique_id = f"{DOMAIN}_{config.get(CONF_NAME)}_climate"
         self.config = config
+        self._optimistic_setpoint: float | None = None
+        self._unsub_setpoint_write: CALLBACK_TYPE | None = None
 
     @property
     def hvac_action(self) -> HVACAction:
@@ -109,6 +114,8 @@ class ToonThermostatDevice(ToonThermostatDeviceEntity, ClimateEntity):
     @property
     def target_temperature(self) -> float | None:
         """Return the temperature we try to reach."""
+        if self._optimistic_setpoint is not None:
+            return self._optimistic_setpoint
         return self.coordinator.data.thermostat.current_setpoint
 
     @property
@@ -119,22 +126,54 @@ class ToonThermostatDevice(ToonThermostatDeviceEntity, ClimateEntity):
             "modulation_level": self.coordinator.data.thermostat.current_modulation_level,
         }
 
-    @toon_exception_handler
+    async def async_will_remove_from_hass(self) -> None:
+        """Queue a pending setpoint write right away, instead of dropping it."""
+        if self._unsub_setpoint_write is not None:
+            self._unsub_setpoint_write()
+            self._async_write_setpoint(None)
+        await super().async_will_remove_from_hass()
+
     async def async_set_temperature(self, **kwargs: Any) -> None:
         """Change the setpoint of the thermostat."""
-        temperature = kwargs.get(ATTR_TEMPERATURE)
-        await self.coordinator.toon.set_current_setpoint(temperature)
+        self._optimistic_setpoint = kwargs.get(ATTR_TEMPERATURE)
+        self.async_write_ha_state()
+
+        # Coalesce a burst of changes, e.g. dragging a slider, into one write.
+        if self._unsub_setpoint_write is not None:
+            self._unsub_setpoint_write()
+        self._unsub_setpoint_write = async_call_later(
+            self.hass, SETPOINT_WRITE_DELAY, self._async_write_setpoint
+        )
+
+    @callback
+    def _async_write_setpoint(self, _now: Any) -> None:
+        """Queue the last requested setpoint for the thermostat."""
+        self._unsub_setpoint_write = None
+        temperature, self._optimistic_setpoint = self._optimistic_setpoint, None
+        self.coordinator.async_queue_command(
+            COMMAND_SETPOINT,
+            self.coordinator.toon.set_current_setpoint,
+            temperature,
+            overlay={"current_setpoint": temperature},
+        )
 
-    @toon_exception_handler
     async def async_set_preset_mode(self, preset_mode: str) -> None:
         """Set new preset mode."""
         if preset_mode in PRESET_MODE_TO_STATE_MAPPING:
-            await self.coordinator.toon.set_active_state(
-                PRESET_MODE_TO_STATE_MAPPING[preset_mode]
+            state = PRESET_MODE_TO_STATE_MAPPING[preset_mode]
+            self.coordinator.async_queue_command(
+                COMMAND_ACTIVE_STATE,
+                self.coordinator.toon.set_active_state,
+                state,
+                overlay={"active_state": state},
             )
 
-    @toon_exception_handler
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
         """Set new target hvac mode."""
         mapping = {HVACMode.AUTO: PROGRAM_STATE_ON, HVACMode.HEAT: PROGRAM_STATE_OFF}
-        await self.coordinator.toon.set_hvac_mode(mapping[hvac_mode])
+        self.coordinator.async_queue_command(
+            COMMAND_HVAC_MODE,
+            self.coordinator.toon.set_hvac_mode,
+            mapping[hvac_mode],
+            overlay={"program": hvac_mode == HVACMode.AUTO},
+        )
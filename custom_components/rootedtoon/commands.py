@@ -0,0 +1,184 @@
+"""Queue of the commands sent to the thermostat of a Toon."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from contextlib import suppress
+from dataclasses import dataclass, field
+import logging
+import random
+from time import monotonic
+from typing import Any
+
+from rootedtoonapi import ToonError
+
+_LOGGER = logging.getLogger(__name__)
+
+COMMAND_HVAC_MODE = "hvac_mode"
+COMMAND_ACTIVE_STATE = "active_state"
+COMMAND_SETPOINT = "setpoint"
+
+# A program change can change the active state, which can change the setpoint.
+COMMAND_PRIORITIES = {COMMAND_HVAC_MODE: 0, COMMAND_ACTIVE_STATE: 1, COMMAND_SETPOINT: 2}
+
+COMMAND_DEADLINE = 120.0
+COMMAND_RETRY_BASE = 2.0
+COMMAND_RETRY_MAX = 30.0
+
+
+@dataclass
+class ToonCommand:
+    """A command for the thermostat and the values it will set when sent."""
+
+    kind: str
+    func: Callable[..., Awaitable[Any]]
+    args: tuple[Any, ...]
+    overlay: dict[str, Any]
+    deadline: float
+    ready_at: float = 0.0
+    attempts: int = 0
+    last_error: str | None = field(default=None, compare=False)
+
+
+class ToonCommandQueue:
+    """Send thermostat commands in order of priority, retrying failed commands."""
+
+    def __init__(
+        self,
+        send: Callable[[ToonCommand], Awaitable[None]],
+        confirm: Callable[[], Awaitable[None]],
+        deadline: float = COMMAND_DEADLINE,
+    ) -> None:
+        """Initialize the command queue."""
+        self.sent = 0
+        self.retries = 0
+        self.superseded = 0
+        self.failed = 0
+        self.last_error: str | None = None
+
+        self._send = send
+        self._confirm = confirm
+        self._deadline = deadline
+        self._pending: dict[str, ToonCommand] = {}
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task[None] | None = None
+        self._random = random.Random()
+
+    @property
+    def pending(self) -> list[ToonCommand]:
+        """Return the commands that are queued or in flight."""
+        return list(self._pending.values())
+
+    def enqueue(
+        self,
+        kind: str,
+        func: Callable[..., Awaitable[Any]],
+        *args: Any,
+        overlay: dict[str, Any],
+    ) -> None:
+        """Queue a command, superseding a queued command of the same kind."""
+        if kind in self._pending:
+            self.superseded += 1
+        self._pending[kind] = ToonCommand(
+            kind=kind,
+            func=func,
+            args=args,
+            overlay=overlay,
+            deadline=monotonic() + self._deadline,
+        )
+        self._wakeup.set()
+
+    def start(self, create_task: Callable[[Awaitable[None]], asyncio.Task[None]]) -> None:
+        """Start sending the queued commands, unless that is already running."""
+        if self._task is None and self._pending:
+            self._task = create_task(self._async_process())
+
+    def cancel(self) -> None:
+        """Stop sending commands."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def apply_pending(self, device: Any) -> None:
+        """Show the values of the pending commands instead of the polled ones."""
+        attrs = getattr(device, "__dict__", {})
+        for command in sorted(
+            self._pending.values(), key=lambda command: COMMAND_PRIORITIES[command.kind]
+        ):
+            for attr, value in command.overlay.items():
+                if attr in attrs:
+                    setattr(device, attr, value)
+
+    async def _async_process(self) -> None:
+        """Send the pending commands until the queue is empty."""
+        try:
+            while self._pending:
+                now = monotonic()
+                ready = [
+                    command
+                    for command in self._pending.values()
+                    if command.ready_at <= now
+                ]
+                if not ready:
+                    self._wakeup.clear()
+                    with suppress(asyncio.TimeoutError):
+                        await asyncio.wait_for(
+                            self._wakeup.wait(),
+                            min(command.ready_at for command in self._pending.values())
+                            - now,
+                        )
+                    continue
+
+                command = min(ready, key=lambda command: COMMAND_PRIORITIES[command.kind])
+                await self._async_send(command)
+                if not self._pending:
+                    # Confirm the changes with the state of the thermostat.
+                    await self._confirm()
+        finally:
+            self._task = None
+
+    async def _async_send(self, command: ToonCommand) -> None:
+        """Send a command, and reschedule it with a jittered backoff if it fails."""
+        command.attempts += 1
+        try:
+            await self._send(command)
+        except ToonError as error:
+            command.last_error = self.last_error = str(error)
+            delay = min(
+                COMMAND_RETRY_BASE * 2 ** (command.attempts - 1), COMMAND_RETRY_MAX
+            ) * self._random.uniform(0.5, 1.0)
+            if self._pending.get(command.kind) is not command:
+                return
+            if monotonic() + delay > command.deadline:
+                self.failed += 1
+                del self._pending[command.kind]
+                _LOGGER.error(
+                    "Failed to change the %s of the thermostat after %d attempts: %s",
+                    command.kind.replace("_", " "),
+                    command.attempts,
+                    error,
+                )
+                return
+            self.retries += 1
+            command.ready_at = monotonic() + delay
+            _LOGGER.warning(
+                "Failed to change the %s of the thermostat, retrying in %.1f seconds: %s",
+                command.kind.replace("_", " "),
+                delay,
+                error,
+            )
+        except Exception as error:  # pylint: disable=broad-except
+            # Retrying will not help, drop the command so the poll shows the truth.
+            command.last_error = self.last_error = str(error)
+            self.failed += 1
+            if self._pending.get(command.kind) is command:
+                del self._pending[command.kind]
+            _LOGGER.exception(
+                "Unexpected error changing the %s of the thermostat",
+                command.kind.replace("_", " "),
+            )
+        else:
+            self.sent += 1
+            # A newer command of the same kind may have been queued meanwhile.
+            if self._pending.get(command.kind) is command:
+                del self._pending[command.kind]
@@ -1,7 +1,6 @@
 """Config flow to configure the Toon component."""
 from __future__ import annotations
 
-import logging
 from typing import Any
 
 import voluptuous as vol
@@ -12,23 +11,68 @@ from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers import config_validation as cv, selector
 
 from .const import (
-    DEFAULT_NAME,
-    DEFAULT_PORT,
-    DEFAULT_SCAN_INTERVAL,
+    CONF_ADAPTIVE_POLLING,
+    CONF_BACKFILL_STATISTICS,
     CONF_BOILER_PREFIX,
     CONF_BOILER_SUFFIX,
+    CONF_BURST_IDLE_TIME,
+    CONF_BURST_INTERVAL,
+    CONF_BURST_SAMPLING,
+    CONF_CONCURRENT_UPDATES,
     CONF_ENABLE_BOILER,
     CONF_ENABLE_P1_METER,
     CONF_ENABLE_PROGRAM,
+    CONF_MAX_CONCURRENT_UPDATES,
+    CONF_MAX_SCAN_INTERVAL_BOILER,
+    CONF_MAX_SCAN_INTERVAL_P1_METER,
+    CONF_MAX_SCAN_INTERVAL_PROGRAM,
+    CONF_MAX_SCAN_INTERVAL_THERMOSTAT,
+    CONF_MIN_SCAN_INTERVAL_BOILER,
+    CONF_MIN_SCAN_INTERVAL_P1_METER,
+    CONF_MIN_SCAN_INTERVAL_PROGRAM,
+    CONF_MIN_SCAN_INTERVAL_THERMOSTAT,
+    CONF_MQTT_TOPIC,
+    CONF_OFF_PEAK_END,
+    CONF_OFF_PEAK_PRICE_ELECTRICITY_DELIVERED_HIGH,
+    CONF_OFF_PEAK_PRICE_ELECTRICITY_DELIVERED_LOW,
+    CONF_OFF_PEAK_PRICE_ELECTRICITY_RETURNED_HIGH,
+    CONF_OFF_PEAK_PRICE_ELECTRICITY_RETURNED_LOW,
+    CONF_OFF_PEAK_PRICE_GAS,
+    CONF_OFF_PEAK_START,
     CONF_P1_METER_PREFIX,
     CONF_P1_METER_SUFFIX,
+    CONF_P1_PUBLISH_INTERVAL,
+    CONF_P1_SAMPLE_INTERVAL,
+    CONF_P1_SAMPLING,
+    CONF_PRICE_ELECTRICITY_DELIVERED_HIGH,
+    CONF_PRICE_ELECTRICITY_DELIVERED_LOW,
+    CONF_PRICE_ELECTRICITY_RETURNED_HIGH,
+    CONF_PRICE_ELECTRICITY_RETURNED_LOW,
+    CONF_PRICE_GAS,
+    CONF_PUSH_MODE,
+    CONF_RATE_LIMIT,
+    CONF_RECONCILE_INTERVAL,
     CONF_SCAN_INTERVAL_BOILER,
     CONF_SCAN_INTERVAL_P1_METER,
     CONF_SCAN_INTERVAL_PROGRAM,
     CONF_SCAN_INTERVAL_THERMOSTAT,
+    CONF_STALE_DATA_LIMIT,
     CONF_THERMOSTAT_PREFIX,
     CONF_THERMOSTAT_SUFFIX,
+    DEFAULT_BURST_IDLE_TIME,
+    DEFAULT_BURST_INTERVAL,
+    DEFAULT_MAX_CONCURRENT_UPDATES,
+    DEFAULT_MQTT_TOPIC,
+    DEFAULT_NAME,
+    DEFAULT_P1_PUBLISH_INTERVAL,
+    DEFAULT_P1_SAMPLE_INTERVAL,
+    DEFAULT_PORT,
+    DEFAULT_RATE_LIMIT,
+    DEFAULT_RECONCILE_INTERVAL,
+    DEFAULT_SCAN_INTERVAL,
+    DEFAULT_STALE_DATA_LIMIT,
     DOMAIN,
+    MIN_RATE_LIMIT,
 )
 
 # Validation of the user's configuration
@@ -50,6 +94,53 @@ CONFIG_SCHEMA = vol.Schema(
         vol.Optional(CONF_SCAN_INTERVAL_THERMOSTAT, default=DEFAULT_SCAN_INTERVAL): int,
         vol.Optional(CONF_THERMOSTAT_PREFIX, default=""): str,
         vol.Optional(CONF_THERMOSTAT_SUFFIX, default=""): str,
+        vol.Required(CONF_CONCURRENT_UPDATES, default=False): selector.BooleanSelector(),
+        vol.Optional(
+            CONF_MAX_CONCURRENT_UPDATES, default=DEFAULT_MAX_CONCURRENT_UPDATES
+        ): vol.All(vol.Coerce(int), vol.Range(min=1)),
+        vol.Optional(CONF_STALE_DATA_LIMIT, default=DEFAULT_STALE_DATA_LIMIT): int,
+        vol.Required(CONF_ADAPTIVE_POLLING, default=False): selector.BooleanSelector(),
+        vol.Optional(CONF_MIN_SCAN_INTERVAL_BOILER): int,
+        vol.Optional(CONF_MAX_SCAN_INTERVAL_BOILER): int,
+        vol.Optional(CONF_MIN_SCAN_INTERVAL_P1_METER): int,
+        vol.Optional(CONF_MAX_SCAN_INTERVAL_P1_METER): int,
+        vol.Optional(CONF_MIN_SCAN_INTERVAL_PROGRAM): int,
+        vol.Optional(CONF_MAX_SCAN_INTERVAL_PROGRAM): int,
+        vol.Optional(CONF_MIN_SCAN_INTERVAL_THERMOSTAT): int,
+        vol.Optional(CONF_MAX_SCAN_INTERVAL_THERMOSTAT): int,
+        vol.Optional(CONF_RATE_LIMIT, default=DEFAULT_RATE_LIMIT): vol.All(
+            vol.Coerce(float), vol.Range(min=MIN_RATE_LIMIT)
+        ),
+        vol.Required(CONF_P1_SAMPLING, default=False): selector.BooleanSelector(),
+        vol.Optional(
+            CONF_P1_SAMPLE_INTERVAL, default=DEFAULT_P1_SAMPLE_INTERVAL
+        ): int,
+        vol.Optional(
+            CONF_P1_PUBLISH_INTERVAL, default=DEFAULT_P1_PUBLISH_INTERVAL
+        ): int,
+        vol.Required(CONF_BURST_SAMPLING, default=False): selector.BooleanSelector(),
+        vol.Optional(CONF_BURST_INTERVAL, default=DEFAULT_BURST_INTERVAL): int,
+        vol.Optional(CONF_BURST_IDLE_TIME, default=DEFAULT_BURST_IDLE_TIME): int,
+        vol.Optional(CONF_PRICE_ELECTRICITY_DELIVERED_HIGH): vol.Coerce(float),
+        vol.Optional(CONF_OFF_PEAK_PRICE_ELECTRICITY_DELIVERED_HIGH): vol.Coerce(float),
+        vol.Optional(CONF_PRICE_ELECTRICITY_DELIVERED_LOW): vol.Coerce(float),
+        vol.Optional(CONF_OFF_PEAK_PRICE_ELECTRICITY_DELIVERED_LOW): vol.Coerce(float),
+        vol.Optional(CONF_PRICE_ELECTRICITY_RETURNED_HIGH): vol.Coerce(float),
+        vol.Optional(CONF_OFF_PEAK_PRICE_ELECTRICITY_RETURNED_HIGH): vol.Coerce(float),
+        vol.Optional(CONF_PRICE_ELECTRICITY_RETURNED_LOW): vol.Coerce(float),
+        vol.Optional(CONF_OFF_PEAK_PRICE_ELECTRICITY_RETURNED_LOW): vol.Coerce(float),
+        vol.Optional(CONF_PRICE_GAS): vol.Coerce(float),
+        vol.Optional(CONF_OFF_PEAK_PRICE_GAS): vol.Coerce(float),
+        vol.Optional(CONF_OFF_PEAK_START): selector.TimeSelector(),
+        vol.Optional(CONF_OFF_PEAK_END): selector.TimeSelector(),
+        vol.Required(CONF_PUSH_MODE, default=False): selector.BooleanSelector(),
+        vol.Optional(CONF_MQTT_TOPIC, default=DEFAULT_MQTT_TOPIC): str,
+        vol.Optional(
+            CONF_RECONCILE_INTERVAL, default=DEFAULT_RECONCILE_INTERVAL
+        ): int,
+        vol.Required(
+            CONF_BACKFILL_STATISTICS, default=False
+        ): selector.BooleanSelector(),
     }
 )
 
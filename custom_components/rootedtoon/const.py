@@ -1,40 +1,78 @@
 """Constants for the Toon integration."""
-from datetime import timedelta
-
-from rootedtoonapi import (
-    ACTIVE_STATE_AWAY,
-    ACTIVE_STATE_COMFORT,
-    ACTIVE_STATE_HOME,
-    ACTIVE_STATE_SLEEP,
-)
-
-from homeassistant.components.climate import (
-    PRESET_AWAY,
-    PRESET_COMFORT,
-    PRESET_HOME,
-    PRESET_SLEEP,
-)
 
 DOMAIN = "rootedtoon"
 
+CONF_ADAPTIVE_POLLING = "conf_adaptive_polling"
+CONF_BACKFILL_STATISTICS = "conf_backfill_statistics"
 CONF_BOILER_PREFIX = "boiler_prefix"
 CONF_BOILER_SUFFIX = "boiler_suffix"
+CONF_BURST_IDLE_TIME = "burst_idle_time"
+CONF_BURST_INTERVAL = "burst_interval"
+CONF_BURST_SAMPLING = "conf_burst_sampling"
+CONF_CONCURRENT_UPDATES = "conf_concurrent_updates"
 CONF_ENABLE_P1_METER = "conf_enable_p1_meter"
 CONF_ENABLE_BOILER = "conf_enable_boiler"
 CONF_ENABLE_PROGRAM = "conf_enable_program"
+CONF_MAX_CONCURRENT_UPDATES = "max_concurrent_updates"
+CONF_MAX_SCAN_INTERVAL_BOILER = "max_scan_interval_boiler"
+CONF_MAX_SCAN_INTERVAL_P1_METER = "max_scan_interval_p1_meter"
+CONF_MAX_SCAN_INTERVAL_PROGRAM = "max_scan_interval_program"
+CONF_MAX_SCAN_INTERVAL_THERMOSTAT = "max_scan_interval_thermostat"
 CONF_MIGRATE = "migrate"
+CONF_MQTT_TOPIC = "mqtt_topic"
+CONF_MIN_SCAN_INTERVAL_BOILER = "min_scan_interval_boiler"
+CONF_MIN_SCAN_INTERVAL_P1_METER = "min_scan_interval_p1_meter"
+CONF_MIN_SCAN_INTERVAL_PROGRAM = "min_scan_interval_program"
+CONF_MIN_SCAN_INTERVAL_THERMOSTAT = "min_scan_interval_thermostat"
+CONF_OFF_PEAK_END = "off_peak_end"
+CONF_OFF_PEAK_PRICE_ELECTRICITY_DELIVERED_HIGH = (
+    "off_peak_price_electricity_delivered_high"
+)
+CONF_OFF_PEAK_PRICE_ELECTRICITY_DELIVERED_LOW = "off_peak_price_electricity_delivered_low"
+CONF_OFF_PEAK_PRICE_ELECTRICITY_RETURNED_HIGH = (
+    "off_peak_price_electricity_returned_high"
+)
+CONF_OFF_PEAK_PRICE_ELECTRICITY_RETURNED_LOW = "off_peak_price_electricity_returned_low"
+CONF_OFF_PEAK_PRICE_GAS = "off_peak_price_gas"
+CONF_OFF_PEAK_START = "off_peak_start"
 CONF_P1_METER_PREFIX = "p1_meter_prefix"
 CONF_P1_METER_SUFFIX = "p1_meter_suffix"
+CONF_P1_PUBLISH_INTERVAL = "p1_publish_interval"
+CONF_P1_SAMPLE_INTERVAL = "p1_sample_interval"
+CONF_P1_SAMPLING = "conf_p1_sampling"
+CONF_PRICE_ELECTRICITY_DELIVERED_HIGH = "price_electricity_delivered_high"
+CONF_PRICE_ELECTRICITY_DELIVERED_LOW = "price_electricity_delivered_low"
+CONF_PRICE_ELECTRICITY_RETURNED_HIGH = "price_electricity_returned_high"
+CONF_PRICE_ELECTRICITY_RETURNED_LOW = "price_electricity_returned_low"
+CONF_PRICE_GAS = "price_gas"
 CONF_SCAN_INTERVAL_BOILER = "scan_interval_boiler"
 CONF_SCAN_INTERVAL_P1_METER = "scan_interval_p1_meter"
 CONF_SCAN_INTERVAL_PROGRAM = "scan_interval_program"
 CONF_SCAN_INTERVAL_THERMOSTAT = "scan_interval_thermostat"
+CONF_PUSH_MODE = "conf_push_mode"
+CONF_RATE_LIMIT = "rate_limit"
+CONF_RECONCILE_INTERVAL = "reconcile_interval"
+CONF_STALE_DATA_LIMIT = "stale_data_limit"
 CONF_THERMOSTAT_SUFFIX = "thermostat_suffix"
 CONF_THERMOSTAT_PREFIX = "thermostat_prefix"
 
 CURRENCY_EUR = "EUR"
 
+DATA_ORCHESTRATOR = "rootedtoon_orchestrator"
+
 DEFAULT_SCAN_INTERVAL = 10
+DEFAULT_MAX_CONCURRENT_UPDATES = 2
+DEFAULT_STALE_DATA_LIMIT = 300
+DEFAULT_RATE_LIMIT = 2.0
+MIN_RATE_LIMIT = 0.1
+DEFAULT_MQTT_TOPIC = "toon"
+DEFAULT_RECONCILE_INTERVAL = 900
+DEFAULT_MIN_SCAN_INTERVAL_FACTOR = 0.5
+DEFAULT_MAX_SCAN_INTERVAL_FACTOR = 6
+DEFAULT_P1_PUBLISH_INTERVAL = 60
+DEFAULT_P1_SAMPLE_INTERVAL = 2
+DEFAULT_BURST_IDLE_TIME = 300
+DEFAULT_BURST_INTERVAL = 5
 DEFAULT_MAX_TEMP = 30.0
 DEFAULT_MIN_TEMP = 6.0
 DEFAULT_NAME = "Toon"
@@ -43,24 +81,21 @@ DEFAULT_PORT = 80
 DEVICE_BOILER = "boiler"
 DEVICE_BOILER_MODULE = "boiler_module"
 DEVICE_ELECTRICITY = "electricity"
+DEVICE_GAS = "gas"
 DEVICE_P1_METER = "p1_meter"
 DEVICE_THERMOSTAT = "thermostat"
 
-ENECO = "Eneco"
+ENDPOINT_BOILER = "boiler"
+ENDPOINT_P1_METER = "p1_meter"
+ENDPOINT_PROGRAM = "program"
+ENDPOINT_THERMOSTAT = "thermostat"
 
-UPDATE_FUNC = "update_func"
-UPDATE_INTERVAL = "update_interval"
+ENECO = "Eneco"
 
-STATE_TO_PRESET_MODE_MAPPING = {
-    ACTIVE_STATE_AWAY: PRESET_AWAY,
-    ACTIVE_STATE_COMFORT: PRESET_COMFORT,
-    ACTIVE_STATE_HOME: PRESET_HOME,
-    ACTIVE_STATE_SLEEP: PRESET_SLEEP,
-}
+MAX_CONCURRENT_REQUESTS = 4
 
-PRESET_MODE_TO_STATE_MAPPING = {
-    value: key for key, value in STATE_TO_PRESET_MODE_MAPPING.items()
-}
+SIGNAL_SMART_PLUG_ADDED = "rootedtoon_smart_plug_added_{}"
+SIGNAL_SMART_PLUG_REMOVED = "rootedtoon_smart_plug_removed_{}_{}"
 
 VOLUME_CM3 = "CM3"
 VOLUME_LHOUR = "L/H"
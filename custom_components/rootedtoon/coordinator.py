@@ -1,106 +1,744 @@
 """Provides the Rooted Toon DataUpdateCoordinator."""
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Awaitable, Callable
 from datetime import datetime, timedelta
-from functools import reduce
-from math import gcd
 import logging
+from time import monotonic
+from typing import TYPE_CHECKING, Any, TypeVar
 
+from aiohttp import ClientError
 from rootedtoonapi import Devices, Toon, ToonError
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_HOST, CONF_PORT, CONF_SCAN_INTERVAL
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.const import CONF_HOST, CONF_PORT
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import async_create_clientsession
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
+from .adaptive import AdaptivePolling
+from .breaker import BREAKER_SOURCES, CircuitBreaker, CircuitOpenError
+from .burst import BurstSampler
+from .commands import ToonCommandQueue
+from .deadband import DeadbandCounters
 from .const import (
+    CONF_ADAPTIVE_POLLING,
+    CONF_BACKFILL_STATISTICS,
+    CONF_BURST_IDLE_TIME,
+    CONF_BURST_INTERVAL,
+    CONF_BURST_SAMPLING,
+    CONF_CONCURRENT_UPDATES,
     CONF_ENABLE_BOILER,
     CONF_ENABLE_P1_METER,
     CONF_ENABLE_PROGRAM,
+    CONF_MAX_CONCURRENT_UPDATES,
+    CONF_MAX_SCAN_INTERVAL_BOILER,
+    CONF_MAX_SCAN_INTERVAL_P1_METER,
+    CONF_MAX_SCAN_INTERVAL_PROGRAM,
+    CONF_MAX_SCAN_INTERVAL_THERMOSTAT,
+    CONF_MIN_SCAN_INTERVAL_BOILER,
+    CONF_MIN_SCAN_INTERVAL_P1_METER,
+    CONF_MIN_SCAN_INTERVAL_PROGRAM,
+    CONF_MIN_SCAN_INTERVAL_THERMOSTAT,
+    CONF_MQTT_TOPIC,
+    CONF_P1_PUBLISH_INTERVAL,
+    CONF_P1_SAMPLE_INTERVAL,
+    CONF_P1_SAMPLING,
+    CONF_PUSH_MODE,
+    CONF_RATE_LIMIT,
+    CONF_RECONCILE_INTERVAL,
     CONF_SCAN_INTERVAL_BOILER,
     CONF_SCAN_INTERVAL_P1_METER,
     CONF_SCAN_INTERVAL_PROGRAM,
     CONF_SCAN_INTERVAL_THERMOSTAT,
+    CONF_STALE_DATA_LIMIT,
+    DEFAULT_BURST_IDLE_TIME,
+    DEFAULT_BURST_INTERVAL,
+    DEFAULT_MAX_CONCURRENT_UPDATES,
+    DEFAULT_MAX_SCAN_INTERVAL_FACTOR,
+    DEFAULT_MIN_SCAN_INTERVAL_FACTOR,
+    DEFAULT_MQTT_TOPIC,
+    DEFAULT_P1_PUBLISH_INTERVAL,
+    DEFAULT_P1_SAMPLE_INTERVAL,
+    DEFAULT_RATE_LIMIT,
+    DEFAULT_RECONCILE_INTERVAL,
+    DEFAULT_STALE_DATA_LIMIT,
     DOMAIN,
-    UPDATE_INTERVAL,
-    UPDATE_FUNC,
+    ENDPOINT_BOILER,
+    ENDPOINT_P1_METER,
+    ENDPOINT_PROGRAM,
+    ENDPOINT_THERMOSTAT,
+    MIN_RATE_LIMIT,
+    SIGNAL_SMART_PLUG_ADDED,
+    SIGNAL_SMART_PLUG_REMOVED,
 )
+from .factory import ToonEntityFactory
+from .flow import FlowRate
+from .metrics import create_trace_config, track_request
+from .orchestrator import PollingOrchestrator
+from .persist import SNAPSHOT_SAVE_INTERVAL, ToonSnapshotStore
+from .push import PUSH_ENDPOINTS, ToonPushUpdates
+from .ratelimit import PRIORITY_POLL, PRIORITY_WRITE, TokenBucketRateLimiter
+from .sampling import P1Sampler
+from .scheduler import DeadlineScheduler, ToonEndpoint
+from .util import changed_contexts, device_snapshot
+
+if TYPE_CHECKING:
+    from homeassistant.components.mqtt import ReceiveMessage
+
+    from .backfill import ToonStatisticsBackfill
 
 _LOGGER = logging.getLogger(__name__)
 
+# Pushed values arrive in bursts, which are flushed to the entities at once.
+PUSH_FLUSH_DELAY = 0.1
+
+# Endpoints with lists of devices, which the stored snapshot cannot rebuild.
+UNRESTORED_ENDPOINTS = (ENDPOINT_PROGRAM,)
+
+# The circuit breaker sources of the thermostat commands and the history requests.
+COMMAND_SOURCE = "command"
+HISTORY_SOURCE = "history"
+
+_T = TypeVar("_T")
+
 
 class RootedToonDataUpdateCoordinator(DataUpdateCoordinator[Devices]):
     """Class to manage fetching Toon data from single endpoint."""
 
-    def __init__(self, hass: HomeAssistant, *, entry: ConfigEntry) -> None:
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        *,
+        entry: ConfigEntry,
+        orchestrator: PollingOrchestrator,
+    ) -> None:
         """Initialize global Toon data updater."""
         self.entry = entry
+        self.orchestrator = orchestrator
         self.config = entry.data
-        self.update_tick: int = 0
+        self.entity_factory = ToonEntityFactory(self.config)
+
+        self.concurrent_updates: bool = self.config.get(CONF_CONCURRENT_UPDATES, False)
+        # Entries stored before the option was validated may hold 0.
+        self._update_semaphore = asyncio.Semaphore(
+            max(
+                int(
+                    self.config.get(
+                        CONF_MAX_CONCURRENT_UPDATES, DEFAULT_MAX_CONCURRENT_UPDATES
+                    )
+                ),
+                1,
+            )
+        )
+        self.last_update_duration: float = 0.0
+        self.last_update_saving: float = 0.0
+        self.total_update_saving: float = 0.0
+        self.stale_data_limit = int(
+            self.config.get(CONF_STALE_DATA_LIMIT, DEFAULT_STALE_DATA_LIMIT)
+        )
+        self._available_endpoints: set[str] = set()
+        self._restored_endpoints: set[str] = set()
+        self.rate_limiter = TokenBucketRateLimiter(
+            max(
+                float(self.config.get(CONF_RATE_LIMIT, DEFAULT_RATE_LIMIT)),
+                MIN_RATE_LIMIT,
+            )
+        )
 
+        # Save well within the stale data limit, so a restart can use the snapshot.
+        self.snapshot_store = ToonSnapshotStore(
+            hass,
+            entry.entry_id,
+            min(SNAPSHOT_SAVE_INTERVAL, self.stale_data_limit / 2),
+        )
+        self.deadband = DeadbandCounters()
+        self.commands = ToonCommandQueue(
+            lambda command: self.async_send_command(command.func, *command.args),
+            lambda: self.async_refresh_endpoint(ENDPOINT_THERMOSTAT),
+        )
+        self._snapshot: dict = {}
+        self._devices_snapshot: dict = {}
+        self._devices_revisions: tuple[int, ...] | None = None
+        self._changed_contexts: set | None = None
+        self._notified_success: bool | None = None
+
+        self.session = async_create_clientsession(
+            hass, trace_configs=[create_trace_config()]
+        )
         self.toon = Toon(
             host=self.config.get(CONF_HOST),
             port=self.config.get(CONF_PORT),
-            session=async_get_clientsession(hass),
+            session=self.session,
         )
 
+        # In sampling mode the P1 meter is polled at the sample interval and its
+        # power is only published once per publish interval.
+        p1_meter_interval = int(self.config.get(CONF_SCAN_INTERVAL_P1_METER))
+        self.p1_sampler: P1Sampler | None = None
+        if self.config.get(CONF_ENABLE_P1_METER) and self.config.get(CONF_P1_SAMPLING):
+            p1_meter_interval = int(
+                self.config.get(CONF_P1_SAMPLE_INTERVAL, DEFAULT_P1_SAMPLE_INTERVAL)
+            )
+            self.p1_sampler = P1Sampler(
+                p1_meter_interval,
+                int(
+                    self.config.get(
+                        CONF_P1_PUBLISH_INTERVAL, DEFAULT_P1_PUBLISH_INTERVAL
+                    )
+                ),
+                monotonic(),
+            )
+
+        # In burst mode the thermostat is polled fast while the boiler burns.
+        self.burst: BurstSampler | None = None
+        if self.config.get(CONF_BURST_SAMPLING):
+            self.burst = BurstSampler(
+                int(self.config.get(CONF_BURST_INTERVAL, DEFAULT_BURST_INTERVAL)),
+                int(self.config.get(CONF_BURST_IDLE_TIME, DEFAULT_BURST_IDLE_TIME)),
+            )
+        self._interval_before_burst = float(
+            self.config.get(CONF_SCAN_INTERVAL_THERMOSTAT)
+        )
+
+        self.gas_flow = FlowRate()
+        self.smart_plugs: dict[str, Any] = {}
+
         devices = (
             (
                 self.config.get(CONF_ENABLE_BOILER),
+                ENDPOINT_BOILER,
                 int(self.config.get(CONF_SCAN_INTERVAL_BOILER)),
                 self.toon.update_boiler,
+                CONF_MIN_SCAN_INTERVAL_BOILER,
+                CONF_MAX_SCAN_INTERVAL_BOILER,
             ),
             (
                 self.config.get(CONF_ENABLE_P1_METER),
-                int(self.config.get(CONF_SCAN_INTERVAL_P1_METER)),
+                ENDPOINT_P1_METER,
+                p1_meter_interval,
                 self.toon.update_energy_meter,
+                CONF_MIN_SCAN_INTERVAL_P1_METER,
+                CONF_MAX_SCAN_INTERVAL_P1_METER,
             ),
             (
                 self.config.get(CONF_ENABLE_PROGRAM),
+                ENDPOINT_PROGRAM,
                 int(self.config.get(CONF_SCAN_INTERVAL_PROGRAM)),
                 self.toon.update_program,
+                CONF_MIN_SCAN_INTERVAL_PROGRAM,
+                CONF_MAX_SCAN_INTERVAL_PROGRAM,
             ),
             (
                 True,
+                ENDPOINT_THERMOSTAT,
                 int(self.config.get(CONF_SCAN_INTERVAL_THERMOSTAT)),
                 self.toon.update_climate,
+                CONF_MIN_SCAN_INTERVAL_THERMOSTAT,
+                CONF_MAX_SCAN_INTERVAL_THERMOSTAT,
             ),
         )
 
-        update_intervals = [device[1] for device in devices if device[0]]
-        common_update_interval = reduce(gcd, update_intervals)
-
-        self.update_intervals = [
-            {
-                UPDATE_INTERVAL: device[1] / common_update_interval,
-                UPDATE_FUNC: device[2],
-            }
-            for device in devices
-            if device[0]
-        ]
+        self.adaptive = (
+            AdaptivePolling() if self.config.get(CONF_ADAPTIVE_POLLING) else None
+        )
+        endpoints = []
+        for enabled, name, interval, update_func, min_key, max_key in devices:
+            if not enabled:
+                continue
+            endpoint = ToonEndpoint(name=name, interval=interval, update_func=update_func)
+            if self.adaptive is not None:
+                endpoint.min_interval = self.config.get(
+                    min_key, interval * DEFAULT_MIN_SCAN_INTERVAL_FACTOR
+                )
+                endpoint.max_interval = self.config.get(
+                    max_key, interval * DEFAULT_MAX_SCAN_INTERVAL_FACTOR
+                )
+            endpoints.append(endpoint)
 
-        self.max_tick_size = max(
-            update_interval.get(UPDATE_INTERVAL)
-            for update_interval in self.update_intervals
+        self.scheduler = DeadlineScheduler(endpoints, monotonic())
+        self.endpoints = self.scheduler.endpoints
+        self.breaker = CircuitBreaker(
+            sources=min(BREAKER_SOURCES, len(self.endpoints))
         )
 
+        # In push mode the MQTT bridge updates the devices and polls only reconcile.
+        self.push: ToonPushUpdates | None = None
+        if self.config.get(CONF_PUSH_MODE):
+            self.push = ToonPushUpdates(
+                self.config.get(CONF_MQTT_TOPIC, DEFAULT_MQTT_TOPIC),
+                {name for name in PUSH_ENDPOINTS if name in self.endpoints},
+            )
+        self._pushed_endpoints: set[str] = set()
+        self._unsub_push_flush: CALLBACK_TYPE | None = None
+
+        self.backfill: ToonStatisticsBackfill | None = None
+        if self.config.get(CONF_BACKFILL_STATISTICS):
+            # Only import the recorder when the history of the Toon is imported.
+            from .backfill import (  # pylint: disable=import-outside-toplevel
+                ToonStatisticsBackfill,
+            )
+
+            self.backfill = ToonStatisticsBackfill(self)
+
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(seconds=common_update_interval),
+            update_interval=timedelta(
+                seconds=min(endpoint.interval for endpoint in self.endpoints.values())
+            ),
+        )
+
+    def endpoint_available(self, name: str | None) -> bool:
+        """Return if the data of an endpoint is available."""
+        return name in self._available_endpoints or name not in self.endpoints
+
+    def endpoint_restored(self, name: str | None) -> bool:
+        """Return if the data of an endpoint is restored and not polled yet."""
+        return name in self._restored_endpoints
+
+    async def async_send_command(
+        self, command: Callable[..., Awaitable[Any]], *args: Any
+    ) -> None:
+        """Send a command to the Toon ahead of any queued polls."""
+        if not self.breaker.allow(monotonic()):
+            raise CircuitOpenError("The Toon is not responding")
+        await self.rate_limiter.acquire(PRIORITY_WRITE)
+        try:
+            await command(*args)
+        except ToonError:
+            self.breaker.record_failure(monotonic(), COMMAND_SOURCE)
+            raise
+        self.breaker.record_success()
+
+    @callback
+    def async_queue_command(
+        self,
+        kind: str,
+        command: Callable[..., Awaitable[Any]],
+        *args: Any,
+        overlay: dict[str, Any],
+    ) -> None:
+        """Queue a thermostat command and show the values it sets until it is sent."""
+        self.commands.enqueue(kind, command, *args, overlay=overlay)
+        self.commands.start(
+            lambda coro: self.hass.async_create_background_task(
+                coro, f"{DOMAIN} thermostat commands"
+            )
         )
+        self.async_notify_changed()
+
+    async def _async_update_endpoint(self, endpoint: ToonEndpoint) -> float:
+        """Run a single endpoint update and return its duration."""
+        queued = monotonic()
+        async with self._update_semaphore:
+            now = monotonic()
+            if not self.breaker.allow(now, probe=endpoint.name == ENDPOINT_THERMOSTAT):
+                self._hold_endpoint(endpoint)
+                return 0.0
+
+            await self.rate_limiter.acquire(PRIORITY_POLL)
+            async with self.orchestrator.async_request(endpoint):
+                endpoint.start_delay = endpoint.lateness + monotonic() - queued
+                with track_request() as request:
+                    start = monotonic()
+                    try:
+                        await endpoint.update_func()
+                    except ToonError as error:
+                        endpoint.failures += 1
+                        endpoint.total_failures += 1
+                        endpoint.last_error = str(error)
+                        self.breaker.record_failure(monotonic(), endpoint.name)
+                    else:
+                        self._record_success(endpoint)
+                        if endpoint.failures:
+                            _LOGGER.info(
+                                "Fetching %s endpoint recovered", endpoint.name
+                            )
+                        endpoint.failures = 0
+                        endpoint.restored = False
+                        endpoint.last_error = None
+                        endpoint.last_success = monotonic()
+                        endpoint.last_success_time = dt_util.utcnow()
+                        endpoint.successes += 1
+                        endpoint.record_content(request.content_hash)
+                    duration = monotonic() - start
+
+            endpoint.record_request(
+                duration,
+                duration if request.http_time is None else request.http_time,
+                request.size,
+            )
+
+            if self.adaptive is not None and not self._bursting(endpoint):
+                self.orchestrator.async_set_interval(
+                    self,
+                    endpoint,
+                    self.adaptive.adapt(
+                        endpoint, duration, endpoint.failures > 0, self.toon._devices
+                    ),
+                )
+
+            if endpoint.failures and self.breaker.closed:
+                delay = self.scheduler.backoff(endpoint, monotonic())
+                _LOGGER.log(
+                    logging.WARNING if endpoint.failures == 1 else logging.DEBUG,
+                    "Invalid response from %s endpoint, retrying in %.0f seconds: %s",
+                    endpoint.name,
+                    delay,
+                    endpoint.last_error,
+                )
+            elif endpoint.failures:
+                self._hold_endpoint(endpoint)
+
+            return duration
+
+    async def async_history_request(
+        self, request: Callable[[], Awaitable[_T]]
+    ) -> _T:
+        """Send a history request like a poll, through the breaker and the slots."""
+        async with self._update_semaphore:
+            if not self.breaker.allow(monotonic()):
+                raise CircuitOpenError("The Toon is not responding")
+            await self.rate_limiter.acquire(PRIORITY_POLL)
+            async with self.orchestrator.async_request():
+                try:
+                    result = await request()
+                except (ClientError, TimeoutError):
+                    self.breaker.record_failure(monotonic(), HISTORY_SOURCE)
+                    raise
+                self._record_success()
+                return result
+
+    def _record_success(self, polled: ToonEndpoint | None = None) -> None:
+        """Record a response of the Toon, resuming the endpoints held back."""
+        if self.breaker.record_success():
+            for endpoint in self.endpoints.values():
+                if endpoint is not polled:
+                    self.scheduler.schedule(endpoint, monotonic())
+
+    def _hold_endpoint(self, endpoint: ToonEndpoint) -> None:
+        """Hold an endpoint back while the circuit breaker is open."""
+        # The small thermostat poll probes if the Toon is back, the others wait.
+        if endpoint.name == ENDPOINT_THERMOSTAT:
+            self.scheduler.schedule(endpoint, self.breaker.probe_at)
+        else:
+            self.scheduler.schedule(endpoint, self.breaker.probe_at + endpoint.interval)
 
     async def _async_update_data(self) -> Devices:
         """Fetch data from Toon."""
         try:
-            for update in self.update_intervals:
-                if self.update_tick % update.get(UPDATE_INTERVAL) == 0:
-                    await update.get(UPDATE_FUNC)()
+            return await self._async_update_due()
+        finally:
+            # Only wake up again once the next endpoint is actually due.
+            self.update_interval = timedelta(
+                seconds=self.scheduler.delay(monotonic())
+            )
+
+    async def _async_update_due(self) -> Devices:
+        """Fetch the endpoints that are due from Toon."""
+        due = self.scheduler.pop_due(monotonic())
+        for endpoint in due:
+            _LOGGER.debug(
+                "Updating %s endpoint (lateness %.3f seconds, jitter %.3f seconds)",
+                endpoint.name,
+                endpoint.lateness,
+                endpoint.jitter,
+            )
+
+        start = monotonic()
+        if self.concurrent_updates:
+            durations = await asyncio.gather(
+                *(self._async_update_endpoint(endpoint) for endpoint in due)
+            )
+        else:
+            durations = [await self._async_update_endpoint(endpoint) for endpoint in due]
+
+        # The serial path would have taken the sum of all request durations.
+        self.last_update_duration = monotonic() - start
+        self.last_update_saving = max(sum(durations) - self.last_update_duration, 0.0)
+        self.total_update_saving += self.last_update_saving
+        _LOGGER.debug(
+            "Updated %d endpoint(s) in %.3f seconds (%.3f seconds saved)",
+            len(due),
+            self.last_update_duration,
+            self.last_update_saving,
+        )
+
+        p1_meter = self.endpoints.get(ENDPOINT_P1_METER)
+        self._async_process_p1_meter(
+            monotonic(),
+            p1_meter is not None and p1_meter in due and not p1_meter.failures,
+        )
+
+        thermostat = self.endpoints[ENDPOINT_THERMOSTAT]
+        self._async_process_thermostat(
+            monotonic(), thermostat in due and not thermostat.failures
+        )
+
+        if due and not any(endpoint.failures for endpoint in due):
+            self.snapshot_store.async_save(self.toon._devices)
+        self._async_diff_data()
+        if not self._available_endpoints:
+            errors = ", ".join(
+                f"{endpoint.name}: {endpoint.last_error}"
+                for endpoint in self.endpoints.values()
+                if endpoint.last_error
+            )
+            raise UpdateFailed(f"Invalid response from API: {errors}")
+
+        return self.toon._devices
+
+    @callback
+    def _async_process_p1_meter(self, now: float, updated: bool) -> None:
+        """Derive the gas flow and the power samples from new P1 meter data."""
+        if updated:
+            self._async_update_smart_plugs()
+            devices = self.toon._devices.p1_meter
+            if devices.gas_meter.available:
+                self.gas_flow.add(now, devices.gas_meter.total)
+            if self.p1_sampler is not None:
+                self.p1_sampler.add(now, devices.electricity_meter)
+        if self.p1_sampler is not None and self.p1_sampler.due(now):
+            self.p1_sampler.publish(now)
+
+    @callback
+    def _async_process_thermostat(self, now: float, updated: bool) -> None:
+        """Sample new thermostat data and poll fast while the boiler burns."""
+        if self.burst is None or not updated:
+            return
+
+        endpoint = self.endpoints[ENDPOINT_THERMOSTAT]
+        changed = self.burst.add(now, self.toon._devices.thermostat)
+        if (
+            self.push is not None
+            and self.push.subscribed
+            and ENDPOINT_THERMOSTAT in self.push.endpoints
+        ):
+            # The thermostat is pushed, its polls only reconcile at a fixed interval.
+            return
+
+        if changed and self.burst.statistics.bursting:
+            _LOGGER.debug("Boiler burns, sampling the thermostat fast")
+            self._interval_before_burst = endpoint.interval
+            self.orchestrator.async_set_interval(
+                self, endpoint, self.burst.burst_interval
+            )
+        elif changed:
+            _LOGGER.debug("Boiler is idle, sampling the thermostat slowly again")
+            self.orchestrator.async_set_interval(
+                self, endpoint, self._interval_before_burst
+            )
+
+    def _bursting(self, endpoint: ToonEndpoint) -> bool:
+        """Return if burst sampling sets the interval of an endpoint."""
+        return (
+            self.burst is not None
+            and self.burst.statistics.bursting
+            and endpoint.name == ENDPOINT_THERMOSTAT
+        )
+
+    @callback
+    def _async_update_smart_plugs(self) -> None:
+        """Index the smart plugs and announce the ones (un)paired since the last poll."""
+        smart_plugs = {
+            smart_plug.name: smart_plug
+            for smart_plug in self.toon._devices.smart_plugs.devices or ()
+        }
+        entry_id = self.entry.entry_id
+        for name, smart_plug in smart_plugs.items():
+            if name not in self.smart_plugs:
+                async_dispatcher_send(
+                    self.hass, SIGNAL_SMART_PLUG_ADDED.format(entry_id), smart_plug
+                )
+        for name in self.smart_plugs.keys() - smart_plugs.keys():
+            async_dispatcher_send(
+                self.hass, SIGNAL_SMART_PLUG_REMOVED.format(entry_id, name)
+            )
+        self.smart_plugs = smart_plugs
+
+    @callback
+    def _async_diff_data(self) -> None:
+        """Determine the available endpoints and the changed data."""
+        # A poll must not undo a command that is still on its way to the Toon, so
+        # the thermostat differs from its last response until the next one.
+        if self.commands.pending:
+            self.commands.apply_pending(self.toon._devices.thermostat)
+            self.endpoints[ENDPOINT_THERMOSTAT].record_content(None)
+
+        now = monotonic()
+        available = {
+            endpoint.name
+            for endpoint in self.endpoints.values()
+            if endpoint.available(now, self.stale_data_limit)
+        }
+        restored = {
+            endpoint.name for endpoint in self.endpoints.values() if endpoint.restored
+        }
+        # Every entity of an endpoint changes when it becomes (un)available or live.
+        status_changed = (
+            available != self._available_endpoints
+            or restored != self._restored_endpoints
+        )
+        self._available_endpoints = available
+        self._restored_endpoints = restored
+
+        # Only walk the devices again when a response differed from the last one.
+        changed: set = set()
+        revisions = tuple(endpoint.revision for endpoint in self.endpoints.values())
+        if revisions != self._devices_revisions:
+            devices_snapshot = device_snapshot(self.toon._devices)
+            changed = changed_contexts(self._devices_snapshot, devices_snapshot)
+            self._devices_snapshot = devices_snapshot
+            self._devices_revisions = revisions
+
+        snapshot = device_snapshot(
+            self.rate_limiter,
+            self.breaker,
+            self.deadband,
+            *self.endpoints.values(),
+            self.gas_flow,
+            self.snapshot_store.state,
+            *((self.backfill.progress,) if self.backfill else ()),
+            *(self.p1_sampler.aggregates.values() if self.p1_sampler else ()),
+            *((self.burst.statistics,) if self.burst else ()),
+        )
+        changed.update(changed_contexts(self._snapshot, snapshot))
+        self._changed_contexts = None if status_changed else changed
+        self._snapshot = snapshot
+
+    async def async_restore(self) -> bool:
+        """Restore the last stored data, to set up without waiting for the Toon."""
+        if not await self.snapshot_store.async_restore(
+            self.toon._devices, self.stale_data_limit
+        ):
+            return False
+
+        # The restored data counts as good data until it is older than the stale
+        # data limit, the program is a list of events that is not stored.
+        saved = self.snapshot_store.state.saved
+        assert saved is not None
+        last_success = monotonic() - max((dt_util.utcnow() - saved).total_seconds(), 0)
+        for endpoint in self.endpoints.values():
+            if endpoint.name in UNRESTORED_ENDPOINTS:
+                continue
+            endpoint.last_success = last_success
+            endpoint.last_success_time = saved
+            endpoint.restored = True
+            endpoint.record_content(None)
+        self._async_diff_data()
+        self.async_set_updated_data(self.toon._devices)
+        return True
+
+    async def async_refresh_endpoint(self, name: str) -> None:
+        """Refresh a single endpoint and notify the listeners of changed data."""
+        endpoint = self.endpoints[name]
+        await self._async_update_endpoint(endpoint)
+        if not endpoint.failures and self.breaker.closed:
+            self.scheduler.schedule(endpoint, monotonic() + endpoint.interval)
+
+        self._async_diff_data()
+        self.async_update_listeners()
+
+    async def async_start_push(self) -> None:
+        """Subscribe to the MQTT bridge of the Toon and poll pushed endpoints slowly."""
+        if self.push is None:
+            return
+
+        # Only import the MQTT integration when push mode is used.
+        from homeassistant.components import mqtt  # pylint: disable=import-outside-toplevel
+
+        if not await mqtt.async_wait_for_mqtt_client(self.hass):
+            _LOGGER.warning(
+                "MQTT is not available, polling the Toon instead of subscribing to %s",
+                self.push.subscription,
+            )
+            return
+
+        self.entry.async_on_unload(
+            await mqtt.async_subscribe(
+                self.hass, self.push.subscription, self._async_handle_message
+            )
+        )
+        self.push.subscribed = True
+
+        reconcile_interval = int(
+            self.config.get(CONF_RECONCILE_INTERVAL, DEFAULT_RECONCILE_INTERVAL)
+        )
+        for name in self.push.endpoints:
+            endpoint = self.endpoints[name]
+            if endpoint.interval < reconcile_interval:
+                endpoint.min_interval = endpoint.max_interval = reconcile_interval
+                self.orchestrator.async_set_interval(
+                    self, endpoint, reconcile_interval
+                )
+
+    @callback
+    def _async_handle_message(self, message: ReceiveMessage) -> None:
+        """Apply a pushed value and flush it together with the rest of its burst."""
+        assert self.push is not None
+        name = self.push.apply(self.toon._devices, message.topic, message.payload)
+        if name is None:
+            return
+
+        # A pushed value is as good as a successful poll of its endpoint, and
+        # the next poll is never unchanged compared to the data before it.
+        endpoint = self.endpoints[name]
+        endpoint.record_content(None)
+        endpoint.last_success = monotonic()
+        endpoint.last_success_time = self.push.last_message = dt_util.utcnow()
+        self._pushed_endpoints.add(name)
+        if self._unsub_push_flush is None:
+            self._unsub_push_flush = async_call_later(
+                self.hass, PUSH_FLUSH_DELAY, self._async_flush_push
+            )
+
+    @callback
+    def _async_flush_push(self, _now: datetime) -> None:
+        """Notify the listeners of the values pushed since the last flush."""
+        self._unsub_push_flush = None
+        pushed, self._pushed_endpoints = self._pushed_endpoints, set()
+        self._async_process_p1_meter(monotonic(), ENDPOINT_P1_METER in pushed)
+        self.snapshot_store.async_save(self.toon._devices)
+        self.async_notify_changed()
+
+    @callback
+    def async_notify_changed(self) -> None:
+        """Notify the listeners of data that changed outside of a refresh."""
+        self._async_diff_data()
+        self.async_update_listeners()
+
+    @callback
+    def async_reschedule(self) -> None:
+        """Wake up for the next due endpoint after deadlines were moved."""
+        self.update_interval = timedelta(seconds=self.scheduler.delay(monotonic()))
+        if self._listeners:
+            self._schedule_refresh()
+
+    async def async_shutdown(self) -> None:
+        """Cancel any scheduled call, and close the session."""
+        if self._unsub_push_flush is not None:
+            self._unsub_push_flush()
+            self._unsub_push_flush = None
+        self.commands.cancel()
+        self.snapshot_store.async_flush(self.toon._devices)
+        await super().async_shutdown()
+        await self.session.close()
 
-            self.update_tick = (self.update_tick + 1) % self.max_tick_size
-            return self.toon._devices
+    @callback
+    def async_update_listeners(self) -> None:
+        """Notify the listeners whose data changed since the last refresh."""
+        changed, self._changed_contexts = self._changed_contexts, None
+        if changed is None or self._notified_success is not self.last_update_success:
+            self._notified_success = self.last_update_success
+            super().async_update_listeners()
+            return
 
-        except ToonError as error:
-            raise UpdateFailed(f"Invalid response from API: {error}") from error
+        for update_callback, context in list(self._listeners.values()):
+            if context is None or context in changed:
+                update_callback()
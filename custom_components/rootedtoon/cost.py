@@ -0,0 +1,48 @@
+"""Incremental energy cost from meter counter deltas."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import time
+
+
+@dataclass
+class TimeOfUsePrice:
+    """Price of a tariff, optionally with an off-peak price."""
+
+    price: float
+    off_peak_price: float | None = None
+    off_peak_start: time | None = None
+    off_peak_end: time | None = None
+
+    def price_at(self, moment: time) -> float:
+        """Return the price at a time of day."""
+        start, end = self.off_peak_start, self.off_peak_end
+        if self.off_peak_price is None or start is None or end is None:
+            return self.price
+
+        if start <= end:
+            off_peak = start <= moment < end
+        else:
+            off_peak = moment >= start or moment < end
+        return self.off_peak_price if off_peak else self.price
+
+
+@dataclass
+class CostCounter:
+    """Running cost of a meter counter."""
+
+    total: float = 0.0
+    reading: float | None = None
+
+    def add(self, reading: float | None, price: float) -> bool:
+        """Add the cost of the usage since the previous reading."""
+        if reading is None:
+            return False
+
+        previous, self.reading = self.reading, reading
+        # Start counting from the first reading and after a meter reset.
+        if previous is None or reading <= previous:
+            return False
+
+        self.total += (reading - previous) * price
+        return True
@@ -0,0 +1,87 @@
+"""Significant-change filtering of sensor state writes."""
+from __future__ import annotations
+
+from collections import Counter
+from dataclasses import dataclass
+
+from homeassistant.components.sensor import SensorDeviceClass
+
+DEFAULT_HEARTBEAT = 300.0
+# Sensor values are decimals, so a step of exactly the band can be off by a bit.
+DEADBAND_EPSILON = 1e-9
+
+
+@dataclass(frozen=True)
+class Deadband:
+    """Describes the changes of a sensor value that are too small to write."""
+
+    absolute: float = 0.0
+    relative: float = 0.0
+    heartbeat: float = DEFAULT_HEARTBEAT
+
+    def threshold(self, last: float) -> float:
+        """Return the smallest change of the last written value that is written."""
+        return max(self.absolute, self.relative * abs(last))
+
+
+# Totals, costs and diagnostics are written as they are, so no change is lost.
+DEFAULT_DEADBANDS: dict[SensorDeviceClass, Deadband] = {
+    SensorDeviceClass.TEMPERATURE: Deadband(absolute=0.1),
+    SensorDeviceClass.PRESSURE: Deadband(absolute=0.05),
+    SensorDeviceClass.POWER: Deadband(absolute=5.0, relative=0.02),
+}
+
+
+class DeadbandCounters:
+    """Counters of the state writes of the sensors that have a deadband."""
+
+    def __init__(self) -> None:
+        """Initialize the counters."""
+        self.written = 0
+        self.suppressed = 0
+        self.per_entity: Counter[str] = Counter()
+
+
+class DeadbandFilter:
+    """Decide which values of a single sensor are significant enough to write."""
+
+    def __init__(self, deadband: Deadband, counters: DeadbandCounters) -> None:
+        """Initialize the filter."""
+        self.deadband = deadband
+        self._counters = counters
+        self._value: float | None = None
+        self._written_at = 0.0
+
+    def reset(self) -> None:
+        """Write the next value, whatever it is."""
+        self._value = None
+
+    def should_write(self, value: object, now: float) -> bool:
+        """Return if a value differs enough from the last written value."""
+        return (
+            self._value is None
+            or not isinstance(value, (int, float))
+            or isinstance(value, bool)
+            or now - self._written_at >= self.deadband.heartbeat
+            or abs(value - self._value)
+            >= self.deadband.threshold(self._value) - DEADBAND_EPSILON
+        )
+
+    def heartbeat_in(self, now: float) -> float:
+        """Return the number of seconds until an in-band value is written anyway."""
+        return max(self._written_at + self.deadband.heartbeat - now, 0.0)
+
+    def written(self, value: object, now: float) -> None:
+        """Record a written value."""
+        self._counters.written += 1
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            self._value = float(value)
+            self._written_at = now
+        else:
+            self._value = None
+
+    def suppressed(self, entity_id: str | None) -> None:
+        """Record a value that was not written."""
+        self._counters.suppressed += 1
+        if entity_id is not None:
+            self._counters.per_entity[entity_id] += 1
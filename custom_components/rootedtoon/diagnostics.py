@@ -0,0 +1,128 @@
+"""Diagnostics support for Toon."""
+from __future__ import annotations
+
+from dataclasses import asdict
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_HOST
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+from .coordinator import RootedToonDataUpdateCoordinator
+from .metrics import LATENCY_BUCKETS
+
+TO_REDACT = {CONF_HOST}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator: RootedToonDataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
+    rate_limiter = coordinator.rate_limiter
+
+    return {
+        "entry": async_redact_data(entry.data, TO_REDACT),
+        "endpoints": {
+            name: {
+                "available": coordinator.endpoint_available(name),
+                "interval": endpoint.interval,
+                "lateness": endpoint.lateness,
+                "jitter": endpoint.jitter,
+                "phase": endpoint.phase,
+                "start_delay": endpoint.start_delay,
+                "in_flight": endpoint.in_flight,
+                "successes": endpoint.successes,
+                "failures": endpoint.total_failures,
+                "consecutive_failures": endpoint.failures,
+                "last_error": endpoint.last_error,
+                "last_success": endpoint.last_success_time,
+                "request_latency": endpoint.request_latency,
+                "parse_time": endpoint.parse_time,
+                "response_size": endpoint.response_size,
+                "revision": endpoint.revision,
+                "unchanged": endpoint.unchanged,
+                "latency_histogram": dict(
+                    zip([*map(str, LATENCY_BUCKETS), "inf"], endpoint.latency_histogram)
+                ),
+            }
+            for name, endpoint in coordinator.endpoints.items()
+        },
+        "rate_limiter": {
+            "requests": rate_limiter.requests,
+            "queued": rate_limiter.queued,
+            "average_delay": rate_limiter.average_delay,
+            "max_delay": rate_limiter.max_delay,
+        },
+        "p1_sampler": (
+            {
+                "samples": coordinator.p1_sampler.samples,
+                "publishes": coordinator.p1_sampler.publishes,
+            }
+            if coordinator.p1_sampler
+            else None
+        ),
+        "push": (
+            {
+                "topic": coordinator.push.subscription,
+                "subscribed": coordinator.push.subscribed,
+                "messages": coordinator.push.messages,
+                "ignored": coordinator.push.ignored,
+                "last_message": coordinator.push.last_message,
+            }
+            if coordinator.push
+            else None
+        ),
+        "burst": (
+            {
+                **asdict(coordinator.burst.statistics),
+                "bursts": coordinator.burst.bursts,
+                "samples_total": coordinator.burst.samples,
+            }
+            if coordinator.burst
+            else None
+        ),
+        "breaker": {
+            "state": coordinator.breaker.state,
+            "consecutive_failures": coordinator.breaker.failures,
+            "trips": coordinator.breaker.trips,
+            "rejected": coordinator.breaker.rejected,
+            "last_change": coordinator.breaker.last_change,
+        },
+        "deadband": {
+            "written": coordinator.deadband.written,
+            "suppressed": coordinator.deadband.suppressed,
+            "suppressed_per_entity": dict(coordinator.deadband.per_entity),
+        },
+        "commands": {
+            "pending": [
+                {
+                    "kind": command.kind,
+                    "attempts": command.attempts,
+                    "last_error": command.last_error,
+                }
+                for command in coordinator.commands.pending
+            ],
+            "sent": coordinator.commands.sent,
+            "retries": coordinator.commands.retries,
+            "superseded": coordinator.commands.superseded,
+            "failed": coordinator.commands.failed,
+            "last_error": coordinator.commands.last_error,
+        },
+        "backfill": (
+            asdict(coordinator.backfill.progress) if coordinator.backfill else None
+        ),
+        "snapshot": {
+            "restored": coordinator.snapshot_store.state.restored,
+            "saved": coordinator.snapshot_store.state.saved,
+        },
+        "orchestrator": {
+            "max_requests": coordinator.orchestrator.max_requests,
+            "in_flight": coordinator.orchestrator.in_flight,
+            "max_in_flight": coordinator.orchestrator.max_in_flight,
+        },
+        "last_update_duration": coordinator.last_update_duration,
+        "total_update_saving": coordinator.total_update_saving,
+    }
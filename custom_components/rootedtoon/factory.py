@@ -0,0 +1,129 @@
+"""Precomputed names, unique IDs, accessors and devices of Toon entities."""
+from __future__ import annotations
+
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from operator import attrgetter
+from typing import Any
+
+from homeassistant.const import CONF_NAME, Platform
+from homeassistant.helpers.entity import DeviceInfo, EntityDescription
+
+from .const import (
+    CONF_BOILER_PREFIX,
+    CONF_BOILER_SUFFIX,
+    CONF_P1_METER_PREFIX,
+    CONF_P1_METER_SUFFIX,
+    CONF_THERMOSTAT_PREFIX,
+    CONF_THERMOSTAT_SUFFIX,
+    DEVICE_BOILER,
+    DEVICE_BOILER_MODULE,
+    DEVICE_ELECTRICITY,
+    DEVICE_GAS,
+    DEVICE_P1_METER,
+    DEVICE_THERMOSTAT,
+    DOMAIN,
+    ENECO,
+)
+from .util import upper_first
+
+AFFIXES = {
+    DEVICE_BOILER: (CONF_BOILER_PREFIX, CONF_BOILER_SUFFIX),
+    DEVICE_P1_METER: (CONF_P1_METER_PREFIX, CONF_P1_METER_SUFFIX),
+    DEVICE_THERMOSTAT: (CONF_THERMOSTAT_PREFIX, CONF_THERMOSTAT_SUFFIX),
+}
+
+
+@dataclass(frozen=True)
+class EntitySpec:
+    """Precomputed attributes of a Toon entity."""
+
+    name: str
+    unique_id: str
+    value: Callable[[Any], Any]
+
+
+def _device_infos(config: Mapping[str, Any]) -> dict[str | None, DeviceInfo]:
+    """Return the device info of every Toon device, the Toon itself as None."""
+    conf_name = config.get(CONF_NAME)
+
+    def name(affixes: str, device: str) -> str:
+        prefix, suffix = AFFIXES[affixes]
+        return upper_first(f"{config.get(prefix)} {device} {config.get(suffix)}")
+
+    return {
+        None: DeviceInfo(
+            name=conf_name,
+            identifiers={(DOMAIN, conf_name)},  # type: ignore[arg-type]
+        ),
+        DEVICE_THERMOSTAT: DeviceInfo(
+            name=name(DEVICE_THERMOSTAT, "thermostat"),
+            identifiers={(DOMAIN, conf_name, DEVICE_THERMOSTAT)},  # type: ignore[arg-type]
+            via_device=(DOMAIN, conf_name),  # type: ignore[typeddict-item]
+        ),
+        DEVICE_ELECTRICITY: DeviceInfo(
+            name=name(DEVICE_P1_METER, "electricity meter"),
+            identifiers={(DOMAIN, conf_name, DEVICE_ELECTRICITY)},  # type: ignore[arg-type]
+            via_device=(DOMAIN, conf_name, DEVICE_P1_METER),  # type: ignore[typeddict-item]
+        ),
+        DEVICE_GAS: DeviceInfo(
+            name=name(DEVICE_P1_METER, "gas meter"),
+            identifiers={(DOMAIN, conf_name, DEVICE_GAS)},  # type: ignore[arg-type]
+            via_device=(DOMAIN, conf_name, DEVICE_ELECTRICITY),  # type: ignore[typeddict-item]
+        ),
+        DEVICE_BOILER_MODULE: DeviceInfo(
+            name=name(DEVICE_BOILER, "boiler module"),
+            manufacturer=ENECO,
+            identifiers={(DOMAIN, conf_name, DEVICE_BOILER_MODULE)},  # type: ignore[arg-type]
+            via_device=(DOMAIN, conf_name),
+        ),
+        DEVICE_BOILER: DeviceInfo(
+            name=name(DEVICE_BOILER, "boiler"),
+            identifiers={(DOMAIN, conf_name, DEVICE_BOILER)},  # type: ignore[arg-type]
+            via_device=(DOMAIN, conf_name, DEVICE_BOILER_MODULE),  # type: ignore[typeddict-item]
+        ),
+    }
+
+
+class ToonEntityFactory:
+    """Table of the precomputed entity attributes of a config entry."""
+
+    def __init__(self, config: Mapping[str, Any]) -> None:
+        """Precompute the devices and affixes of the config entry."""
+        self._conf_name = config.get(CONF_NAME)
+        self._affixes = {
+            affixes: (config.get(prefix), config.get(suffix))
+            for affixes, (prefix, suffix) in AFFIXES.items()
+        }
+        self._accessors: dict[str, Callable[[Any], Any]] = {}
+        self._specs: dict[tuple[str, str, str, str | None], EntitySpec] = {}
+        self.device_infos = _device_infos(config)
+
+    def accessor(self, key: str) -> Callable[[Any], Any]:
+        """Return the shared getter of a device attribute."""
+        if (accessor := self._accessors.get(key)) is None:
+            accessor = self._accessors[key] = attrgetter(key)
+        return accessor
+
+    def name(self, affixes: str, name: str) -> str:
+        """Return the name of an entity with the prefix and suffix of its device."""
+        prefix, suffix = self._affixes[affixes]
+        return upper_first(f"{prefix } {name.lower()} { suffix}")
+
+    def spec(
+        self, platform: Platform, affixes: str, description: EntityDescription
+    ) -> EntitySpec:
+        """Return the precomputed attributes of an entity description."""
+        spec_key = (platform, affixes, description.key, description.name)
+        if (spec := self._specs.get(spec_key)) is None:
+            name = str(description.name)
+            if platform == Platform.SENSOR:
+                unique_id = f"{DOMAIN}_{self._conf_name}_sensor_{ name.replace(' ', '') }_{description.key}"
+            else:
+                unique_id = f"{DOMAIN}_{self._conf_name}_{platform.value}_{description.key}"
+            spec = self._specs[spec_key] = EntitySpec(
+                name=self.name(affixes, name),
+                unique_id=unique_id,
+                value=self.accessor(description.key),
+            )
+        return spec
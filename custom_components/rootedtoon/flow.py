@@ -0,0 +1,49 @@
+"""Flow rate derived from consecutive readings of a meter counter."""
+from __future__ import annotations
+
+from collections import deque
+
+FLOW_SAMPLES = 8
+FLOW_WINDOW = 900.0
+
+
+class FlowRate:
+    """Smoothed flow rate of a counter in m³, from a short timestamped buffer."""
+
+    def __init__(self, samples: int = FLOW_SAMPLES, window: float = FLOW_WINDOW) -> None:
+        """Initialize the flow rate."""
+        self.flow_per_minute: float | None = None
+        self.flow_per_hour: float | None = None
+        self.resets = 0
+
+        self._readings: deque[tuple[float, float]] = deque(maxlen=samples)
+        self._window = window
+
+    def add(self, now: float, total: float | None) -> None:
+        """Add a counter reading and update the flow rate."""
+        if total is None:
+            return
+
+        readings = self._readings
+        if readings and total < readings[-1][1]:
+            # The meter was reset or replaced, start over from this reading.
+            readings.clear()
+            self.resets += 1
+            self.flow_per_minute = self.flow_per_hour = None
+        if not readings or total != readings[-1][1]:
+            readings.append((now, total))
+        while len(readings) > 1 and now - readings[1][0] >= self._window:
+            readings.popleft()
+
+        # The meter only reports whole units, so spread the usage over the
+        # window up to now, which lets the flow decay while idle.
+        start, start_total = readings[0]
+        if len(readings) == 1 and now - start < self._window:
+            return
+        span = now - max(start, now - self._window)
+        if span <= 0:
+            return
+
+        liters_per_minute = (readings[-1][1] - start_total) * 1000 / span * 60
+        self.flow_per_minute = round(liters_per_minute, 2)
+        self.flow_per_hour = round(liters_per_minute * 60, 1)
@@ -0,0 +1,96 @@
+"""Request instrumentation for the Toon endpoints."""
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+import hashlib
+from time import monotonic
+from types import SimpleNamespace
+from typing import Any
+
+from aiohttp import (
+    ClientSession,
+    TraceConfig,
+    TraceRequestEndParams,
+    TraceRequestStartParams,
+    TraceResponseChunkReceivedParams,
+)
+
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+@dataclass
+class RequestMetrics:
+    """HTTP metrics of the requests made during one endpoint update."""
+
+    started: float | None = None
+    finished: float | None = None
+    size: int = 0
+    digest: Any = field(default_factory=lambda: hashlib.blake2b(digest_size=16))
+
+    @property
+    def content_hash(self) -> str | None:
+        """Return the hash of the received response bodies."""
+        return self.digest.hexdigest() if self.size else None
+
+    @property
+    def http_time(self) -> float | None:
+        """Return the time spent sending requests and receiving responses."""
+        if self.started is None or self.finished is None:
+            return None
+        return self.finished - self.started
+
+
+_CURRENT_REQUEST: ContextVar[RequestMetrics | None] = ContextVar(
+    "rootedtoon_request", default=None
+)
+
+
+@contextmanager
+def track_request() -> Iterator[RequestMetrics]:
+    """Collect the HTTP metrics of the requests made in this context."""
+    metrics = RequestMetrics()
+    token = _CURRENT_REQUEST.set(metrics)
+    try:
+        yield metrics
+    finally:
+        _CURRENT_REQUEST.reset(token)
+
+
+async def _on_request_start(
+    _session: ClientSession, _ctx: SimpleNamespace, _params: TraceRequestStartParams
+) -> None:
+    """Mark the start of a tracked request."""
+    if (metrics := _CURRENT_REQUEST.get()) is not None and metrics.started is None:
+        metrics.started = monotonic()
+
+
+async def _on_request_end(
+    _session: ClientSession, _ctx: SimpleNamespace, _params: TraceRequestEndParams
+) -> None:
+    """Mark the arrival of the response headers of a tracked request."""
+    if (metrics := _CURRENT_REQUEST.get()) is not None:
+        metrics.finished = monotonic()
+
+
+async def _on_response_chunk_received(
+    _session: ClientSession,
+    _ctx: SimpleNamespace,
+    params: TraceResponseChunkReceivedParams,
+) -> None:
+    """Count the body of a tracked response."""
+    if (metrics := _CURRENT_REQUEST.get()) is not None:
+        metrics.size += len(params.chunk)
+        metrics.digest.update(params.chunk)
+        metrics.finished = monotonic()
+
+
+def create_trace_config() -> TraceConfig:
+    """Return an aiohttp trace config feeding the tracked request metrics."""
+    trace_config = TraceConfig()
+    trace_config.on_request_start.append(_on_request_start)
+    trace_config.on_request_end.append(_on_request_end)
+    trace_config.on_response_chunk_received.append(_on_response_chunk_received)
+    return trace_config
@@ -0,0 +1,108 @@
+"""Phase-offset polling of the endpoints of all Toon config entries."""
+from __future__ import annotations
+
+import asyncio
+from collections import defaultdict
+from collections.abc import AsyncIterator, Collection
+from contextlib import asynccontextmanager
+import math
+from time import monotonic
+from typing import TYPE_CHECKING
+
+from homeassistant.core import callback
+
+from .scheduler import ToonEndpoint
+
+if TYPE_CHECKING:
+    from .coordinator import RootedToonDataUpdateCoordinator
+
+
+class PollingOrchestrator:
+    """Spread the polls of all Toons over their intervals and cap the requests."""
+
+    def __init__(self, max_requests: int) -> None:
+        """Initialize the orchestrator."""
+        self.max_requests = max_requests
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+        self._semaphore = asyncio.Semaphore(max_requests)
+        self._coordinators: list[RootedToonDataUpdateCoordinator] = []
+        self._epoch = monotonic()
+
+    @callback
+    def async_register(self, coordinator: RootedToonDataUpdateCoordinator) -> None:
+        """Add the endpoints of a config entry and spread all polls again."""
+        self._coordinators.append(coordinator)
+        self._async_rebalance()
+
+    @callback
+    def async_unregister(self, coordinator: RootedToonDataUpdateCoordinator) -> None:
+        """Remove the endpoints of a config entry and spread all polls again."""
+        if coordinator in self._coordinators:
+            self._coordinators.remove(coordinator)
+            self._async_rebalance()
+
+    @callback
+    def async_set_interval(
+        self,
+        coordinator: RootedToonDataUpdateCoordinator,
+        endpoint: ToonEndpoint,
+        interval: float,
+    ) -> None:
+        """Change the interval of an endpoint and spread the polls of both intervals."""
+        previous = endpoint.interval
+        coordinator.scheduler.set_interval(endpoint, interval)
+        if interval != previous:
+            self._async_rebalance((previous, interval))
+
+    @callback
+    def _async_rebalance(self, intervals: Collection[float] | None = None) -> None:
+        """Give every endpoint with the same interval an evenly spaced phase."""
+        slots: dict[float, list[tuple[RootedToonDataUpdateCoordinator, ToonEndpoint]]]
+        slots = defaultdict(list)
+        for coordinator in self._coordinators:
+            for endpoint in coordinator.endpoints.values():
+                if intervals is None or endpoint.interval in intervals:
+                    slots[endpoint.interval].append((coordinator, endpoint))
+
+        now = monotonic()
+        for interval, members in slots.items():
+            for index, (coordinator, endpoint) in enumerate(members):
+                endpoint.phase = interval * index / len(members)
+                if (
+                    len(members) == 1
+                    or endpoint.failures
+                    or not coordinator.breaker.closed
+                ):
+                    # Keep the cadence of an endpoint that shares its interval with
+                    # no other, the retry backoff, or the hold of an open breaker.
+                    continue
+                # Move to the slot nearest to the current deadline, but not before now.
+                base = self._epoch + endpoint.phase
+                cycles = max(
+                    round((endpoint.next_due - base) / interval),
+                    math.ceil((now - base) / interval),
+                    0,
+                )
+                coordinator.scheduler.schedule(endpoint, base + cycles * interval)
+
+        for coordinator in self._coordinators:
+            coordinator.async_reschedule()
+
+    @asynccontextmanager
+    async def async_request(
+        self, endpoint: ToonEndpoint | None = None
+    ) -> AsyncIterator[None]:
+        """Hold one of the requests that may be in flight across all Toons."""
+        async with self._semaphore:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            if endpoint is not None:
+                endpoint.in_flight = True
+            try:
+                yield
+            finally:
+                self.in_flight -= 1
+                if endpoint is not None:
+                    endpoint.in_flight = False
@@ -0,0 +1,149 @@
+"""Persisted snapshot of the last Toon data, to set up without the Toon."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import date, datetime, time
+import logging
+from time import monotonic
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_VERSION = 1
+SNAPSHOT_SAVE_DELAY = 10
+SNAPSHOT_SAVE_INTERVAL = 300
+
+_TAGGED_TYPES: dict[str, type] = {"datetime": datetime, "date": date, "time": time}
+
+
+def _serialize(value: Any) -> Any:
+    """Return the JSON serializable scalar attributes of a (nested) device."""
+    if isinstance(value, (str, int, float, bool, type(None))):
+        return value
+    if isinstance(value, (list, tuple)) and all(
+        isinstance(item, (str, int, float, bool, type(None))) for item in value
+    ):
+        return list(value)
+    for tag, tagged_type in _TAGGED_TYPES.items():
+        if isinstance(value, tagged_type):
+            return {f"__{tag}__": value.isoformat()}
+    if hasattr(value, "__dict__"):
+        return {
+            attr: _serialize(item)
+            for attr, item in vars(value).items()
+            if not callable(item) and not isinstance(item, dict)
+        }
+    return None
+
+
+def _deserialize(value: Any) -> Any:
+    """Return the scalar value of a serialized attribute."""
+    if isinstance(value, dict) and len(value) == 1:
+        ((key, item),) = value.items()
+        if key.startswith("__") and (tag := key.strip("_")) in _TAGGED_TYPES:
+            return _TAGGED_TYPES[tag].fromisoformat(item)
+    return value
+
+
+def _restore(device: Any, data: dict[str, Any]) -> None:
+    """Apply serialized attributes to a (nested) device in place."""
+    for attr, value in data.items():
+        value = _deserialize(value)
+        if isinstance(value, dict):
+            # Nested devices can only be restored into existing objects.
+            if hasattr(current := getattr(device, attr, None), "__dict__"):
+                _restore(current, value)
+        elif value is not None or not isinstance(getattr(device, attr, None), list):
+            # Lists of devices are not stored, they keep their (empty) default.
+            setattr(device, attr, value)
+
+
+@dataclass
+class SnapshotState:
+    """State of the stored snapshot of a Toon."""
+
+    restored: bool = False
+    saved: datetime | None = None
+
+
+class ToonSnapshotStore:
+    """Keeps the last Toon data in the Home Assistant storage."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry_id: str,
+        save_interval: float = SNAPSHOT_SAVE_INTERVAL,
+    ) -> None:
+        """Initialize the snapshot store."""
+        self.state = SnapshotState()
+
+        self._store: Store[dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}"
+        )
+        self._save_interval = save_interval
+        self._last_save: float | None = None
+        self._live_since: datetime | None = None
+
+    async def async_restore(self, devices: Any, max_age: float) -> bool:
+        """Restore the stored snapshot into the devices, if it is recent enough."""
+        if (data := await self._store.async_load()) is None:
+            return False
+
+        try:
+            saved = dt_util.parse_datetime(data["saved"])
+            if saved is None:
+                raise ValueError(f"Invalid save time {data['saved']}")
+            if (age := (dt_util.utcnow() - saved).total_seconds()) > max_age:
+                _LOGGER.debug("Ignoring Toon snapshot of %.0f seconds old", age)
+                return False
+            _restore(devices, data["devices"])
+        except (AttributeError, KeyError, TypeError, ValueError) as error:
+            _LOGGER.debug("Ignoring stored Toon snapshot: %s", error)
+            return False
+
+        self.state.restored = True
+        self.state.saved = saved
+        return True
+
+    @callback
+    def async_save(self, devices: Any) -> None:
+        """Schedule saving the live devices, at most once per save interval."""
+        self.state.restored = False
+        self._live_since = dt_util.utcnow()
+        now = monotonic()
+        if self._last_save is not None and now - self._last_save < self._save_interval:
+            return
+        self._last_save = now
+        self._async_delay_save(devices, SNAPSHOT_SAVE_DELAY)
+
+    @callback
+    def async_flush(self, devices: Any) -> None:
+        """Save the last live devices right away, when the Toon is unloaded."""
+        # Restored data that was never refreshed keeps its original save time.
+        if self._live_since is not None:
+            self._async_delay_save(devices, 0)
+
+    @callback
+    def _async_delay_save(self, devices: Any, delay: float) -> None:
+        """Schedule writing the devices with the time they were last live."""
+
+        def _data() -> dict[str, Any]:
+            self.state.saved = self._live_since
+            assert self.state.saved is not None
+            return {
+                "saved": self.state.saved.isoformat(),
+                "devices": _serialize(devices),
+            }
+
+        self._store.async_delay_save(_data, delay)
+
+    async def async_remove(self) -> None:
+        """Remove the stored snapshot."""
+        await self._store.async_remove()
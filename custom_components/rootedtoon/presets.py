@@ -0,0 +1,25 @@
+"""Mapping between the Toon active states and the climate preset modes."""
+from rootedtoonapi import (
+    ACTIVE_STATE_AWAY,
+    ACTIVE_STATE_COMFORT,
+    ACTIVE_STATE_HOME,
+    ACTIVE_STATE_SLEEP,
+)
+
+from homeassistant.components.climate import (
+    PRESET_AWAY,
+    PRESET_COMFORT,
+    PRESET_HOME,
+    PRESET_SLEEP,
+)
+
+STATE_TO_PRESET_MODE_MAPPING = {
+    ACTIVE_STATE_AWAY: PRESET_AWAY,
+    ACTIVE_STATE_COMFORT: PRESET_COMFORT,
+    ACTIVE_STATE_HOME: PRESET_HOME,
+    ACTIVE_STATE_SLEEP: PRESET_SLEEP,
+}
+
+PRESET_MODE_TO_STATE_MAPPING = {
+    value: key for key, value in STATE_TO_PRESET_MODE_MAPPING.items()
+}
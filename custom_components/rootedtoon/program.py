@@ -0,0 +1,64 @@
+"""Indexed, weekly recurring view of the Toon thermostat program."""
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections.abc import Iterable, Iterator
+from datetime import datetime, timedelta
+import math
+from typing import Any
+
+from homeassistant.components.calendar import CalendarEvent
+
+WEEK = timedelta(days=7)
+MAX_CACHED_EVENTS = 1024
+
+
+class ProgramIndex:
+    """Program blocks of one week, sorted by start and repeated every week."""
+
+    def __init__(self, events: Iterable[Any]) -> None:
+        """Index the program blocks of the first stored week."""
+        blocks = sorted(
+            (event.start_datetime, event.end_datetime, event.state) for event in events
+        )
+        if blocks:
+            week_end = blocks[0][0] + WEEK
+            blocks = [block for block in blocks if block[0] < week_end]
+
+        self._blocks = blocks
+        self._starts = [block[0] for block in blocks]
+        self._origin = blocks[0][0] if blocks else None
+        self._max_duration = max(
+            (end - start for start, end, _ in blocks), default=timedelta()
+        )
+        self._events: dict[tuple[int, int], CalendarEvent] = {}
+
+    def _event(self, index: int, week: int) -> CalendarEvent:
+        """Return the occurrence of a block in the given week."""
+        if (event := self._events.get((index, week))) is None:
+            if len(self._events) >= MAX_CACHED_EVENTS:
+                self._events.clear()
+            start, end, state = self._blocks[index]
+            event = self._events[(index, week)] = CalendarEvent(
+                start=start + week * WEEK, end=end + week * WEEK, summary=state
+            )
+        return event
+
+    def events(self, start: datetime, end: datetime) -> Iterator[CalendarEvent]:
+        """Yield the occurrences overlapping a window, ordered by start."""
+        if self._origin is None:
+            return
+
+        first_week = math.floor((start - self._max_duration - self._origin) / WEEK)
+        last_week = math.floor((end - self._origin) / WEEK)
+        for week in range(first_week, last_week + 1):
+            shift = week * WEEK
+            low = bisect_left(self._starts, start - shift - self._max_duration)
+            high = bisect_left(self._starts, end - shift)
+            for index in range(low, high):
+                if self._blocks[index][1] + shift > start:
+                    yield self._event(index, week)
+
+    def event_at(self, moment: datetime) -> CalendarEvent | None:
+        """Return the occurrence active at, or else following, a moment."""
+        return next(self.events(moment, moment + WEEK), None)
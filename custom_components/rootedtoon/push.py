@@ -0,0 +1,80 @@
+"""Apply values pushed by the MQTT bridge of a rooted Toon to its devices."""
+from __future__ import annotations
+
+from datetime import datetime
+import json
+from typing import Any
+
+from .const import ENDPOINT_BOILER, ENDPOINT_P1_METER, ENDPOINT_THERMOSTAT
+
+# Endpoints whose devices can be pushed; their topic starts with the device.
+PUSH_ENDPOINTS = (ENDPOINT_BOILER, ENDPOINT_P1_METER, ENDPOINT_THERMOSTAT)
+
+
+def _coerce(current: Any, payload: str) -> Any:
+    """Return the payload as the type of the current value of an attribute."""
+    try:
+        value = json.loads(payload)
+    except ValueError:
+        value = payload
+    if isinstance(current, bool):
+        return value in (True, 1, "1", "true", "on", "ON")
+    if isinstance(current, int) and not isinstance(value, bool):
+        if isinstance(value, float) and not value.is_integer():
+            # Do not truncate a fraction into a whole number.
+            raise ValueError(f"{value} is not a whole number")
+        return int(value)
+    if isinstance(current, float):
+        return float(value)
+    if isinstance(current, str):
+        return str(value)
+    return value
+
+
+class ToonPushUpdates:
+    """Statistics and parsing of the messages of a Toon MQTT bridge."""
+
+    def __init__(self, topic: str, endpoints: set[str]) -> None:
+        """Initialize the push updates."""
+        self.topic = topic.rstrip("/")
+        self.endpoints = endpoints
+        self.subscribed = False
+        self.messages = 0
+        self.ignored = 0
+        self.last_message: datetime | None = None
+
+    @property
+    def subscription(self) -> str:
+        """Return the topic filter that covers every device of the Toon."""
+        return f"{self.topic}/#"
+
+    def apply(self, devices: Any, topic: str, payload: str) -> str | None:
+        """Apply a message to the devices and return the endpoint it belongs to."""
+        path = topic[len(self.topic) + 1 :].split("/")
+        if not topic.startswith(f"{self.topic}/") or path[0] not in self.endpoints:
+            self.ignored += 1
+            return None
+
+        device = devices
+        for attr in path[:-1]:
+            device = getattr(device, attr, None)
+        # Only known scalar values are pushed, the polls still shape the devices.
+        attrs = getattr(device, "__dict__", {})
+        current = attrs.get(path[-1])
+        if (
+            path[-1] not in attrs
+            or callable(current)
+            or isinstance(current, (list, tuple, dict))
+            or hasattr(current, "__dict__")
+        ):
+            self.ignored += 1
+            return None
+
+        try:
+            setattr(device, path[-1], _coerce(current, payload))
+        except (TypeError, ValueError):
+            self.ignored += 1
+            return None
+
+        self.messages += 1
+        return path[0]
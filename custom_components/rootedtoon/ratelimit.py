@@ -0,0 +1,82 @@
+"""Rate limiting of the requests sent to a Toon."""
+from __future__ import annotations
+
+import asyncio
+import heapq
+from itertools import count
+from time import monotonic
+
+PRIORITY_WRITE = 0
+PRIORITY_POLL = 1
+
+RATE_LIMIT_BURST = 2
+
+
+class TokenBucketRateLimiter:
+    """Token bucket shared by all requests to a single Toon."""
+
+    def __init__(self, rate: float, burst: int = RATE_LIMIT_BURST) -> None:
+        """Initialize the rate limiter."""
+        if rate <= 0:
+            raise ValueError(f"The rate limit must be positive, not {rate}")
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = monotonic()
+        self._waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._sequence = count()
+        self._wakeup: asyncio.TimerHandle | None = None
+
+        self.requests = 0
+        self.queued = 0
+        self.total_delay = 0.0
+        self.max_delay = 0.0
+        self.average_delay = 0.0
+
+    def _refill(self, now: float) -> None:
+        """Add the tokens earned since the last refill."""
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self, priority: int = PRIORITY_POLL) -> None:
+        """Wait until a request with the given priority may be sent."""
+        start = monotonic()
+        self.requests += 1
+        self._refill(start)
+        if not self._waiters and self._tokens >= 1:
+            self._tokens -= 1
+            return
+
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._sequence), future))
+        self._schedule_release()
+        await future
+
+        delay = monotonic() - start
+        self.queued += 1
+        self.total_delay += delay
+        self.max_delay = max(self.max_delay, delay)
+        self.average_delay = self.total_delay / self.queued
+
+    def _schedule_release(self) -> None:
+        """Wake up once the next token is available."""
+        if self._wakeup is not None or not self._waiters:
+            return
+
+        self._wakeup = asyncio.get_running_loop().call_later(
+            max((1 - self._tokens) / self.rate, 0), self._release
+        )
+
+    def _release(self) -> None:
+        """Hand out the available tokens, highest priority first."""
+        self._wakeup = None
+        self._refill(monotonic())
+        while self._waiters and self._tokens >= 1:
+            _, _, future = heapq.heappop(self._waiters)
+            if future.done():
+                # The waiting request was cancelled.
+                continue
+            self._tokens -= 1
+            future.set_result(None)
+
+        self._schedule_release()
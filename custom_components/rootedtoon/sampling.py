@@ -0,0 +1,130 @@
+"""Time-weighted aggregation of high-frequency P1 meter samples."""
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from typing import Any
+
+POWER_KEYS = (
+    "electricity_delivery",
+    "electricity_delivery_high",
+    "electricity_delivery_low",
+    "electricity_return",
+    "electricity_return_high",
+    "electricity_return_low",
+)
+
+
+class RingBuffer:
+    """Fixed-size buffer of timestamped samples, overwriting the oldest sample."""
+
+    def __init__(self, capacity: int) -> None:
+        """Initialize an empty buffer."""
+        self._times = array("d", [0.0]) * capacity
+        self._values = array("d", [0.0]) * capacity
+        self._capacity = capacity
+        self._start = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        """Return the number of buffered samples."""
+        return self._size
+
+    def __iter__(self) -> Iterator[tuple[float, float]]:
+        """Yield the buffered samples, oldest first."""
+        for offset in range(self._size):
+            index = (self._start + offset) % self._capacity
+            yield self._times[index], self._values[index]
+
+    def append(self, time: float, value: float) -> None:
+        """Add a sample."""
+        index = (self._start + self._size) % self._capacity
+        self._times[index] = time
+        self._values[index] = value
+        if self._size < self._capacity:
+            self._size += 1
+        else:
+            self._start = (self._start + 1) % self._capacity
+
+    def clear(self) -> None:
+        """Remove all samples."""
+        self._start = 0
+        self._size = 0
+
+
+@dataclass
+class PowerAggregate:
+    """Statistics of one power value over the last publish interval."""
+
+    mean: float | None = None
+    min: float | None = None
+    max: float | None = None
+    samples: int = 0
+
+
+class P1Sampler:
+    """Buffer P1 power samples and aggregate them once per publish interval."""
+
+    def __init__(
+        self,
+        sample_interval: float,
+        publish_interval: float,
+        now: float,
+        keys: Iterable[str] = POWER_KEYS,
+    ) -> None:
+        """Initialize the sampler."""
+        self.publish_interval = publish_interval
+        self.aggregates = {key: PowerAggregate() for key in keys}
+        self.samples = 0
+        self.publishes = 0
+
+        # Leave room for late publishes and retried polls.
+        capacity = int(publish_interval / sample_interval) * 2 + 2
+        self._buffers = {key: RingBuffer(capacity) for key in self.aggregates}
+        self._held: dict[str, float] = {}
+        self._window_start = now
+
+    def add(self, now: float, device: Any) -> None:
+        """Buffer the power values of the electricity meter."""
+        for key, buffer in self._buffers.items():
+            if (value := getattr(device, key, None)) is not None:
+                buffer.append(now, float(value))
+        self.samples += 1
+
+    def due(self, now: float) -> bool:
+        """Return if the publish interval has passed."""
+        return now - self._window_start >= self.publish_interval
+
+    def publish(self, now: float) -> None:
+        """Aggregate the buffered samples and start a new window."""
+        for key, buffer in self._buffers.items():
+            self._aggregate(key, buffer, now)
+            buffer.clear()
+        self._window_start = now
+        self.publishes += 1
+
+    def _aggregate(self, key: str, buffer: RingBuffer, now: float) -> None:
+        """Update the statistics of a power value from its buffered samples."""
+        # Every sample holds until the next one, the value held at the end of
+        # the previous window holds until the first sample of this window.
+        points = [(max(time, self._window_start), value) for time, value in buffer]
+        if key in self._held:
+            points.insert(0, (self._window_start, self._held[key]))
+        if not points:
+            return
+
+        area = 0.0
+        for (time, value), (next_time, _) in zip(points, points[1:]):
+            area += value * (next_time - time)
+        last_time, last_value = points[-1]
+        area += last_value * (now - last_time)
+
+        values = [value for _, value in points]
+        duration = now - points[0][0]
+        aggregate = self.aggregates[key]
+        aggregate.mean = round(area / duration, 1) if duration > 0 else last_value
+        aggregate.min = min(values)
+        aggregate.max = max(values)
+        aggregate.samples = len(buffer)
+        self._held[key] = last_value
@@ -0,0 +1,142 @@
+"""Deadline scheduler for the Toon endpoints."""
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass, field
+from datetime import datetime
+import heapq
+import math
+
+from .metrics import LATENCY_BUCKETS
+
+# The coordinator refresh is scheduled with second resolution, so a wakeup
+# may land slightly before the deadline it was scheduled for.
+WAKEUP_TOLERANCE = 1.0
+MAX_RETRY_BACKOFF = 600.0
+
+
+@dataclass
+class ToonEndpoint:
+    """Describes a polled Toon endpoint and its timing statistics."""
+
+    name: str
+    interval: float
+    update_func: Callable[[], Awaitable[None]]
+    next_due: float = 0.0
+    lateness: float = 0.0
+    jitter: float = 0.0
+    max_lateness: float = 0.0
+    last_success: float | None = None
+    failures: int = 0
+    last_error: str | None = None
+    base_interval: float = 0.0
+    min_interval: float = 0.0
+    max_interval: float = 0.0
+    latency: float | None = None
+    baseline_latency: float = 0.0
+    request_latency: float | None = None
+    response_size: int | None = None
+    parse_time: float | None = None
+    successes: int = 0
+    total_failures: int = 0
+    last_success_time: datetime | None = None
+    restored: bool = False
+    content_hash: str | None = None
+    phase: float = 0.0
+    start_delay: float = 0.0
+    in_flight: bool = False
+    revision: int = 0
+    unchanged: int = 0
+    latency_histogram: list[int] = field(
+        default_factory=lambda: [0] * (len(LATENCY_BUCKETS) + 1)
+    )
+
+    def __post_init__(self) -> None:
+        """Default the interval bounds to the configured interval."""
+        self.base_interval = self.interval
+        self.min_interval = self.min_interval or self.interval
+        self.max_interval = self.max_interval or self.interval
+
+    def record_request(self, duration: float, http_time: float, size: int) -> None:
+        """Record the timing and size of a request."""
+        self.request_latency = http_time
+        self.parse_time = max(duration - http_time, 0.0)
+        self.response_size = size
+        self.latency_histogram[bisect_left(LATENCY_BUCKETS, http_time)] += 1
+
+    def record_content(self, content_hash: str | None) -> None:
+        """Bump the revision of the endpoint when its response changed."""
+        if content_hash is not None and content_hash == self.content_hash:
+            self.unchanged += 1
+            return
+
+        self.content_hash = content_hash
+        self.revision += 1
+
+    def available(self, now: float, stale_limit: float) -> bool:
+        """Return if the last good data of the endpoint is recent enough."""
+        return self.last_success is not None and now - self.last_success <= stale_limit
+
+
+class DeadlineScheduler:
+    """Schedule endpoint updates on a min-heap of next-due times."""
+
+    def __init__(self, endpoints: Iterable[ToonEndpoint], now: float) -> None:
+        """Initialize the scheduler with all endpoints due now."""
+        self.endpoints = {endpoint.name: endpoint for endpoint in endpoints}
+        self._heap: list[tuple[float, str]] = []
+        for endpoint in self.endpoints.values():
+            self.schedule(endpoint, now)
+
+    def schedule(self, endpoint: ToonEndpoint, due: float) -> None:
+        """Set the next due time of an endpoint."""
+        endpoint.next_due = due
+        heapq.heappush(self._heap, (due, endpoint.name))
+
+    def pop_due(self, now: float) -> list[ToonEndpoint]:
+        """Return the due endpoints and schedule their next deadline."""
+        due: list[ToonEndpoint] = []
+        while self._heap and self._heap[0][0] <= now + WAKEUP_TOLERANCE:
+            deadline, name = heapq.heappop(self._heap)
+            endpoint = self.endpoints[name]
+            if deadline != endpoint.next_due:
+                # Superseded by a later call to schedule.
+                continue
+
+            lateness = now - deadline
+            # Interarrival jitter estimator as used by RTP (RFC 3550).
+            endpoint.jitter += (abs(lateness - endpoint.lateness) - endpoint.jitter) / 16
+            endpoint.lateness = lateness
+            endpoint.max_lateness = max(endpoint.max_lateness, lateness)
+
+            # Keep the endpoint on its own cadence, skipping missed slots.
+            missed = max(math.floor((now - deadline) / endpoint.interval), 0)
+            self.schedule(endpoint, deadline + (missed + 1) * endpoint.interval)
+            due.append(endpoint)
+
+        return due
+
+    def set_interval(self, endpoint: ToonEndpoint, interval: float) -> None:
+        """Change the interval of an endpoint, keeping its last deadline."""
+        self.schedule(endpoint, endpoint.next_due + interval - endpoint.interval)
+        endpoint.interval = interval
+
+    def backoff(self, endpoint: ToonEndpoint, now: float) -> float:
+        """Reschedule a failing endpoint with exponential backoff."""
+        delay = max(
+            min(endpoint.interval * 2 ** min(endpoint.failures, 16), MAX_RETRY_BACKOFF),
+            endpoint.interval,
+        )
+        self.schedule(endpoint, now + delay)
+        return delay
+
+    def delay(self, now: float) -> float:
+        """Return the number of seconds until the next endpoint is due."""
+        while self._heap:
+            deadline, name = self._heap[0]
+            if deadline == self.endpoints[name].next_due:
+                return max(deadline - now, 0.0)
+            heapq.heappop(self._heap)
+
+        return 0.0
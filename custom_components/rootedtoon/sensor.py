@@ -1,7 +1,9 @@
 """Support for Toon sensors."""
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass, replace
+from datetime import datetime
+from time import monotonic
 from typing import Any
 
 from homeassistant.components.sensor import (
@@ -12,30 +14,56 @@ from homeassistant.components.sensor import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import (
-    CONF_NAME,
+    Platform,
     UnitOfEnergy,
+    UnitOfInformation,
     PERCENTAGE,
     UnitOfPressure,
     UnitOfPower,
     UnitOfTemperature,
+    UnitOfTime,
     UnitOfVolume,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.restore_state import ExtraStoredData, RestoreEntity
+from homeassistant.util import dt as dt_util
 
 from .const import (
-    CONF_BOILER_PREFIX,
-    CONF_BOILER_SUFFIX,
     CONF_ENABLE_BOILER,
     CONF_ENABLE_P1_METER,
-    CONF_P1_METER_PREFIX,
-    CONF_P1_METER_SUFFIX,
-    CONF_THERMOSTAT_PREFIX,
-    CONF_THERMOSTAT_SUFFIX,
+    CONF_OFF_PEAK_END,
+    CONF_OFF_PEAK_PRICE_ELECTRICITY_DELIVERED_HIGH,
+    CONF_OFF_PEAK_PRICE_ELECTRICITY_DELIVERED_LOW,
+    CONF_OFF_PEAK_PRICE_ELECTRICITY_RETURNED_HIGH,
+    CONF_OFF_PEAK_PRICE_ELECTRICITY_RETURNED_LOW,
+    CONF_OFF_PEAK_PRICE_GAS,
+    CONF_OFF_PEAK_START,
+    CONF_PRICE_ELECTRICITY_DELIVERED_HIGH,
+    CONF_PRICE_ELECTRICITY_DELIVERED_LOW,
+    CONF_PRICE_ELECTRICITY_RETURNED_HIGH,
+    CONF_PRICE_ELECTRICITY_RETURNED_LOW,
+    CONF_PRICE_GAS,
+    CURRENCY_EUR,
+    DEVICE_P1_METER,
     DOMAIN,
-    STATE_TO_PRESET_MODE_MAPPING,
+    ENDPOINT_BOILER,
+    ENDPOINT_P1_METER,
+    SIGNAL_SMART_PLUG_ADDED,
+    SIGNAL_SMART_PLUG_REMOVED,
+    VOLUME_LHOUR,
+    VOLUME_LMIN,
 )
+from .breaker import STATE_CLOSED, STATE_HALF_OPEN, STATE_OPEN
 from .coordinator import RootedToonDataUpdateCoordinator
+from .deadband import DEFAULT_DEADBANDS, Deadband, DeadbandFilter
+from .cost import CostCounter, TimeOfUsePrice
+from .metrics import LATENCY_BUCKETS
+from .sampling import PowerAggregate
 from .models import (
     ToonBoilerDeviceEntity,
     ToonElectricityMeterDeviceEntity,
@@ -44,7 +72,8 @@ from .models import (
     ToonGasMeterDeviceEntity,
     ToonThermostatDeviceEntity,
 )
-from .util import upper_first
+from .presets import STATE_TO_PRESET_MODE_MAPPING
+from .util import device_context, upper_first
 
 
 async def async_setup_entry(
@@ -58,6 +87,26 @@ async def async_setup_entry(
 
     entities = []
     if p1_meter_enabled and coordinator.data.p1_meter.electricity_meter.available:
+        sampler = coordinator.p1_sampler
+        for description in ELECTRICITY_SENSOR_ENTITIES:
+            if sampler is not None and description.key in sampler.aggregates:
+                entities.append(
+                    ToonSampledPowerSensor(
+                        coordinator,
+                        entry,
+                        description,
+                        sampler.aggregates[description.key],
+                    )
+                )
+            else:
+                entities.append(
+                    description.cls(
+                        coordinator,
+                        entry,
+                        description,
+                        coordinator.data.p1_meter.electricity_meter,
+                    )
+                )
         entities.extend(
             [
                 description.cls(
@@ -66,7 +115,8 @@ async def async_setup_entry(
                     description,
                     coordinator.data.p1_meter.electricity_meter,
                 )
-                for description in ELECTRICITY_SENSOR_ENTITIES
+                for description in ELECTRICITY_COST_SENSOR_ENTITIES
+                if description.price in entry.data
             ]
         )
     if p1_meter_enabled and coordinator.data.p1_meter.gas_meter.available:
@@ -76,44 +126,36 @@ async def async_setup_entry(
                     coordinator, entry, description, coordinator.data.p1_meter.gas_meter
                 )
                 for description in GAS_SENSOR_ENTITIES
+                if description.price is None or description.price in entry.data
+            ]
+        )
+        entities.extend(
+            [
+                description.cls(coordinator, entry, description, coordinator.gas_flow)
+                for description in GAS_FLOW_SENSOR_ENTITIES
             ]
         )
 
-    if p1_meter_enabled and coordinator.data.smart_plugs.available:
-        for smart_plug in coordinator.data.smart_plugs.devices:
-            entities.extend(
-                [
-                    ToonSmartPlugDeviceSensor(
-                        coordinator=coordinator,
-                        entry=entry,
-                        description=ToonSensorEntityDescription(
-                            key="power",
-                            name=f"{ smart_plug.name } power",
-                            # suggested_display_precision=1,
-                            native_unit_of_measurement=UnitOfPower.WATT,
-                            state_class=SensorStateClass.MEASUREMENT,
-                            device_class=SensorDeviceClass.POWER,
-                            cls=ToonSmartPlugDeviceSensor,
-                        ),
-                        device=smart_plug,
-                    ),
-                    ToonSmartPlugDeviceSensor(
-                        coordinator=coordinator,
-                        entry=entry,
-                        description=ToonSensorEntityDescription(
-                            key="total",
-                            name=f"{ smart_plug.name } energy",
-                            # suggested_display_precision=3,
-                            native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR ,
-                            state_class=SensorStateClass.TOTAL,
-                            device_class=SensorDeviceClass.ENERGY,
-                            cls=ToonSmartPlugDeviceSensor,
-                        ),
-                        device=smart_plug,
-                    ),
-                ]
+    if p1_meter_enabled:
+        if coordinator.data.smart_plugs.available:
+            for smart_plug in coordinator.smart_plugs.values():
+                entities.extend(_smart_plug_entities(coordinator, entry, smart_plug))
+
+        @callback
+        def _async_add_smart_plug(smart_plug: Any) -> None:
+            """Add the sensors of a smart plug paired after setup."""
+            async_add_entities(
+                _smart_plug_entities(coordinator, entry, smart_plug), True
             )
 
+        entry.async_on_unload(
+            async_dispatcher_connect(
+                hass,
+                SIGNAL_SMART_PLUG_ADDED.format(entry.entry_id),
+                _async_add_smart_plug,
+            )
+        )
+
     if coordinator.data.thermostat.have_opentherm_boiler:
         if boiler_enabled and coordinator.data.boiler.available():
             entities.extend(
@@ -141,9 +183,101 @@ async def async_setup_entry(
             ]
         )
 
+    for endpoint in coordinator.endpoints.values():
+        endpoint_name = upper_first(endpoint.name.replace("_", " "))
+        entities.extend(
+            [
+                description.cls(
+                    coordinator,
+                    entry,
+                    replace(
+                        description,
+                        name=f"{endpoint_name} {description.name.lower()}",
+                    ),
+                    endpoint,
+                )
+                for description in ENDPOINT_SENSOR_ENTITIES
+            ]
+        )
+
+    entities.extend(
+        [
+            description.cls(coordinator, entry, description, coordinator.rate_limiter)
+            for description in RATE_LIMITER_SENSOR_ENTITIES
+        ]
+    )
+    entities.extend(
+        [
+            description.cls(coordinator, entry, description, coordinator.breaker)
+            for description in BREAKER_SENSOR_ENTITIES
+        ]
+    )
+    entities.extend(
+        [
+            description.cls(coordinator, entry, description, coordinator.deadband)
+            for description in DEADBAND_SENSOR_ENTITIES
+        ]
+    )
+
+    if coordinator.burst is not None:
+        entities.extend(
+            [
+                description.cls(
+                    coordinator, entry, description, coordinator.burst.statistics
+                )
+                for description in BURST_SENSOR_ENTITIES
+            ]
+        )
+
+    if coordinator.backfill is not None:
+        entities.extend(
+            [
+                description.cls(
+                    coordinator, entry, description, coordinator.backfill.progress
+                )
+                for description in BACKFILL_SENSOR_ENTITIES
+            ]
+        )
+
     async_add_entities(entities, True)
 
 
+def _smart_plug_entities(
+    coordinator: RootedToonDataUpdateCoordinator, entry: ConfigEntry, smart_plug: Any
+) -> list[ToonSmartPlugDeviceSensor]:
+    """Return the sensors of a smart plug."""
+    return [
+        ToonSmartPlugDeviceSensor(
+            coordinator=coordinator,
+            entry=entry,
+            description=ToonSensorEntityDescription(
+                key="power",
+                name=f"{ smart_plug.name } power",
+                # suggested_display_precision=1,
+                native_unit_of_measurement=UnitOfPower.WATT,
+                state_class=SensorStateClass.MEASUREMENT,
+                device_class=SensorDeviceClass.POWER,
+                cls=ToonSmartPlugDeviceSensor,
+            ),
+            device=smart_plug,
+        ),
+        ToonSmartPlugDeviceSensor(
+            coordinator=coordinator,
+            entry=entry,
+            description=ToonSensorEntityDescription(
+                key="total",
+                name=f"{ smart_plug.name } energy",
+                # suggested_display_precision=3,
+                native_unit_of_measurement=UnitOfEnergy.KILO_WATT_HOUR ,
+                state_class=SensorStateClass.TOTAL,
+                device_class=SensorDeviceClass.ENERGY,
+                cls=ToonSmartPlugDeviceSensor,
+            ),
+            device=smart_plug,
+        ),
+    ]
+
+
 class ToonSensor(ToonEntity, SensorEntity):
     """Defines a Toon sensor."""
 
@@ -159,44 +293,141 @@ class ToonSensor(ToonEntity, SensorEntity):
         """Initialize the Toon sensor."""
         self.entity_description = description
         self.device = device
-        super().__init__(coordinator)
+        if description.endpoint:
+            self._endpoint = description.endpoint
+        super().__init__(coordinator, device_context(device, description.key))
 
-        self._attr_unique_id = f"{DOMAIN}_{entry.data.get(CONF_NAME)}_sensor_{ description.name.replace(' ', '') }_{description.key}"
+        spec = coordinator.entity_factory.spec(
+            Platform.SENSOR, self._affixes, description
+        )
+        self._attr_name = spec.name
+        self._attr_unique_id = spec.unique_id
+        self._value = spec.value
+
+        deadband = description.deadband or DEFAULT_DEADBANDS.get(
+            description.device_class
+        )
+        self._deadband = (
+            DeadbandFilter(deadband, coordinator.deadband) if deadband else None
+        )
+        self._written_status: tuple[bool, bool] | None = None
+        self._unsub_heartbeat: CALLBACK_TYPE | None = None
 
     @property
     def native_value(self) -> str | None:
         """Return the state of the sensor."""
-        return getattr(self.device, self.entity_description.key)
+        return self._value(self.device)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the state, unless the value only changed within its deadband."""
+        if self._deadband is None:
+            super()._handle_coordinator_update()
+            return
+
+        now = monotonic()
+        status = (self.available, self.assumed_state)
+        value = self.native_value if status[0] else None
+        if status != self._written_status:
+            self._deadband.reset()
+        elif not self._deadband.should_write(value, now):
+            self._deadband.suppressed(self.entity_id)
+            # Listeners only hear of changes, so write a value that stays in band.
+            if self._unsub_heartbeat is None:
+                self._unsub_heartbeat = async_call_later(
+                    self.hass,
+                    self._deadband.heartbeat_in(now),
+                    self._async_write_heartbeat,
+                )
+            return
+
+        self._async_written(status, value, now)
+        super()._handle_coordinator_update()
+
+    @callback
+    def _async_write_heartbeat(self, _now: datetime) -> None:
+        """Write the last value that was suppressed since the last write."""
+        self._unsub_heartbeat = None
+        status = (self.available, self.assumed_state)
+        value = self.native_value if status[0] else None
+        self._async_written(status, value, monotonic())
+        self.async_write_ha_state()
+
+    @callback
+    def _async_written(self, status: tuple[bool, bool], value: Any, now: float) -> None:
+        """Record a written state, which makes a pending heartbeat write obsolete."""
+        if self._unsub_heartbeat is not None:
+            self._unsub_heartbeat()
+            self._unsub_heartbeat = None
+        self._written_status = status
+        self._deadband.written(value, now)
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Cancel the pending heartbeat write."""
+        if self._unsub_heartbeat is not None:
+            self._unsub_heartbeat()
+            self._unsub_heartbeat = None
+        await super().async_will_remove_from_hass()
 
 
 class ToonP1MeterSensor(ToonSensor):
     """Defines a P1 Meter sensor."""
 
+    _endpoint = ENDPOINT_P1_METER
+
+
+class ToonElectricityMeterDeviceSensor(
+    ToonP1MeterSensor, ToonElectricityMeterDeviceEntity
+):
+    """Defines a Electricity Meter sensor."""
+
+
+class ToonSampledPowerSensor(ToonElectricityMeterDeviceSensor):
+    """Defines a Electricity Meter power sensor published from samples."""
+
     def __init__(
         self,
         coordinator: RootedToonDataUpdateCoordinator,
         entry: ConfigEntry,
         description: ToonSensorEntityDescription,
-        device: Any,
+        device: PowerAggregate,
     ) -> None:
         super().__init__(coordinator, entry, description, device)
+        self.coordinator_context = device_context(device)
 
-        name = f"{entry.data.get(CONF_P1_METER_PREFIX) } {description.name.lower()} { entry.data.get(CONF_P1_METER_SUFFIX)}".strip()
-        self._attr_name = upper_first(name)
-
+    @property
+    def native_value(self) -> float | None:
+        """Return the time-weighted mean power of the publish interval."""
+        return self.device.mean
 
-class ToonElectricityMeterDeviceSensor(
-    ToonP1MeterSensor, ToonElectricityMeterDeviceEntity
-):
-    """Defines a Electricity Meter sensor."""
+    @property
+    def extra_state_attributes(self) -> dict[str, float | int | None]:
+        """Return the minimum and maximum power of the publish interval."""
+        return {
+            "min": self.device.min,
+            "max": self.device.max,
+            "samples": self.device.samples,
+        }
 
 
 class ToonGasMeterDeviceSensor(ToonP1MeterSensor, ToonGasMeterDeviceEntity):
     """Defines a Gas Meter sensor."""
 
 
-class ToonSmartPlugDeviceSensor(ToonSensor, ToonDeviceEntity):
-    """Defines a Smart Plug sensor"""
+@dataclass
+class ToonCostExtraStoredData(ExtraStoredData):
+    """Running cost of a Toon cost sensor, kept across restarts."""
+
+    total: float
+    reading: float | None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a dict representation of the running cost."""
+        return asdict(self)
+
+
+class ToonCostSensor(ToonP1MeterSensor, RestoreEntity):
+    """Defines a sensor adding up the cost of a P1 meter counter."""
 
     def __init__(
         self,
@@ -207,13 +438,117 @@ class ToonSmartPlugDeviceSensor(ToonSensor, ToonDeviceEntity):
     ) -> None:
         super().__init__(coordinator, entry, description, device)
 
-        name = f"{entry.data.get(CONF_P1_METER_PREFIX) } {description.name.lower()} { entry.data.get(CONF_P1_METER_SUFFIX)}"
-        self._attr_name = upper_first(name)
+        off_peak_start = entry.data.get(CONF_OFF_PEAK_START)
+        off_peak_end = entry.data.get(CONF_OFF_PEAK_END)
+        self._price = TimeOfUsePrice(
+            price=entry.data[description.price],
+            off_peak_price=entry.data.get(description.off_peak_price),
+            off_peak_start=dt_util.parse_time(off_peak_start) if off_peak_start else None,
+            off_peak_end=dt_util.parse_time(off_peak_end) if off_peak_end else None,
+        )
+        self._counter = CostCounter()
+
+    async def async_added_to_hass(self) -> None:
+        """Restore the running cost and count from the current reading."""
+        await super().async_added_to_hass()
+        if (data := await self.async_get_last_extra_data()) is not None:
+            restored = data.as_dict()
+            self._counter = CostCounter(restored["total"], restored["reading"])
+        self._async_update_cost()
+
+    @property
+    def extra_restore_state_data(self) -> ToonCostExtraStoredData:
+        """Return the running cost to keep across restarts."""
+        return ToonCostExtraStoredData(self._counter.total, self._counter.reading)
+
+    @callback
+    def _async_update_cost(self) -> None:
+        """Add the cost of the usage since the previous reading."""
+        self._counter.add(
+            self._value(self.device),
+            self._price.price_at(dt_util.now().time()),
+        )
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator."""
+        self._async_update_cost()
+        super()._handle_coordinator_update()
+
+    @property
+    def native_value(self) -> float:
+        """Return the running cost."""
+        return round(self._counter.total, 2)
+
+
+class ToonElectricityCostSensor(ToonCostSensor, ToonElectricityMeterDeviceEntity):
+    """Defines a Electricity Meter cost sensor."""
+
+
+class ToonGasCostSensor(ToonCostSensor, ToonGasMeterDeviceEntity):
+    """Defines a Gas Meter cost sensor."""
+
+
+class ToonSmartPlugDeviceSensor(ToonSensor, ToonDeviceEntity):
+    """Defines a Smart Plug sensor"""
+
+    _endpoint = ENDPOINT_P1_METER
+    _affixes = DEVICE_P1_METER
+
+    async def async_added_to_hass(self) -> None:
+        """Remove the sensor when its smart plug is no longer paired."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass,
+                SIGNAL_SMART_PLUG_REMOVED.format(
+                    self.coordinator.entry.entry_id, self.device.name
+                ),
+                self._async_handle_removed,
+            )
+        )
+
+    @callback
+    def _async_handle_removed(self) -> None:
+        """Remove the sensor of a smart plug that was unpaired."""
+        er.async_get(self.hass).async_remove(self.entity_id)
 
 
 class ToonBoilerDeviceSensor(ToonSensor, ToonBoilerDeviceEntity):
     """Defines a Boiler sensor."""
 
+
+class ToonThermostatDeviceSensor(ToonSensor, ToonThermostatDeviceEntity):
+    """Defines a Thermostat sensor."""
+
+
+class ToonDeviceSensor(ToonSensor, ToonDeviceEntity):
+    """Defines a Toon sensor."""
+
+
+class ToonDiagnosticDeviceSensor(ToonDeviceSensor):
+    """Defines a Toon diagnostic sensor."""
+
+    _endpoint = None
+
+
+class ToonEndpointLatencySensor(ToonDiagnosticDeviceSensor):
+    """Defines a Toon endpoint latency sensor."""
+
+    @property
+    def extra_state_attributes(self) -> dict[str, int]:
+        """Return the latency histogram of the endpoint."""
+        histogram = self.device.latency_histogram
+        attributes = {
+            f"le_{bucket}": count for bucket, count in zip(LATENCY_BUCKETS, histogram)
+        }
+        attributes[f"gt_{LATENCY_BUCKETS[-1]}"] = histogram[-1]
+        return attributes
+
+
+class ToonBackfillSensor(ToonDiagnosticDeviceSensor):
+    """Defines a Toon statistics backfill progress sensor."""
+
     def __init__(
         self,
         coordinator: RootedToonDataUpdateCoordinator,
@@ -222,13 +557,20 @@ class ToonBoilerDeviceSensor(ToonSensor, ToonBoilerDeviceEntity):
         device: Any,
     ) -> None:
         super().__init__(coordinator, entry, description, device)
+        self.coordinator_context = device_context(device)
 
-        name = f"{entry.data.get(CONF_BOILER_PREFIX) } {description.name.lower()} { entry.data.get(CONF_BOILER_SUFFIX)}".strip()
-        self._attr_name = upper_first(name)
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the statistic being imported and the imported hours."""
+        return {
+            "statistic": self.device.statistic,
+            "imported": self.device.imported,
+            "skipped": self.device.skipped,
+        }
 
 
-class ToonThermostatDeviceSensor(ToonSensor, ToonThermostatDeviceEntity):
-    """Defines a Thermostat sensor."""
+class ToonBurnerStatisticsSensor(ToonBoilerDeviceSensor):
+    """Defines a Toon sensor computed from the burst samples of the thermostat."""
 
     def __init__(
         self,
@@ -238,13 +580,20 @@ class ToonThermostatDeviceSensor(ToonSensor, ToonThermostatDeviceEntity):
         device: Any,
     ) -> None:
         super().__init__(coordinator, entry, description, device)
+        self.coordinator_context = device_context(device)
 
-        name = f"{entry.data.get(CONF_THERMOSTAT_PREFIX) } {description.name.lower()} { entry.data.get(CONF_THERMOSTAT_SUFFIX)}".strip()
-        self._attr_name = upper_first(name)
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the burner starts and samples of the last hour."""
+        return {
+            "burner_starts": self.device.burner_starts,
+            "samples": self.device.samples,
+            "bursting": self.device.bursting,
+        }
 
 
-class ToonDeviceSensor(ToonSensor, ToonDeviceEntity):
-    """Defines a Toon sensor."""
+class ToonCircuitBreakerSensor(ToonDiagnosticDeviceSensor):
+    """Defines a Toon connection circuit breaker sensor."""
 
     def __init__(
         self,
@@ -254,9 +603,17 @@ class ToonDeviceSensor(ToonSensor, ToonDeviceEntity):
         device: Any,
     ) -> None:
         super().__init__(coordinator, entry, description, device)
+        self.coordinator_context = device_context(device)
 
-        name = f"{entry.data.get(CONF_THERMOSTAT_PREFIX) } {description.name.lower()} { entry.data.get(CONF_THERMOSTAT_SUFFIX)}".strip()
-        self._attr_name = upper_first(name)
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the failures and trips of the circuit breaker."""
+        return {
+            "consecutive_failures": self.device.failures,
+            "trips": self.device.trips,
+            "rejected": self.device.rejected,
+            "last_change": self.device.last_change,
+        }
 
 
 class ToonThermostatProgramSensor(
@@ -268,13 +625,13 @@ class ToonThermostatProgramSensor(
     def native_value(self) -> str | None:
         """Return the state of the sensor."""
         return STATE_TO_PRESET_MODE_MAPPING.get(
-            getattr(self.device, self.entity_description.key).state
+            self._value(self.device).state
         )
 
     @property
     def extra_state_attributes(self):
         return {
-            "start": getattr(self.device, self.entity_description.key).start_datetime
+            "start": self._value(self.device).start_datetime
         }
 
 
@@ -289,6 +646,12 @@ class ToonSensorRequiredKeysMixin:
 class ToonSensorEntityDescription(SensorEntityDescription, ToonSensorRequiredKeysMixin):
     """Describes Toon sensor entity."""
 
+    endpoint: str | None = None
+    price: str | None = None
+    off_peak_price: str | None = None
+    # Defaults to the deadband of the device class, if it has one.
+    deadband: Deadband | None = None
+
 
 GAS_SENSOR_ENTITIES: tuple[ToonSensorEntityDescription, ...] = (
     ToonSensorEntityDescription(
@@ -307,6 +670,35 @@ GAS_SENSOR_ENTITIES: tuple[ToonSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.GAS,
         cls=ToonGasMeterDeviceSensor,
     ),
+    ToonSensorEntityDescription(
+        key="total",
+        name="Gas cost",
+        native_unit_of_measurement=CURRENCY_EUR,
+        state_class=SensorStateClass.TOTAL,
+        device_class=SensorDeviceClass.MONETARY,
+        cls=ToonGasCostSensor,
+        price=CONF_PRICE_GAS,
+        off_peak_price=CONF_OFF_PEAK_PRICE_GAS,
+    ),
+)
+
+GAS_FLOW_SENSOR_ENTITIES: tuple[ToonSensorEntityDescription, ...] = (
+    ToonSensorEntityDescription(
+        key="flow_per_minute",
+        name="Gas flow rate",
+        native_unit_of_measurement=VOLUME_LMIN,
+        icon="mdi:fire",
+        state_class=SensorStateClass.MEASUREMENT,
+        cls=ToonGasMeterDeviceSensor,
+    ),
+    ToonSensorEntityDescription(
+        key="flow_per_hour",
+        name="Gas flow rate per hour",
+        native_unit_of_measurement=VOLUME_LHOUR,
+        icon="mdi:fire",
+        state_class=SensorStateClass.MEASUREMENT,
+        cls=ToonGasMeterDeviceSensor,
+    ),
 )
 
 ELECTRICITY_SENSOR_ENTITIES: tuple[ToonSensorEntityDescription, ...] = (
@@ -420,6 +812,49 @@ ELECTRICITY_SENSOR_ENTITIES: tuple[ToonSensorEntityDescription, ...] = (
     ),
 )
 
+ELECTRICITY_COST_SENSOR_ENTITIES: tuple[ToonSensorEntityDescription, ...] = (
+    ToonSensorEntityDescription(
+        key="electricity_delivered_high",
+        name="Electricity delivered high cost",
+        native_unit_of_measurement=CURRENCY_EUR,
+        state_class=SensorStateClass.TOTAL,
+        device_class=SensorDeviceClass.MONETARY,
+        cls=ToonElectricityCostSensor,
+        price=CONF_PRICE_ELECTRICITY_DELIVERED_HIGH,
+        off_peak_price=CONF_OFF_PEAK_PRICE_ELECTRICITY_DELIVERED_HIGH,
+    ),
+    ToonSensorEntityDescription(
+        key="electricity_delivered_low",
+        name="Electricity delivered low cost",
+        native_unit_of_measurement=CURRENCY_EUR,
+        state_class=SensorStateClass.TOTAL,
+        device_class=SensorDeviceClass.MONETARY,
+        cls=ToonElectricityCostSensor,
+        price=CONF_PRICE_ELECTRICITY_DELIVERED_LOW,
+        off_peak_price=CONF_OFF_PEAK_PRICE_ELECTRICITY_DELIVERED_LOW,
+    ),
+    ToonSensorEntityDescription(
+        key="electricity_returned_high",
+        name="Electricity returned high compensation",
+        native_unit_of_measurement=CURRENCY_EUR,
+        state_class=SensorStateClass.TOTAL,
+        device_class=SensorDeviceClass.MONETARY,
+        cls=ToonElectricityCostSensor,
+        price=CONF_PRICE_ELECTRICITY_RETURNED_HIGH,
+        off_peak_price=CONF_OFF_PEAK_PRICE_ELECTRICITY_RETURNED_HIGH,
+    ),
+    ToonSensorEntityDescription(
+        key="electricity_returned_low",
+        name="Electricity returned low compensation",
+        native_unit_of_measurement=CURRENCY_EUR,
+        state_class=SensorStateClass.TOTAL,
+        device_class=SensorDeviceClass.MONETARY,
+        cls=ToonElectricityCostSensor,
+        price=CONF_PRICE_ELECTRICITY_RETURNED_LOW,
+        off_peak_price=CONF_OFF_PEAK_PRICE_ELECTRICITY_RETURNED_LOW,
+    ),
+)
+
 THERMOSTAT_SENSOR_ENTITIES: tuple[ToonSensorEntityDescription, ...] = (
     ToonSensorEntityDescription(
         key="current_modulation_level",
@@ -428,6 +863,7 @@ THERMOSTAT_SENSOR_ENTITIES: tuple[ToonSensorEntityDescription, ...] = (
         native_unit_of_measurement=PERCENTAGE,
         icon="mdi:percent",
         state_class=SensorStateClass.MEASUREMENT,
+        deadband=Deadband(absolute=1.0),
         cls=ToonBoilerDeviceSensor,
     ),
     ToonSensorEntityDescription(
@@ -467,5 +903,188 @@ BOILER_SENSOR_ENTITIES: tuple[ToonSensorEntityDescription, ...] = (
         device_class=SensorDeviceClass.PRESSURE,
         state_class=SensorStateClass.MEASUREMENT,
         cls=ToonBoilerDeviceSensor,
+        endpoint=ENDPOINT_BOILER,
+    ),
+)
+
+ENDPOINT_SENSOR_ENTITIES: tuple[ToonSensorEntityDescription, ...] = (
+    ToonSensorEntityDescription(
+        key="interval",
+        name="Poll interval",
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        cls=ToonDiagnosticDeviceSensor,
+    ),
+    ToonSensorEntityDescription(
+        key="start_delay",
+        name="Request start delay",
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        cls=ToonDiagnosticDeviceSensor,
+    ),
+    ToonSensorEntityDescription(
+        key="request_latency",
+        name="Request latency",
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        cls=ToonEndpointLatencySensor,
+    ),
+    ToonSensorEntityDescription(
+        key="parse_time",
+        name="Parse time",
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        cls=ToonDiagnosticDeviceSensor,
+    ),
+    ToonSensorEntityDescription(
+        key="response_size",
+        name="Response size",
+        native_unit_of_measurement=UnitOfInformation.BYTES,
+        device_class=SensorDeviceClass.DATA_SIZE,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        cls=ToonDiagnosticDeviceSensor,
+    ),
+    ToonSensorEntityDescription(
+        key="successes",
+        name="Successful requests",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        cls=ToonDiagnosticDeviceSensor,
+    ),
+    ToonSensorEntityDescription(
+        key="total_failures",
+        name="Failed requests",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        cls=ToonDiagnosticDeviceSensor,
+    ),
+    ToonSensorEntityDescription(
+        key="unchanged",
+        name="Unchanged responses",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        cls=ToonDiagnosticDeviceSensor,
+    ),
+    ToonSensorEntityDescription(
+        key="last_success_time",
+        name="Last good sample",
+        device_class=SensorDeviceClass.TIMESTAMP,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        cls=ToonDiagnosticDeviceSensor,
+    ),
+)
+
+RATE_LIMITER_SENSOR_ENTITIES: tuple[ToonSensorEntityDescription, ...] = (
+    ToonSensorEntityDescription(
+        key="average_delay",
+        name="Request queueing delay",
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        cls=ToonDiagnosticDeviceSensor,
+    ),
+    ToonSensorEntityDescription(
+        key="max_delay",
+        name="Request maximum queueing delay",
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        cls=ToonDiagnosticDeviceSensor,
+    ),
+    ToonSensorEntityDescription(
+        key="queued",
+        name="Requests queued",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        cls=ToonDiagnosticDeviceSensor,
+    ),
+)
+
+BURST_SENSOR_ENTITIES: tuple[ToonSensorEntityDescription, ...] = (
+    ToonSensorEntityDescription(
+        key="modulation",
+        name="Boiler average modulation level",
+        native_unit_of_measurement=PERCENTAGE,
+        icon="mdi:percent",
+        state_class=SensorStateClass.MEASUREMENT,
+        deadband=Deadband(absolute=1.0),
+        cls=ToonBurnerStatisticsSensor,
+    ),
+    ToonSensorEntityDescription(
+        key="duty_cycle",
+        name="Boiler burner duty cycle",
+        native_unit_of_measurement=PERCENTAGE,
+        icon="mdi:fire-circle",
+        state_class=SensorStateClass.MEASUREMENT,
+        deadband=Deadband(absolute=1.0),
+        cls=ToonBurnerStatisticsSensor,
+    ),
+)
+
+BREAKER_SENSOR_ENTITIES: tuple[ToonSensorEntityDescription, ...] = (
+    ToonSensorEntityDescription(
+        key="state",
+        name="Connection",
+        icon="mdi:connection",
+        device_class=SensorDeviceClass.ENUM,
+        options=[STATE_CLOSED, STATE_HALF_OPEN, STATE_OPEN],
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        cls=ToonCircuitBreakerSensor,
+    ),
+)
+
+DEADBAND_SENSOR_ENTITIES: tuple[ToonSensorEntityDescription, ...] = (
+    ToonSensorEntityDescription(
+        key="suppressed",
+        name="Suppressed state writes",
+        icon="mdi:filter-outline",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        cls=ToonDiagnosticDeviceSensor,
+    ),
+    ToonSensorEntityDescription(
+        key="written",
+        name="Filtered state writes",
+        icon="mdi:filter-check-outline",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        cls=ToonDiagnosticDeviceSensor,
+    ),
+)
+
+BACKFILL_SENSOR_ENTITIES: tuple[ToonSensorEntityDescription, ...] = (
+    ToonSensorEntityDescription(
+        key="progress",
+        name="Statistics backfill",
+        icon="mdi:database-import",
+        native_unit_of_measurement=PERCENTAGE,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        cls=ToonBackfillSensor,
     ),
 )
@@ -1,3 +1,61 @@
+from __future__ import annotations
+
+from datetime import date, datetime, time
+from typing import Any
+
+SNAPSHOT_SCALARS = (str, int, float, bool, type(None), date, datetime, time)
+
+
 def upper_first(text: str):
     text = text.strip()
     return text[0].upper() + text[1:]
+
+
+def device_context(device: Any, key: str | None = None) -> tuple[int, str | None]:
+    """Return the coordinator listener context of a device attribute."""
+    return (id(device), key)
+
+
+def _signature(value: Any) -> Any:
+    """Return a comparable signature of a (nested) device attribute value."""
+    if isinstance(value, SNAPSHOT_SCALARS):
+        return value
+    if isinstance(value, (list, tuple)):
+        return tuple(_signature(item) for item in value)
+    return tuple(
+        (attr, item)
+        for attr, item in getattr(value, "__dict__", {}).items()
+        if isinstance(item, SNAPSHOT_SCALARS)
+    )
+
+
+def device_snapshot(*devices: Any) -> dict[tuple[int, str | None], Any]:
+    """Return a flat field-level snapshot of Toon devices trees."""
+    snapshot: dict[tuple[int, str | None], Any] = {}
+    seen: set[int] = set()
+    stack = list(devices)
+    while stack:
+        device = stack.pop()
+        if id(device) in seen:
+            continue
+        seen.add(id(device))
+
+        for attr, value in getattr(device, "__dict__", {}).items():
+            snapshot[device_context(device, attr)] = _signature(value)
+            if isinstance(value, (list, tuple)):
+                stack.extend(item for item in value if hasattr(item, "__dict__"))
+            elif hasattr(value, "__dict__"):
+                stack.append(value)
+
+    return snapshot
+
+
+def changed_contexts(
+    old: dict[tuple[int, str | None], Any], new: dict[tuple[int, str | None], Any]
+) -> set[tuple[int, str | None]]:
+    """Return the listener contexts of all attributes that differ between snapshots."""
+    changed = {key for key, value in new.items() if key not in old or old[key] != value}
+    changed.update(old.keys() - new.keys())
+    # Entities that depend on a device as a whole listen on the device context.
+    changed.update({(key[0], None) for key in changed})
+    return changed
@@ -0,0 +1 @@
+"""Tests for the Rooted Toon integration."""
@@ -0,0 +1,95 @@
+"""Tests for the circuit breaker around the connection with a Toon."""
+from custom_components.rootedtoon.breaker import (
+    BREAKER_MAX_RESET_TIMEOUT,
+    STATE_CLOSED,
+    STATE_HALF_OPEN,
+    STATE_OPEN,
+    CircuitBreaker,
+)
+
+
+def _open_breaker() -> CircuitBreaker:
+    """Return a breaker opened at 0 by failures of two endpoints."""
+    breaker = CircuitBreaker(threshold=3, reset_timeout=30)
+    for source in ("thermostat", "boiler", "thermostat"):
+        breaker.record_failure(0.0, source)
+    assert breaker.state == STATE_OPEN
+    return breaker
+
+
+def test_failures_below_the_threshold_keep_it_closed() -> None:
+    """Test that a few failures do not open the breaker."""
+    breaker = CircuitBreaker(threshold=3)
+    breaker.record_failure(0.0, "thermostat")
+    breaker.record_failure(0.0, "boiler")
+
+    assert breaker.closed
+    assert breaker.allow(0.0)
+
+
+def test_failures_of_a_single_source_keep_it_closed() -> None:
+    """Test that a single failing endpoint does not open the breaker."""
+    breaker = CircuitBreaker(threshold=3)
+    for _ in range(10):
+        breaker.record_failure(0.0, "p1_meter")
+
+    assert breaker.closed
+    assert breaker.trips == 0
+
+
+def test_success_resets_the_failures() -> None:
+    """Test that only failures in a row open the breaker."""
+    breaker = CircuitBreaker(threshold=3)
+    breaker.record_failure(0.0, "thermostat")
+    breaker.record_failure(0.0, "boiler")
+    assert not breaker.record_success()
+    breaker.record_failure(0.0, "thermostat")
+
+    assert breaker.closed
+
+
+def test_open_breaker_rejects_requests() -> None:
+    """Test that an open breaker fails fast until it may be probed."""
+    breaker = _open_breaker()
+
+    assert breaker.trips == 1
+    assert breaker.probe_at == 30
+    assert not breaker.allow(10.0)
+    assert not breaker.allow(40.0)
+    assert breaker.rejected == 2
+
+
+def test_probe_half_opens_and_success_closes() -> None:
+    """Test that a successful probe closes the breaker."""
+    breaker = _open_breaker()
+
+    assert not breaker.allow(10.0, probe=True)
+    assert breaker.allow(30.0, probe=True)
+    assert breaker.state == STATE_HALF_OPEN
+    assert not breaker.allow(31.0)
+    assert breaker.record_success()
+    assert breaker.state == STATE_CLOSED
+    assert breaker.allow(31.0)
+
+
+def test_failed_probe_waits_longer() -> None:
+    """Test that the wait for the next probe doubles up to its maximum."""
+    breaker = _open_breaker()
+
+    probe = 30.0
+    for timeout in (60.0, 120.0, 240.0, BREAKER_MAX_RESET_TIMEOUT):
+        assert breaker.allow(probe, probe=True)
+        breaker.record_failure(probe, "thermostat")
+        assert breaker.state == STATE_OPEN
+        assert breaker.probe_at == probe + timeout
+        probe = breaker.probe_at
+    assert breaker.trips == 1
+
+
+def test_lost_probe_is_replaced() -> None:
+    """Test that a probe that never reported back is followed by a new one."""
+    breaker = _open_breaker()
+
+    assert breaker.allow(30.0, probe=True)
+    assert not breaker.allow(40.0, probe=True)
+    assert breaker.allow(60.0, probe=True)
@@ -0,0 +1,145 @@
+"""Tests for the queue of the commands sent to the thermostat of a Toon."""
+import asyncio
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+from rootedtoonapi import ToonError
+
+from custom_components.rootedtoon import commands
+from custom_components.rootedtoon.commands import (
+    COMMAND_ACTIVE_STATE,
+    COMMAND_HVAC_MODE,
+    COMMAND_SETPOINT,
+    ToonCommand,
+    ToonCommandQueue,
+)
+
+
+class _Thermostat:
+    """Stand-in for the thermostat, failing the first sends as told."""
+
+    def __init__(self, failures: int = 0, error: Exception | None = None) -> None:
+        """Initialize the thermostat."""
+        self.failures = failures
+        self.error = error or ToonError("Timeout")
+        self.sent: list[tuple[str, tuple[Any, ...]]] = []
+        self.confirmed = 0
+
+    async def send(self, command: ToonCommand) -> None:
+        """Send a command, or fail."""
+        if self.failures:
+            self.failures -= 1
+            raise self.error
+        self.sent.append((command.kind, command.args))
+
+    async def confirm(self) -> None:
+        """Count the confirmations."""
+        self.confirmed += 1
+
+
+async def _noop(*_args: Any) -> None:
+    """Do nothing."""
+
+
+def _run(queue: ToonCommandQueue) -> None:
+    """Send the queued commands until the queue is empty."""
+
+    async def run() -> None:
+        queue.start(asyncio.get_running_loop().create_task)
+        await asyncio.wait_for(queue._task, 1)
+
+    asyncio.run(run())
+
+
+@pytest.fixture(autouse=True)
+def _fast_retries(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Retry failed commands without waiting."""
+    monkeypatch.setattr(commands, "COMMAND_RETRY_BASE", 0.001)
+
+
+def test_commands_are_sent_in_priority_order() -> None:
+    """Test that the program goes before the preset and the setpoint."""
+    thermostat = _Thermostat()
+    queue = ToonCommandQueue(thermostat.send, thermostat.confirm)
+    queue.enqueue(COMMAND_SETPOINT, _noop, 21.0, overlay={"current_setpoint": 21.0})
+    queue.enqueue(COMMAND_ACTIVE_STATE, _noop, 0, overlay={"active_state": 0})
+    queue.enqueue(COMMAND_HVAC_MODE, _noop, 1, overlay={"program": True})
+
+    _run(queue)
+
+    assert [kind for kind, _ in thermostat.sent] == [
+        COMMAND_HVAC_MODE,
+        COMMAND_ACTIVE_STATE,
+        COMMAND_SETPOINT,
+    ]
+    assert thermostat.confirmed == 1
+    assert queue.sent == 3
+    assert queue.pending == []
+
+
+def test_newer_command_supersedes_a_queued_one() -> None:
+    """Test that only the last setpoint is sent."""
+    thermostat = _Thermostat()
+    queue = ToonCommandQueue(thermostat.send, thermostat.confirm)
+    queue.enqueue(COMMAND_SETPOINT, _noop, 20.0, overlay={"current_setpoint": 20.0})
+    queue.enqueue(COMMAND_SETPOINT, _noop, 20.5, overlay={"current_setpoint": 20.5})
+
+    _run(queue)
+
+    assert thermostat.sent == [(COMMAND_SETPOINT, (20.5,))]
+    assert queue.superseded == 1
+
+
+def test_pending_commands_overlay_the_thermostat() -> None:
+    """Test that a poll shows the values of the commands still on their way."""
+    queue = ToonCommandQueue(_noop, _noop)
+    queue.enqueue(COMMAND_SETPOINT, _noop, 19.0, overlay={"current_setpoint": 19.0})
+    queue.enqueue(COMMAND_HVAC_MODE, _noop, 1, overlay={"program": True})
+    thermostat = SimpleNamespace(current_setpoint=21.0, program=False)
+
+    queue.apply_pending(thermostat)
+
+    assert (thermostat.current_setpoint, thermostat.program) == (19.0, True)
+    assert not hasattr(thermostat, "active_state")
+
+
+def test_failed_command_is_retried() -> None:
+    """Test that a command is sent again after a failure."""
+    thermostat = _Thermostat(failures=2)
+    queue = ToonCommandQueue(thermostat.send, thermostat.confirm)
+    queue.enqueue(COMMAND_SETPOINT, _noop, 21.0, overlay={"current_setpoint": 21.0})
+
+    _run(queue)
+
+    assert thermostat.sent == [(COMMAND_SETPOINT, (21.0,))]
+    assert queue.retries == 2
+    assert queue.failed == 0
+    assert queue.last_error == "Timeout"
+
+
+def test_command_is_dropped_after_its_deadline() -> None:
+    """Test that a command that keeps failing is given up."""
+    thermostat = _Thermostat(failures=10)
+    queue = ToonCommandQueue(thermostat.send, thermostat.confirm, deadline=0.0)
+    queue.enqueue(COMMAND_SETPOINT, _noop, 21.0, overlay={"current_setpoint": 21.0})
+
+    _run(queue)
+
+    assert thermostat.sent == []
+    assert queue.failed == 1
+    assert queue.pending == []
+    assert thermostat.confirmed == 1
+
+
+def test_unexpected_error_drops_the_command() -> None:
+    """Test that an error a retry will not fix is not retried."""
+    thermostat = _Thermostat(failures=1, error=ValueError("Invalid setpoint"))
+    queue = ToonCommandQueue(thermostat.send, thermostat.confirm)
+    queue.enqueue(COMMAND_SETPOINT, _noop, 99.0, overlay={"current_setpoint": 99.0})
+
+    _run(queue)
+
+    assert thermostat.sent == []
+    assert (queue.failed, queue.retries) == (1, 0)
+    assert queue.last_error == "Invalid setpoint"
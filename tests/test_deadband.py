@@ -0,0 +1,79 @@
+"""Tests for the deadband of the Toon sensors."""
+import pytest
+
+from custom_components.rootedtoon.deadband import (
+    Deadband,
+    DeadbandCounters,
+    DeadbandFilter,
+)
+
+
+def _filter(deadband: Deadband, last: float) -> DeadbandFilter:
+    """Return a filter that has written a value."""
+    band = DeadbandFilter(deadband, DeadbandCounters())
+    band.written(last, 0.0)
+    return band
+
+
+@pytest.mark.parametrize(
+    ("last", "value"),
+    [(20.1, 20.2), (20.2, 20.1), (21.0, 21.1), (19.9, 20.0), (20.0, 19.9)],
+)
+def test_step_of_the_band_is_written(last: float, value: float) -> None:
+    """Test that a step of exactly 0.1 °C is written, whatever the rounding."""
+    assert _filter(Deadband(absolute=0.1), last).should_write(value, 1.0)
+
+
+@pytest.mark.parametrize(("last", "value"), [(1.6, 1.65), (1.65, 1.6), (1.5, 1.55)])
+def test_step_of_the_pressure_band_is_written(last: float, value: float) -> None:
+    """Test that a step of exactly 0.05 bar is written."""
+    assert _filter(Deadband(absolute=0.05), last).should_write(value, 1.0)
+
+
+@pytest.mark.parametrize(("last", "value"), [(20.1, 20.15), (20.2, 20.11)])
+def test_change_within_the_band_is_suppressed(last: float, value: float) -> None:
+    """Test that a change smaller than the band is not written."""
+    assert not _filter(Deadband(absolute=0.1), last).should_write(value, 1.0)
+
+
+def test_relative_band() -> None:
+    """Test that the relative band applies above the absolute band."""
+    band = _filter(Deadband(absolute=5.0, relative=0.02), 1000.0)
+    assert not band.should_write(1019.0, 1.0)
+    assert band.should_write(1020.0, 1.0)
+
+    band = _filter(Deadband(absolute=5.0, relative=0.02), 100.0)
+    assert not band.should_write(104.0, 1.0)
+    assert band.should_write(105.0, 1.0)
+
+
+def test_heartbeat() -> None:
+    """Test that an in-band value is written once the heartbeat has passed."""
+    band = _filter(Deadband(absolute=0.1, heartbeat=300.0), 20.0)
+    assert not band.should_write(20.05, 299.0)
+    assert band.heartbeat_in(299.0) == pytest.approx(1.0)
+    assert band.should_write(20.05, 300.0)
+
+
+def test_non_numeric_and_reset() -> None:
+    """Test that non-numeric values and the value after a reset are written."""
+    band = _filter(Deadband(absolute=0.1), 20.0)
+    assert band.should_write(None, 1.0)
+    assert band.should_write("on", 1.0)
+    assert not band.should_write(20.0, 1.0)
+    band.reset()
+    assert band.should_write(20.0, 1.0)
+
+
+def test_counters() -> None:
+    """Test that written and suppressed values are counted."""
+    counters = DeadbandCounters()
+    band = DeadbandFilter(Deadband(absolute=0.1), counters)
+    band.written(20.0, 0.0)
+    band.suppressed("sensor.temperature")
+    band.suppressed("sensor.temperature")
+    band.suppressed(None)
+
+    assert counters.written == 1
+    assert counters.suppressed == 3
+    assert counters.per_entity == {"sensor.temperature": 2}
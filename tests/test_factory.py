@@ -0,0 +1,36 @@
+"""Tests for the precomputed attributes of the Toon entities."""
+from types import SimpleNamespace
+
+from homeassistant.const import CONF_NAME, Platform
+
+from custom_components.rootedtoon.const import (
+    CONF_P1_METER_PREFIX,
+    CONF_P1_METER_SUFFIX,
+    DEVICE_P1_METER,
+)
+from custom_components.rootedtoon.factory import ToonEntityFactory
+
+
+def test_smart_plug_names_are_unchanged() -> None:
+    """Test that smart plug sensors keep the name and unique ID they always had."""
+    factory = ToonEntityFactory(
+        {CONF_NAME: "Toon", CONF_P1_METER_PREFIX: "Meter", CONF_P1_METER_SUFFIX: ""}
+    )
+    description = SimpleNamespace(key="power", name="Living Room power")
+
+    spec = factory.spec(Platform.SENSOR, DEVICE_P1_METER, description)
+
+    # As set by ToonSmartPlugDeviceSensor before the factory existed.
+    assert spec.name == "Meter living room power"
+    assert spec.unique_id == "rootedtoon_Toon_sensor_LivingRoompower_power"
+    assert spec.value(SimpleNamespace(power=12.5)) == 12.5
+
+
+def test_specs_are_shared() -> None:
+    """Test that the spec of a description is computed once per config entry."""
+    factory = ToonEntityFactory({CONF_NAME: "Toon"})
+    description = SimpleNamespace(key="total", name="Gas total")
+
+    assert factory.spec(Platform.SENSOR, DEVICE_P1_METER, description) is (
+        factory.spec(Platform.SENSOR, DEVICE_P1_METER, description)
+    )
@@ -0,0 +1,97 @@
+"""Tests for the phase-offset polling of multiple Toons."""
+from time import monotonic
+
+from custom_components.rootedtoon.breaker import CircuitBreaker
+from custom_components.rootedtoon.orchestrator import PollingOrchestrator
+from custom_components.rootedtoon.scheduler import DeadlineScheduler, ToonEndpoint
+
+
+async def _update() -> None:
+    """Do nothing."""
+
+
+class _Coordinator:
+    """Stand-in for the coordinator of a single Toon."""
+
+    def __init__(self, interval: float) -> None:
+        """Initialize a Toon with a single endpoint."""
+        self.endpoint = ToonEndpoint("thermostat", interval, _update)
+        self.endpoints = {"thermostat": self.endpoint}
+        self.scheduler = DeadlineScheduler(self.endpoints.values(), monotonic())
+        self.breaker = CircuitBreaker()
+        self.reschedules = 0
+
+    def async_reschedule(self) -> None:
+        """Count the reschedules."""
+        self.reschedules += 1
+
+
+def _offset(first: _Coordinator, second: _Coordinator, interval: float) -> float:
+    """Return the offset between the deadlines of two Toons within an interval."""
+    return (second.endpoint.next_due - first.endpoint.next_due) % interval
+
+
+def test_register_spreads_the_phases() -> None:
+    """Test that the endpoints of two Toons get opposite phases."""
+    orchestrator = PollingOrchestrator(4)
+    first, second = _Coordinator(30), _Coordinator(30)
+    orchestrator.async_register(first)
+    orchestrator.async_register(second)
+
+    assert (first.endpoint.phase, second.endpoint.phase) == (0, 15)
+    assert abs(_offset(first, second, 30) - 15) < 1e-6
+    assert first.reschedules == 2 and second.reschedules == 1
+
+
+def test_interval_change_spreads_the_new_interval() -> None:
+    """Test that an endpoint joining the interval of another gets its own phase."""
+    orchestrator = PollingOrchestrator(4)
+    first, second = _Coordinator(30), _Coordinator(60)
+    orchestrator.async_register(first)
+    orchestrator.async_register(second)
+
+    orchestrator.async_set_interval(first, first.endpoint, 60)
+
+    assert first.endpoint.interval == 60
+    assert {first.endpoint.phase, second.endpoint.phase} == {0, 30}
+    assert abs(_offset(first, second, 60) - 30) < 1e-6
+    assert first.endpoint.next_due >= monotonic() - 1
+
+
+def test_interval_change_keeps_the_cadence_of_a_lone_endpoint() -> None:
+    """Test that an endpoint with an interval of its own keeps its last deadline."""
+    orchestrator = PollingOrchestrator(4)
+    toon = _Coordinator(30)
+    orchestrator.async_register(toon)
+    due = toon.endpoint.next_due
+
+    orchestrator.async_set_interval(toon, toon.endpoint, 29)
+
+    assert toon.endpoint.next_due == due - 1
+
+
+def test_unchanged_interval_does_not_rebalance() -> None:
+    """Test that setting the same interval does not move any deadline."""
+    orchestrator = PollingOrchestrator(4)
+    first, second = _Coordinator(30), _Coordinator(30)
+    orchestrator.async_register(first)
+    orchestrator.async_register(second)
+    reschedules = first.reschedules
+
+    orchestrator.async_set_interval(first, first.endpoint, 30)
+
+    assert first.reschedules == reschedules
+
+
+def test_failing_endpoint_keeps_its_backoff() -> None:
+    """Test that a rebalance does not move the retry of a failing endpoint."""
+    orchestrator = PollingOrchestrator(4)
+    first, second = _Coordinator(30), _Coordinator(30)
+    orchestrator.async_register(first)
+    second.endpoint.failures = 1
+    second.scheduler.schedule(second.endpoint, monotonic() + 600)
+    due = second.endpoint.next_due
+
+    orchestrator.async_register(second)
+
+    assert second.endpoint.next_due == due
@@ -0,0 +1,88 @@
+"""Tests for the rate limiting of the requests sent to a Toon."""
+import asyncio
+
+import pytest
+
+from custom_components.rootedtoon.ratelimit import (
+    PRIORITY_POLL,
+    PRIORITY_WRITE,
+    TokenBucketRateLimiter,
+)
+
+
+def test_rate_must_be_positive() -> None:
+    """Test that a rate limit of zero is rejected."""
+    with pytest.raises(ValueError):
+        TokenBucketRateLimiter(0)
+
+
+def test_burst_is_not_delayed() -> None:
+    """Test that the requests of a burst are sent right away."""
+
+    async def run() -> TokenBucketRateLimiter:
+        limiter = TokenBucketRateLimiter(1, burst=2)
+        await asyncio.wait_for(
+            asyncio.gather(limiter.acquire(), limiter.acquire()), 0.1
+        )
+        return limiter
+
+    limiter = asyncio.run(run())
+    assert limiter.requests == 2
+    assert limiter.queued == 0
+
+
+def test_requests_after_the_burst_wait_for_a_token() -> None:
+    """Test that a request after the burst waits for the next token."""
+
+    async def run() -> tuple[float, TokenBucketRateLimiter]:
+        limiter = TokenBucketRateLimiter(20, burst=1)
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        await limiter.acquire()
+        await limiter.acquire()
+        return loop.time() - start, limiter
+
+    elapsed, limiter = asyncio.run(run())
+    assert elapsed >= 0.04
+    assert limiter.queued == 1
+    assert limiter.max_delay >= 0.04
+    assert limiter.average_delay == limiter.max_delay
+
+
+def test_writes_go_before_queued_polls() -> None:
+    """Test that a write queued after polls gets the next token first."""
+
+    async def run() -> list[str]:
+        limiter = TokenBucketRateLimiter(50, burst=1)
+        await limiter.acquire()
+        order: list[str] = []
+
+        async def request(name: str, priority: int) -> None:
+            await limiter.acquire(priority)
+            order.append(name)
+
+        await asyncio.gather(
+            request("poll 1", PRIORITY_POLL),
+            request("poll 2", PRIORITY_POLL),
+            request("write", PRIORITY_WRITE),
+        )
+        return order
+
+    assert asyncio.run(run()) == ["write", "poll 1", "poll 2"]
+
+
+def test_cancelled_request_gives_up_its_turn() -> None:
+    """Test that a cancelled waiting request does not take a token."""
+
+    async def run() -> TokenBucketRateLimiter:
+        limiter = TokenBucketRateLimiter(50, burst=1)
+        await limiter.acquire()
+        cancelled = asyncio.ensure_future(limiter.acquire())
+        waiting = asyncio.ensure_future(limiter.acquire())
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        await asyncio.wait_for(waiting, 0.1)
+        return limiter
+
+    limiter = asyncio.run(run())
+    assert limiter.queued == 1
@@ -0,0 +1,109 @@
+"""Tests for the deadline scheduler of the Toon endpoints."""
+from custom_components.rootedtoon.scheduler import (
+    MAX_RETRY_BACKOFF,
+    DeadlineScheduler,
+    ToonEndpoint,
+)
+
+
+async def _update() -> None:
+    """Do nothing."""
+
+
+def _scheduler(*intervals: float) -> tuple[DeadlineScheduler, list[ToonEndpoint]]:
+    """Return a scheduler with an endpoint per interval, all due at 0."""
+    endpoints = [
+        ToonEndpoint(f"endpoint_{index}", interval, _update)
+        for index, interval in enumerate(intervals)
+    ]
+    return DeadlineScheduler(endpoints, 0.0), endpoints
+
+
+def test_due_endpoints_are_rescheduled_on_their_cadence() -> None:
+    """Test that a due endpoint is popped and due again one interval later."""
+    scheduler, (fast, slow) = _scheduler(10, 30)
+
+    assert scheduler.pop_due(0.0) == [fast, slow]
+    assert (fast.next_due, slow.next_due) == (10, 30)
+    assert scheduler.pop_due(5.0) == []
+    assert scheduler.pop_due(10.2) == [fast]
+    assert fast.next_due == 20
+    assert scheduler.delay(10.2) == 20 - 10.2
+
+
+def test_missed_slots_are_skipped() -> None:
+    """Test that a late endpoint keeps its cadence instead of catching up."""
+    scheduler, (endpoint,) = _scheduler(10)
+    scheduler.pop_due(0.0)
+
+    assert scheduler.pop_due(35.0) == [endpoint]
+    assert endpoint.next_due == 40
+    assert endpoint.lateness == 25
+    assert endpoint.max_lateness == 25
+    assert scheduler.pop_due(35.0) == []
+
+
+def test_wakeup_slightly_early_pops_the_endpoint() -> None:
+    """Test that a wakeup within the tolerance before the deadline counts."""
+    scheduler, (endpoint,) = _scheduler(10)
+    scheduler.pop_due(0.0)
+
+    assert scheduler.pop_due(9.5) == [endpoint]
+    assert endpoint.next_due == 20
+
+
+def test_superseded_deadline_is_ignored() -> None:
+    """Test that only the last scheduled deadline of an endpoint counts."""
+    scheduler, (endpoint,) = _scheduler(10)
+    scheduler.pop_due(0.0)
+    scheduler.schedule(endpoint, 50.0)
+
+    assert scheduler.pop_due(15.0) == []
+    assert scheduler.delay(15.0) == 35.0
+    assert scheduler.pop_due(50.0) == [endpoint]
+
+
+def test_set_interval_keeps_the_last_deadline() -> None:
+    """Test that a new interval counts from the last deadline."""
+    scheduler, (endpoint,) = _scheduler(10)
+    scheduler.pop_due(0.0)
+
+    scheduler.set_interval(endpoint, 30)
+
+    assert endpoint.interval == 30
+    assert endpoint.next_due == 30
+    assert scheduler.pop_due(10.0) == []
+
+
+def test_backoff_doubles_and_is_capped() -> None:
+    """Test the exponential retry backoff of a failing endpoint."""
+    scheduler, (endpoint,) = _scheduler(10)
+
+    endpoint.failures = 1
+    assert scheduler.backoff(endpoint, 100.0) == 20
+    assert endpoint.next_due == 120
+    endpoint.failures = 3
+    assert scheduler.backoff(endpoint, 100.0) == 80
+    endpoint.failures = 20
+    assert scheduler.backoff(endpoint, 100.0) == MAX_RETRY_BACKOFF
+
+
+def test_backoff_is_never_shorter_than_the_interval() -> None:
+    """Test that a slow endpoint is not retried faster than it is polled."""
+    scheduler, (endpoint,) = _scheduler(3600)
+    endpoint.failures = 1
+
+    assert scheduler.backoff(endpoint, 0.0) == 3600
+
+
+def test_unchanged_content_keeps_the_revision() -> None:
+    """Test that only a response with a new hash bumps the revision."""
+    endpoint = ToonEndpoint("program", 10, _update)
+
+    endpoint.record_content("a")
+    endpoint.record_content("a")
+    assert (endpoint.revision, endpoint.unchanged) == (1, 1)
+    endpoint.record_content("b")
+    endpoint.record_content(None)
+    endpoint.record_content(None)
+    assert (endpoint.revision, endpoint.unchanged) == (4, 1)